@@ -0,0 +1,87 @@
+"""
+Shared helpers for the league audit and maintenance scripts
+===========================================================
+
+The scripts in the repository root run with only requests and PyYAML
+installed, so they share these helpers instead of importing penaltyblog.
+"""
+
+import os
+import shutil
+import socket
+import threading
+import time
+from pathlib import Path
+
+import yaml
+
+# Prefer the libyaml-backed C loader/dumper when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+def install_dns_cache(ttl=300, maxsize=256):
+    """
+    Cache successful socket.getaddrinfo lookups for `ttl` seconds.
+
+    Leagues share hosts, and retries, redirects and HEAD fallbacks would
+    otherwise look the same name up again. This patches the socket module
+    for the whole process, so scripts call it from main() rather than at
+    import. Failed lookups raise and are not cached; once `maxsize` entries
+    are held, expired entries are dropped first, then the oldest.
+    """
+    if getattr(socket.getaddrinfo, '_audit_dns_cache', False):
+        return
+    system_getaddrinfo = socket.getaddrinfo
+    cache = {}
+    lock = threading.Lock()
+
+    def cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+        key = (host, port, family, type, proto, flags)
+        now = time.monotonic()
+        with lock:
+            entry = cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        result = system_getaddrinfo(host, port, family, type, proto, flags)
+        with lock:
+            if len(cache) >= maxsize:
+                for stale in [k for k, (expires, _) in cache.items() if expires <= now]:
+                    del cache[stale]
+                while len(cache) >= maxsize:
+                    del cache[next(iter(cache))]
+            cache[key] = (now + ttl, result)
+        return result
+
+    cached_getaddrinfo._audit_dns_cache = True
+    socket.getaddrinfo = cached_getaddrinfo
+
+def load_leagues_yaml(path):
+    """Load a leagues YAML file with the fastest available safe loader."""
+    return yaml.load(Path(path).read_bytes(), Loader=YAML_LOADER)
+
+def link_backup(path, backup_path):
+    """
+    Back up `path` as `backup_path` and return the backup path.
+
+    A hardlink shares the old inode, so nothing is copied and `path` is never
+    missing. The backup only stays intact because `write_yaml_atomic`
+    replaces `path` with a new file instead of rewriting it in place. Falls
+    back to a copy where hardlinks are not supported.
+    """
+    try:
+        os.link(path, backup_path)
+    except OSError:
+        shutil.copy2(path, backup_path)
+    return backup_path
+
+def write_yaml_atomic(path, data, **dump_kwargs):
+    """Dump `data` as YAML to a temporary file, then rename it over `path`."""
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'w') as f:
+            yaml.dump(data, f, Dumper=YAML_DUMPER, **dump_kwargs)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
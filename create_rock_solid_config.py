@@ -7,10 +7,11 @@ This script creates a 100% reliable configuration using only
 the confirmed working leagues from the audit.
 """
 
-import yaml
 from pathlib import Path
 from datetime import datetime
 
+from audit_utils import link_backup, load_leagues_yaml, write_yaml_atomic
+
 # Confirmed working leagues from the final audit
 CONFIRMED_WORKING_LEAGUES = {
     'ENG_PL': 'Premier League (England)',
@@ -30,6 +31,7 @@ CONFIRMED_WORKING_LEAGUES = {
     'CRO_1H': '1. HNL (Croatia)',
     'AUT_BL': 'Bundesliga (Austria)'
 }
+CONFIRMED_CODES = frozenset(CONFIRMED_WORKING_LEAGUES)
 
 def create_rock_solid_config():
     """Create a configuration with only confirmed working leagues."""
@@ -38,9 +40,13 @@ def create_rock_solid_config():
     
     config_path = Path('penaltyblog/config/leagues.yaml')
     
+    # One timestamp for the whole run so every league gets the same stamp
+    run_started = datetime.now()
+    now_iso = run_started.isoformat()
+    backup_ts = run_started.strftime("%Y%m%d_%H%M%S")
+    
     # Load current configuration
-    with open(config_path, 'r') as f:
-        current_config = yaml.safe_load(f)
+    current_config = load_leagues_yaml(config_path)
     
     # Extract all leagues
     if 'leagues' in current_config:
@@ -50,30 +56,26 @@ def create_rock_solid_config():
     
     print(f"📋 Current configuration has {len(all_leagues)} total leagues")
     
-    # Create rock-solid configuration
-    rock_solid_leagues = {}
-    
-    for league_code in CONFIRMED_WORKING_LEAGUES:
-        if league_code in all_leagues:
-            league_config = all_leagues[league_code].copy()
-            league_config['enabled'] = True
-            league_config['status'] = 'verified_working'
-            league_config['last_verified'] = datetime.now().isoformat()
-            rock_solid_leagues[league_code] = league_config
-            print(f"   ✅ Added {league_code} - {CONFIRMED_WORKING_LEAGUES[league_code]}")
-        else:
-            print(f"   ⚠️  Warning: {league_code} not found in current config")
+    # Split leagues into verified working and disabled
+    rock_solid_leagues = {
+        code: {**cfg, 'enabled': True, 'status': 'verified_working', 'last_verified': now_iso}
+        for code, cfg in all_leagues.items() if code in CONFIRMED_CODES
+    }
+    disabled_leagues = {
+        code: {
+            **cfg,
+            'enabled': False,
+            'status': 'disabled_for_stability',
+            'disabled_reason': 'Temporarily disabled - endpoint issues detected',
+            'disabled_date': now_iso,
+        }
+        for code, cfg in all_leagues.items() if code not in CONFIRMED_CODES
+    }
     
-    # Create disabled section for all other leagues
-    disabled_leagues = {}
-    for league_code, league_config in all_leagues.items():
-        if league_code not in CONFIRMED_WORKING_LEAGUES:
-            config_copy = league_config.copy()
-            config_copy['enabled'] = False
-            config_copy['status'] = 'disabled_for_stability'
-            config_copy['disabled_reason'] = 'Temporarily disabled - endpoint issues detected'
-            config_copy['disabled_date'] = datetime.now().isoformat()
-            disabled_leagues[league_code] = config_copy
+    for league_code in rock_solid_leagues:
+        print(f"   ✅ Added {league_code} - {CONFIRMED_WORKING_LEAGUES[league_code]}")
+    for league_code in sorted(CONFIRMED_CODES.difference(all_leagues)):
+        print(f"   ⚠️  Warning: {league_code} not found in current config")
     
     print(f"\n📊 Rock-Solid Configuration Summary:")
     print(f"   ✅ Working leagues: {len(rock_solid_leagues)}")
@@ -81,21 +83,14 @@ def create_rock_solid_config():
     print(f"   📈 Reliability: 100% (only verified working leagues enabled)")
     
     # Create the final configuration
-    final_config = {
-        'leagues': {
-            **rock_solid_leagues,
-            **disabled_leagues
-        }
-    }
+    final_config = {'leagues': {**rock_solid_leagues, **disabled_leagues}}
     
     # Create backup
-    backup_path = config_path.with_suffix(f'.yaml.backup.rocksolid.{datetime.now().strftime("%Y%m%d_%H%M%S")}')
-    config_path.rename(backup_path)
+    backup_path = link_backup(config_path, config_path.with_suffix(f'.yaml.backup.rocksolid.{backup_ts}'))
     print(f"\n💾 Created backup: {backup_path}")
     
     # Save rock-solid configuration
-    with open(config_path, 'w') as f:
-        yaml.dump(final_config, f, default_flow_style=False, sort_keys=True)
+    write_yaml_atomic(config_path, final_config, default_flow_style=False, sort_keys=True)
     
     print(f"💾 Saved rock-solid configuration: {config_path}")
     
@@ -114,18 +109,22 @@ This should always pass 100%.
 """
 
 import sys
-import yaml
 import requests
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from requests.adapters import HTTPAdapter
 from urllib3.exceptions import InsecureRequestWarning
 import warnings
 
+from audit_utils import load_leagues_yaml
+
 warnings.filterwarnings('ignore', category=InsecureRequestWarning)
 
 TIMEOUT = 10
 MAX_RETRIES = 2
+MAX_WORKERS = 16
 
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
@@ -133,11 +132,24 @@ HEADERS = {
     'Connection': 'keep-alive'
 }
 
+def _create_session():
+    """Create a pooled session shared by all probe threads."""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+SESSION = _create_session()
+
 def test_endpoint(url):
     """Test a single endpoint."""
+    if not url:
+        return False, "No URL"
     for attempt in range(MAX_RETRIES):
         try:
-            response = requests.get(url, headers=HEADERS, timeout=TIMEOUT, verify=False)
+            response = SESSION.get(url, timeout=TIMEOUT, verify=False)
             if response.status_code == 200:
                 return True, f"OK ({response.status_code})"
             else:
@@ -159,8 +171,7 @@ def main():
     
     # Load configuration
     config_path = Path('penaltyblog/config/leagues.yaml')
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_leagues_yaml(config_path)
     
     leagues = config.get('leagues', config)
     enabled_leagues = {k: v for k, v in leagues.items() 
@@ -168,25 +179,24 @@ def main():
     
     print(f"📋 Testing {len(enabled_leagues)} enabled leagues")
     
+    # Probe every league concurrently, then report in config order
+    urls = [conf.get('url') or conf.get('url_template') for conf in enabled_leagues.values()]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(test_endpoint, urls))
+    
     passed = 0
     failed = 0
     
-    for i, (code, conf) in enumerate(enabled_leagues.items(), 1):
-        url = conf.get('url') or conf.get('url_template')
+    for i, ((code, conf), (success, message)) in enumerate(zip(enabled_leagues.items(), results), 1):
         name = conf.get('name', 'Unknown')
         
         print(f"[{i:2d}/{len(enabled_leagues)}] {code} ({name})...", end=' ')
         
-        if url:
-            success, message = test_endpoint(url)
-            if success:
-                print(f"✅ {message}")
-                passed += 1
-            else:
-                print(f"❌ {message}")
-                failed += 1
+        if success:
+            print(f"✅ {message}")
+            passed += 1
         else:
-            print("❌ No URL")
+            print(f"❌ {message}")
             failed += 1
     
     print("\\n" + "=" * 40)
@@ -203,9 +213,19 @@ if __name__ == '__main__':
     sys.exit(main())
 '''
     
-    with open('rock_solid_audit.py', 'w') as f:
-        f.write(audit_script)
+    # Leave the file (and its mtime) alone when the content is unchanged
+    script_path = Path('rock_solid_audit.py')
+    new_content = audit_script.encode()
+    try:
+        existing = script_path.read_bytes()
+    except FileNotFoundError:
+        existing = None
+    
+    if existing == new_content:
+        print("✅ Rock-solid audit script already up to date: rock_solid_audit.py")
+        return
     
+    script_path.write_bytes(new_content)
     print("✅ Created rock-solid audit script: rock_solid_audit.py")
 
 def create_summary_report(working_leagues):
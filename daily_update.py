@@ -15,10 +15,13 @@ CRITICAL FIXES:
 """
 
 import sys
+import time
 import logging
+import threading
 import pandas as pd
 from datetime import datetime, timedelta, date
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -27,62 +30,99 @@ logger = logging.getLogger(__name__)
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-def get_current_monday():
+def get_current_monday(today: Optional[date] = None):
     """Get the current Monday's date."""
-    today = datetime.now().date()
+    if today is None:
+        today = datetime.now().date()
     days_since_monday = today.weekday()
     monday = today - timedelta(days=days_since_monday)
     return monday
 
-def validate_temporal_data(df: pd.DataFrame) -> pd.DataFrame:
+def validate_temporal_data(df: pd.DataFrame, today: Optional[date] = None) -> pd.DataFrame:
     """
     Validate temporal data - reject completed results for future dates.
     
     This is a critical fix to prevent fake data from being accepted.
+    The parsed dates are kept in a ``_date_dt`` column so callers can reuse
+    them instead of parsing the ``date`` column a second time.
     """
     if df.empty:
         return df
     
     # Convert date column to datetime if it exists
     if 'date' in df.columns:
-        df['date_parsed'] = pd.to_datetime(df['date'], errors='coerce')
-        current_date = datetime.now().date()
+        df['_date_dt'] = pd.to_datetime(df['date'], errors='coerce', cache=True)
+        current_date = today if today is not None else datetime.now().date()
+        
+        # Find future dates with completed results; most runs have no
+        # future fixtures at all, so only look at scores when some exist
+        future_mask = df['_date_dt'].dt.date > current_date
+        if not future_mask.any():
+            return df
         
-        # Find future dates with completed results
-        future_mask = df['date_parsed'].dt.date > current_date
-        completed_mask = df['goals_home'].notna() & df['goals_away'].notna()
-        invalid_future_results = future_mask & completed_mask
+        future_rows = df.loc[future_mask]
+        completed_mask = future_rows[['goals_home', 'goals_away']].notna().all(axis=1)
         
-        if invalid_future_results.any():
-            invalid_count = invalid_future_results.sum()
+        if completed_mask.any():
+            invalid_count = completed_mask.sum()
             logger.error(f"TEMPORAL VALIDATION FAILED: Found {invalid_count} completed results for future dates")
             logger.error("This indicates fake/demo data. Rejecting entire dataset.")
             
             # Log the problematic entries
-            problematic = df[invalid_future_results][['date', 'team_home', 'team_away', 'goals_home', 'goals_away']]
+            problematic = future_rows[completed_mask][['date', 'team_home', 'team_away', 'goals_home', 'goals_away']]
             logger.error(f"Problematic entries:\n{problematic.to_string()}")
             
             raise ValueError(f"Temporal validation failed: {invalid_count} future completed results detected")
-        
-        # Remove the temporary column
-        df = df.drop('date_parsed', axis=1)
     
     return df
 
-def fetch_real_data_from_scrapers():
+# Scraped fixtures keyed by (league_code, source, season) for this process
+_SCRAPE_CACHE: Dict[Tuple[str, str, str], pd.DataFrame] = {}
+_SCRAPE_CACHE_LOCK = threading.Lock()
+
+def clear_cache():
+    """Forget all scraped fixtures cached by this process."""
+    with _SCRAPE_CACHE_LOCK:
+        _SCRAPE_CACHE.clear()
+
+def _scrape_league_cached(league_code: str, source: str, season: str) -> pd.DataFrame:
+    """Scrape a league once per process and hand out copies of the result."""
+    key = (league_code, source, season)
+    with _SCRAPE_CACHE_LOCK:
+        cached = _SCRAPE_CACHE.get(key)
+    if cached is not None:
+        logger.info(f"Reusing cached fixtures for {league_code} ({source}, {season})")
+        return cached.copy()
+    
+    from penaltyblog.scrapers.unified_scraper import UnifiedScraper
+    
+    scraper = UnifiedScraper(season=season)
+    df = scraper.scrape_league(league_code, preferred_source=source)
+    
+    # Only successful scrapes are cached so a failed run is retried next time
+    if not df.empty:
+        with _SCRAPE_CACHE_LOCK:
+            _SCRAPE_CACHE[key] = df.copy()
+    return df
+
+def fetch_real_data_from_scrapers(
+    today: Optional[date] = None,
+    league_code: str = "ENG_PL",
+    source: str = "fbref",
+    season: str = "2024-25",
+):
     """
     Fetch real data using the unified scraper system.
     
     This replaces the old demo data generation with actual scraping.
+    Results are cached per (league_code, source, season) for the lifetime
+    of the process; call ``clear_cache()`` to force a fresh scrape.
     """
     try:
-        from penaltyblog.scrapers.unified_scraper import UnifiedScraper
-        
         logger.info("🔄 Fetching real data from proven sources...")
-        scraper = UnifiedScraper(season="2024-25")
         
-        # Try Premier League first as default
-        df = scraper.scrape_league("ENG_PL", preferred_source="fbref")
+        # Premier League via FBRef is the default
+        df = _scrape_league_cached(league_code, source, season)
         
         if df.empty:
             logger.error("Failed to fetch data from unified scraper")
@@ -91,7 +131,7 @@ def fetch_real_data_from_scrapers():
         logger.info(f"✅ Successfully fetched {len(df)} fixtures from real sources")
         
         # Apply temporal validation
-        df = validate_temporal_data(df)
+        df = validate_temporal_data(df, today)
         
         return df
         
@@ -107,11 +147,11 @@ def archive_old_data():
         return
     
     # Archive files older than 7 days
-    cutoff_date = datetime.now() - timedelta(days=7)
+    cutoff = time.time() - 7 * 86400
+    archive_dir = data_dir / "archive"
     
     for csv_file in data_dir.glob("*.csv"):
-        if csv_file.stat().st_mtime < cutoff_date.timestamp():
-            archive_dir = data_dir / "archive"
+        if csv_file.stat().st_mtime < cutoff:
             archive_dir.mkdir(exist_ok=True)
             
             archived_path = archive_dir / csv_file.name
@@ -129,11 +169,14 @@ def update_schedule():
     """
     print("🔄 Running daily schedule update with REAL data only...")
     
+    # Read the clock once so every date check in this run agrees
+    today = datetime.now().date()
+    
     # Archive old files
     archive_old_data()
     
     # Fetch real data - NO FALLBACK TO FAKE DATA
-    real_data = fetch_real_data_from_scrapers()
+    real_data = fetch_real_data_from_scrapers(today)
     
     if real_data.empty:
         print("❌ CRITICAL FAILURE: No real data available")
@@ -152,19 +195,18 @@ def update_schedule():
     
     # Filter for current/upcoming matches only
     if 'date' in current_week_data.columns:
-        current_week_data['date_parsed'] = pd.to_datetime(current_week_data['date'], errors='coerce')
-        today = datetime.now().date()
+        if '_date_dt' not in current_week_data.columns:
+            current_week_data['_date_dt'] = pd.to_datetime(current_week_data['date'], errors='coerce', cache=True)
+        match_dates = current_week_data['_date_dt'].dt.date
         
         # Include matches from today onwards for the next 7 days
         start_date = today
         end_date = today + timedelta(days=7)
         
-        date_mask = (
-            (current_week_data['date_parsed'].dt.date >= start_date) &
-            (current_week_data['date_parsed'].dt.date <= end_date)
-        )
-        
-        current_week_data = current_week_data[date_mask].drop('date_parsed', axis=1)
+        date_mask = (match_dates >= start_date) & (match_dates <= end_date)
+        current_week_data = current_week_data[date_mask]
+    
+    current_week_data = current_week_data.drop(columns='_date_dt', errors='ignore')
     
     if current_week_data.empty:
         print("❌ No upcoming fixtures found in real data")
@@ -172,7 +214,7 @@ def update_schedule():
         return None
     
     # Save to CSV with current Monday's date
-    monday = get_current_monday()
+    monday = get_current_monday(today)
     filename = f"data/{monday.strftime('%Y-%m-%d')}.csv"
     
     # Ensure data directory exists
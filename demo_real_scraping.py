@@ -10,7 +10,9 @@ Instead of trying to parse random league websites (which is unreliable),
 we use specialized scrapers for specific high-quality data sources.
 """
 
+import io
 import sys
+import textwrap
 from pathlib import Path
 import logging
 
@@ -18,268 +20,307 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Available leagues with their data source mappings
+# Available leagues with their data source mappings, sources in priority order
 REAL_DATA_LEAGUES = {
     # Tier 1 Leagues with proven data sources
     "ENG_PL": {
         "name": "Premier League",
         "country": "England", 
-        "sources": ["fbref", "understat", "footballdata"],
+        "sources": ("fbref", "understat", "footballdata"),
         "competition_name": "ENG Premier League"
     },
     "ESP_LL": {
         "name": "La Liga",
         "country": "Spain",
-        "sources": ["fbref", "understat", "footballdata"], 
+        "sources": ("fbref", "understat", "footballdata"), 
         "competition_name": "ESP La Liga"
     },
     "GER_BL": {
         "name": "Bundesliga",
         "country": "Germany",
-        "sources": ["fbref", "understat", "footballdata"],
+        "sources": ("fbref", "understat", "footballdata"),
         "competition_name": "DEU Bundesliga 1"
     },
     "ITA_SA": {
         "name": "Serie A", 
         "country": "Italy",
-        "sources": ["fbref", "understat", "footballdata"],
+        "sources": ("fbref", "understat", "footballdata"),
         "competition_name": "ITA Serie A"
     },
     "FRA_L1": {
         "name": "Ligue 1",
         "country": "France", 
-        "sources": ["fbref", "understat", "footballdata"],
+        "sources": ("fbref", "understat", "footballdata"),
         "competition_name": "FRA Ligue 1"
     },
     "NED_ED": {
         "name": "Eredivisie",
         "country": "Netherlands",
-        "sources": ["fbref", "footballdata"],
+        "sources": ("fbref", "footballdata"),
         "competition_name": "NLD Eredivisie"
     },
     "POR_PL": {
         "name": "Primeira Liga",
         "country": "Portugal",
-        "sources": ["fbref", "footballdata"],
+        "sources": ("fbref", "footballdata"),
         "competition_name": "PRT Liga 1"
     },
     # Championship and lower divisions
     "ENG_CH": {
         "name": "Championship",
         "country": "England",
-        "sources": ["fbref", "footballdata"],
+        "sources": ("fbref", "footballdata"),
         "competition_name": "ENG Championship"
     },
     "ESP_L2": {
         "name": "Segunda División", 
         "country": "Spain",
-        "sources": ["fbref", "footballdata"],
+        "sources": ("fbref", "footballdata"),
         "competition_name": "ESP La Liga Segunda"
     },
     "GER_B2": {
         "name": "2. Bundesliga",
         "country": "Germany", 
-        "sources": ["fbref", "footballdata"],
+        "sources": ("fbref", "footballdata"),
         "competition_name": "DEU Bundesliga 2"
     },
     "ITA_SB": {
         "name": "Serie B",
         "country": "Italy",
-        "sources": ["fbref", "footballdata"], 
+        "sources": ("fbref", "footballdata"), 
         "competition_name": "ITA Serie B"
     },
     "FRA_L2": {
         "name": "Ligue 2",
         "country": "France",
-        "sources": ["fbref", "footballdata"],
+        "sources": ("fbref", "footballdata"),
         "competition_name": "FRA Ligue 2"
     },
     # Other leagues with data coverage
     "RUS_PL": {
         "name": "Premier League",
         "country": "Russia",
-        "sources": ["fbref", "understat"],
+        "sources": ("fbref", "understat"),
         "competition_name": "RUS Premier League" 
     },
     "BEL_PD": {
         "name": "Pro League",
         "country": "Belgium",
-        "sources": ["fbref", "footballdata"],
+        "sources": ("fbref", "footballdata"),
         "competition_name": "BEL First Division A"
     },
     "TUR_SL": {
         "name": "Super Lig", 
         "country": "Turkey",
-        "sources": ["fbref", "footballdata"],
+        "sources": ("fbref", "footballdata"),
         "competition_name": "TUR Super Lig"
     },
     "GRE_SL": {
         "name": "Super League",
         "country": "Greece",
-        "sources": ["footballdata"],
+        "sources": ("footballdata",),
         "competition_name": "GRC Super League"
     },
     "SCO_PL": {
         "name": "Premier League",
         "country": "Scotland", 
-        "sources": ["fbref", "footballdata"],
+        "sources": ("fbref", "footballdata"),
         "competition_name": "SCO Premier League"
     }
 }
 
-def show_supported_leagues():
+# League groupings for the listing, partitioned once at import
+TIER1_CODES = ("ENG_PL", "ESP_LL", "GER_BL", "ITA_SA", "FRA_L1")
+TIER2_CODES = ("ENG_CH", "ESP_L2", "GER_B2", "ITA_SB", "FRA_L2")
+_TIERED_CODES = frozenset(TIER1_CODES) | frozenset(TIER2_CODES)
+OTHER_CODES = tuple(code for code in REAL_DATA_LEAGUES if code not in _TIERED_CODES)
+
+# Listing row of each league, rendered once since the registry is static
+LEAGUE_ROWS = {
+    code: f"  {code:<8} - {league['country']} {league['name']:<20} [{', '.join(league['sources'])}]\n"
+    for code, league in REAL_DATA_LEAGUES.items()
+}
+
+# Static report sections
+_REAL_VS_FAKE = textwrap.dedent(
+    """\
+    🔍 REAL DATA vs FAKE DATA
+    ==============================
+
+    ❌ BEFORE (Fake Data Problems):
+       • Generic HTML parsing of league websites
+       • Unreliable due to different website structures
+       • Frequent breakage when sites change
+       • No historical data consistency
+       • Limited statistical detail
+
+    ✅ AFTER (Real Data Sources):
+       • FBRef: Comprehensive stats, fixtures, league tables
+       • Understat: Expected goals (xG), shot maps, forecasts
+       • Football-Data: Historical results, betting odds
+       • Proven APIs and data formats
+       • Rich statistical data beyond just scores
+       • Reliable, maintained by football analytics community
+
+    """
+)
+
+_IMPLEMENTATION = textwrap.dedent(
+    """\
+    🛠️  IMPLEMENTATION APPROACH
+    ==============================
+
+    1. 📋 League Mapping:
+       - Map league codes (ENG_PL) to data source competitions
+       - Each league specifies which sources are available
+       - Fallback priority: FBRef > Football-Data > Understat
+
+    2. 🔄 Unified Scraper:
+       - Coordinates multiple specialized scrapers
+       - Handles season format conversion (2024-25 → 2024 for Understat)
+       - Standardizes output format across sources
+       - Concurrent scraping for performance
+
+    3. 📊 Data Standardization:
+       - Common column names: home, away, home_score, away_score
+       - League metadata: league_code, country, tier
+       - Source tracking: data_source column
+       - Extended stats: xG, shots, cards when available
+
+    4. 💾 Output Management:
+       - Individual league files: England_Premier_League.csv
+       - Combined multi-league file: combined_leagues.csv
+       - Dated directories: data/2024-01-15/
+       - Deduplication and validation
+
+    """
+)
+
+_WEB_INTEGRATION = textwrap.dedent(
+    """\
+    🌐 WEB INTERFACE INTEGRATION
+    ===================================
+
+    Updated web interface:
+    • Header: 'Real football data from proven sources: FBRef, Understat, Football-Data'
+    • Scrape button now uses: unified_scraper --league ENG_PL,ESP_LL,GER_BL,ITA_SA,FRA_L1
+    • League dropdown shows only leagues with real data support
+    • Status endpoint shows data source for each league
+    • Data quality indicators in the interface
+
+    """
+)
+
+_NEXT_STEPS = textwrap.dedent(
+    """\
+    🎉 NEXT STEPS:
+    ===============
+    1. Install required packages: pip install pandas requests beautifulsoup4 lxml
+    2. Run unified scraper: python3 penaltyblog/scrapers/unified_scraper.py --league ENG_PL
+    3. Start web interface: python3 -m penaltyblog.web
+    4. Visit browser to see real data instead of fake data
+
+    💡 The system now uses REAL data from trusted sources instead of
+       unreliable generic HTML parsing of random league websites!
+
+    """
+)
+
+def _emit(buf, *lines):
+    """Append lines to the output buffer in a single write."""
+    buf.write("\n".join(lines) + "\n")
+
+def _league_lines(codes):
+    """Format one line per league code with its available sources."""
+    return "".join(LEAGUE_ROWS[code] for code in codes if code in LEAGUE_ROWS)
+
+def show_supported_leagues(buf):
     """Display all leagues with real data source support."""
-    print("🏈 PENALTYBLOG - REAL DATA SCRAPING")
-    print("=" * 50)
-    print("Supported leagues with proven data sources:")
-    print()
+    _emit(buf,
+        "🏈 PENALTYBLOG - REAL DATA SCRAPING",
+        "=" * 50,
+        "Supported leagues with proven data sources:",
+        "",
+    )
     
     # Group by tier/region
-    tier1 = ["ENG_PL", "ESP_LL", "GER_BL", "ITA_SA", "FRA_L1"]
-    tier2 = ["ENG_CH", "ESP_L2", "GER_B2", "ITA_SB", "FRA_L2"] 
-    other = [code for code in REAL_DATA_LEAGUES.keys() if code not in tier1 + tier2]
-    
-    print("📊 TIER 1 - Major European Leagues:")
-    print("-" * 35)
-    for code in tier1:
-        if code in REAL_DATA_LEAGUES:
-            league = REAL_DATA_LEAGUES[code]
-            sources = ", ".join(league["sources"])
-            print(f"  {code:<8} - {league['country']} {league['name']:<20} [{sources}]")
+    _emit(buf, "📊 TIER 1 - Major European Leagues:", "-" * 35)
+    buf.write(_league_lines(TIER1_CODES))
     
-    print(f"\n📊 TIER 2 - Second Divisions:")
-    print("-" * 25)
-    for code in tier2:
-        if code in REAL_DATA_LEAGUES:
-            league = REAL_DATA_LEAGUES[code]
-            sources = ", ".join(league["sources"])
-            print(f"  {code:<8} - {league['country']} {league['name']:<20} [{sources}]")
+    _emit(buf, "\n📊 TIER 2 - Second Divisions:", "-" * 25)
+    buf.write(_league_lines(TIER2_CODES))
     
-    print(f"\n📊 OTHER - Additional Leagues:")
-    print("-" * 25)
-    for code in other:
-        league = REAL_DATA_LEAGUES[code]
-        sources = ", ".join(league["sources"])
-        print(f"  {code:<8} - {league['country']} {league['name']:<20} [{sources}]")
+    _emit(buf, "\n📊 OTHER - Additional Leagues:", "-" * 25)
+    buf.write(_league_lines(OTHER_CODES))
     
-    print(f"\n✅ Total: {len(REAL_DATA_LEAGUES)} leagues with real data sources")
-    print()
+    _emit(buf, f"\n✅ Total: {len(REAL_DATA_LEAGUES)} leagues with real data sources", "")
 
-def explain_real_vs_fake():
+def explain_real_vs_fake(buf):
     """Explain the difference between real scraping and fake data."""
-    print("🔍 REAL DATA vs FAKE DATA")
-    print("=" * 30)
-    print()
-    print("❌ BEFORE (Fake Data Problems):")
-    print("   • Generic HTML parsing of league websites")
-    print("   • Unreliable due to different website structures") 
-    print("   • Frequent breakage when sites change")
-    print("   • No historical data consistency")
-    print("   • Limited statistical detail")
-    print()
-    print("✅ AFTER (Real Data Sources):")
-    print("   • FBRef: Comprehensive stats, fixtures, league tables")
-    print("   • Understat: Expected goals (xG), shot maps, forecasts")
-    print("   • Football-Data: Historical results, betting odds")
-    print("   • Proven APIs and data formats")
-    print("   • Rich statistical data beyond just scores")
-    print("   • Reliable, maintained by football analytics community")
-    print()
-
-def explain_implementation():
+    buf.write(_REAL_VS_FAKE)
+
+def explain_implementation(buf):
     """Explain how the real scraping system works."""
-    print("🛠️  IMPLEMENTATION APPROACH")
-    print("=" * 30)
-    print()
-    print("1. 📋 League Mapping:")
-    print("   - Map league codes (ENG_PL) to data source competitions")
-    print("   - Each league specifies which sources are available")
-    print("   - Fallback priority: FBRef > Football-Data > Understat")
-    print()
-    print("2. 🔄 Unified Scraper:")
-    print("   - Coordinates multiple specialized scrapers") 
-    print("   - Handles season format conversion (2024-25 → 2024 for Understat)")
-    print("   - Standardizes output format across sources")
-    print("   - Concurrent scraping for performance")
-    print()
-    print("3. 📊 Data Standardization:")
-    print("   - Common column names: home, away, home_score, away_score")
-    print("   - League metadata: league_code, country, tier")
-    print("   - Source tracking: data_source column")
-    print("   - Extended stats: xG, shots, cards when available")
-    print()
-    print("4. 💾 Output Management:")
-    print("   - Individual league files: England_Premier_League.csv")
-    print("   - Combined multi-league file: combined_leagues.csv")
-    print("   - Dated directories: data/2024-01-15/")
-    print("   - Deduplication and validation")
-    print()
-
-def simulate_scraping_example():
+    buf.write(_IMPLEMENTATION)
+
+def simulate_scraping_example(buf):
     """Show what a real scraping session would look like."""
-    print("🎯 SCRAPING SIMULATION")
-    print("=" * 25)
-    print()
+    _emit(buf, "🎯 SCRAPING SIMULATION", "=" * 25, "")
     
     example_leagues = ["ENG_PL", "ESP_LL", "GER_BL", "ITA_SA", "FRA_L1"]
     
     for code in example_leagues:
         league = REAL_DATA_LEAGUES[code]
-        print(f"🔄 Scraping {league['country']} {league['name']} ({code})")
+        _emit(buf, f"🔄 Scraping {league['country']} {league['name']} ({code})")
         
         for source in league["sources"]:
             if source == "fbref":
-                print(f"   📊 FBRef: https://fbref.com/en/comps/{league['competition_name']}/")
-                print(f"       ✅ 380 fixtures, 38 teams, 10 statistical categories")
+                _emit(buf,
+                    f"   📊 FBRef: https://fbref.com/en/comps/{league['competition_name']}/",
+                    f"       ✅ 380 fixtures, 38 teams, 10 statistical categories",
+                )
             elif source == "understat":
-                print(f"   📈 Understat: https://understat.com/league/{league['competition_name']}/")
-                print(f"       ✅ 380 fixtures with xG, shot maps, predictions")
+                _emit(buf,
+                    f"   📈 Understat: https://understat.com/league/{league['competition_name']}/",
+                    f"       ✅ 380 fixtures with xG, shot maps, predictions",
+                )
             elif source == "footballdata":
-                print(f"   📋 Football-Data: https://football-data.co.uk/")
-                print(f"       ✅ 380 fixtures with betting odds, historical data")
+                _emit(buf,
+                    f"   📋 Football-Data: https://football-data.co.uk/",
+                    f"       ✅ 380 fixtures with betting odds, historical data",
+                )
             
             # Use best source (first in list)
             if source == league["sources"][0]:
-                print(f"   💾 Saved: data/2024-01-15/{league['country']}_{league['name'].replace(' ', '_')}.csv")
+                _emit(buf, f"   💾 Saved: data/2024-01-15/{league['country']}_{league['name'].replace(' ', '_')}.csv")
                 break
-        print()
+        _emit(buf, "")
     
-    print("📦 Combined output: data/2024-01-15/combined_leagues.csv")
-    print("🏁 Scraping completed with real data from proven sources!")
-    print()
+    _emit(buf,
+        "📦 Combined output: data/2024-01-15/combined_leagues.csv",
+        "🏁 Scraping completed with real data from proven sources!",
+        "",
+    )
 
-def show_web_integration():
+def show_web_integration(buf):
     """Show how this integrates with the web interface."""
-    print("🌐 WEB INTERFACE INTEGRATION")
-    print("=" * 35)
-    print()
-    print("Updated web interface:")
-    print("• Header: 'Real football data from proven sources: FBRef, Understat, Football-Data'")
-    print("• Scrape button now uses: unified_scraper --league ENG_PL,ESP_LL,GER_BL,ITA_SA,FRA_L1")
-    print("• League dropdown shows only leagues with real data support")
-    print("• Status endpoint shows data source for each league")
-    print("• Data quality indicators in the interface")
-    print()
+    buf.write(_WEB_INTEGRATION)
 
 def main():
     """Main demonstration function."""
-    print()
-    show_supported_leagues()
-    explain_real_vs_fake()
-    explain_implementation()
-    simulate_scraping_example()
-    show_web_integration()
+    # Build the whole report in memory and write it to stdout once
+    buf = io.StringIO()
+    _emit(buf, "")
+    show_supported_leagues(buf)
+    explain_real_vs_fake(buf)
+    explain_implementation(buf)
+    simulate_scraping_example(buf)
+    show_web_integration(buf)
+    
+    buf.write(_NEXT_STEPS)
     
-    print("🎉 NEXT STEPS:")
-    print("=" * 15)
-    print("1. Install required packages: pip install pandas requests beautifulsoup4 lxml")
-    print("2. Run unified scraper: python3 penaltyblog/scrapers/unified_scraper.py --league ENG_PL")
-    print("3. Start web interface: python3 -m penaltyblog.web")
-    print("4. Visit browser to see real data instead of fake data")
-    print()
-    print("💡 The system now uses REAL data from trusted sources instead of")
-    print("   unreliable generic HTML parsing of random league websites!")
-    print()
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
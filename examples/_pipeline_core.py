@@ -0,0 +1,333 @@
+"""
+Shared steps of the demo pipelines
+==================================
+
+``demo_pipeline.py`` (Premier League) and ``demo_pipeline_mls.py`` (MLS) only
+differ in how they fetch fixtures and what they call their outputs; the
+modelling, implied probability, rating and metric steps live here so both
+demos run the same code.
+"""
+
+import numpy as np
+import pandas as pd
+
+import penaltyblog as pb
+
+# Options for every CSV written by the demos: no index, Unix newlines and
+# floats rounded to 6 significant digits rather than full 17-digit doubles
+CSV_OPTIONS = {"index": False, "float_format": "%.6g", "lineterminator": "\n"}
+
+# Alternative names for the goal columns, in order of preference
+GOAL_COLUMN_ALIASES = {
+    "goals_home": ("fthg", "home_goals", "FTHG"),
+    "goals_away": ("ftag", "away_goals", "FTAG"),
+}
+
+
+def prepare_model_data(df):
+    """Prepare data for model training."""
+    # Use alternative goal column names if the standard ones are missing
+    renames = {}
+    for col, aliases in GOAL_COLUMN_ALIASES.items():
+        if col not in df.columns:
+            alias = next((name for name in aliases if name in df.columns), None)
+            if alias is None:
+                # Column not found and no alternative - this indicates a data issue
+                raise ValueError(f"Required column '{col}' not found in scraped data")
+            renames[alias] = col
+
+    model_df = df.rename(columns=renames)
+
+    # Filter to completed matches, storing goals as small integers
+    model_df = model_df.dropna(subset=["goals_home", "goals_away"]).astype(
+        {"goals_home": np.int16, "goals_away": np.int16}
+    )
+
+    return model_df
+
+
+def fit_model(train_data):
+    """Fit a Poisson goals model to the training matches."""
+    model = pb.models.PoissonGoalsModel(
+        goals_home=train_data["goals_home"].values,
+        goals_away=train_data["goals_away"].values,
+        teams_home=train_data["team_home"].values,
+        teams_away=train_data["team_away"].values,
+    )
+    model.fit()
+    return model
+
+
+def batch_predict(model, test_data):
+    """Attach home win, draw and away win probabilities to each test match."""
+    home_teams = test_data["team_home"].to_numpy()
+    away_teams = test_data["team_away"].to_numpy()
+    home_win = np.empty(len(test_data))
+    draw = np.empty(len(test_data))
+    away_win = np.empty(len(test_data))
+    for i, (home, away) in enumerate(zip(home_teams, away_teams)):
+        pred_grid = model.predict(home, away)
+        home_win[i] = pred_grid.home_win
+        draw[i] = pred_grid.draw
+        away_win[i] = pred_grid.away_win
+
+    return test_data.assign(
+        pred_home_win=home_win, pred_draw=draw, pred_away_win=away_win
+    )
+
+
+def vectorized_implied(results_df, margin=0.05, n_matches=10):
+    """
+    Implied probabilities for the first matches, using the model predictions
+    plus a bookmaker margin as the "odds".
+    """
+    # Convert probabilities to decimal odds (adding margin)
+    sample = results_df.head(n_matches)
+    probs = sample[["pred_home_win", "pred_draw", "pred_away_win"]].to_numpy()
+    odds = (1 + margin) / probs
+
+    # Basic implied probabilities, normalized using multiplicative method
+    basic = 1 / odds
+    implied = basic / basic.sum(axis=1, keepdims=True)
+
+    return pd.DataFrame(
+        {
+            "match": sample["team_home"] + " vs " + sample["team_away"],
+            "implied_home": implied[:, 0],
+            "implied_draw": implied[:, 1],
+            "implied_away": implied[:, 2],
+            "total_prob": implied.sum(axis=1),
+        }
+    )
+
+
+def run_elo(matches):
+    """Rate every team by running Elo over the played matches, in order."""
+    elo_system = pb.ratings.Elo()
+
+    played = matches.dropna(subset=["goals_home", "goals_away"])
+
+    # Determine results up front (0=home win, 1=draw, 2=away win), the
+    # encoding Elo.update_ratings_batch expects
+    goal_diff = played["goals_home"].to_numpy(dtype=float) - played[
+        "goals_away"
+    ].to_numpy(dtype=float)
+    results = 1 - np.sign(goal_diff).astype(np.int8)
+
+    elo_system.update_ratings_batch(
+        played["team_home"].to_numpy(), played["team_away"].to_numpy(), results
+    )
+
+    # Get final ratings
+    teams = pd.unique(
+        np.concatenate(
+            [matches["team_home"].to_numpy(), matches["team_away"].to_numpy()]
+        )
+    )
+    teams = teams[pd.notna(teams)]
+    ratings = np.fromiter(
+        (elo_system.get_team_rating(team) for team in teams),
+        dtype=np.float64,
+        count=len(teams),
+    )
+
+    return pd.DataFrame({"team": teams, "rating": ratings}).sort_values(
+        "rating", ascending=False
+    )
+
+
+def vectorized_metrics(results_df):
+    """
+    Brier score and accuracy of the predictions over the played matches.
+
+    Returns None when none of the predicted matches have been played.
+    """
+    # Outcome of each played match (0=home win, 1=draw, 2=away win)
+    played = results_df.dropna(subset=["goals_home", "goals_away"])
+    if len(played) == 0:
+        return None
+
+    goals_home = played["goals_home"].to_numpy(dtype=float)
+    goals_away = played["goals_away"].to_numpy(dtype=float)
+    actual_outcomes = 1 - np.sign(goals_home - goals_away).astype(int)
+    pred_array = played[["pred_home_win", "pred_draw", "pred_away_win"]].to_numpy()
+
+    avg_brier = pb.metrics.multiclass_brier_score(pred_array, actual_outcomes)
+    predicted_outcomes = np.argmax(pred_array, axis=1)
+    accuracy = np.mean(predicted_outcomes == actual_outcomes)
+
+    return pd.DataFrame(
+        {
+            "metric": ["brier_score", "accuracy", "num_predictions"],
+            "value": [avg_brier, accuracy, len(played)],
+        }
+    )
+
+
+def run_pipeline(
+    completed_matches,
+    output_dir,
+    label="",
+    predictions_file="model_predictions.csv",
+    ratings_file="team_ratings.csv",
+    enable_implied=True,
+    enable_metrics=True,
+    next_steps=(),
+    fixtures=None,
+):
+    """
+    Run the steps that follow data scraping and print the summary.
+
+    Parameters
+    ----------
+    completed_matches : pd.DataFrame
+        Fixtures produced by the demo's scraping step
+    output_dir : pathlib.Path
+        Directory the CSV outputs are written to
+    label : str
+        Prefix naming the competition in messages, e.g. ``"MLS "``
+    predictions_file, ratings_file : str
+        Names of the predictions and ratings CSVs
+    enable_implied, enable_metrics : bool
+        Whether to run the implied probability and metrics steps
+    next_steps : sequence of str
+        Suggestions listed at the end of the summary
+    fixtures : pd.DataFrame or None
+        Unfiltered fixtures to model from; ``prepare_model_data`` drops
+        unplayed matches itself, so passing them avoids filtering twice.
+        Defaults to ``completed_matches``
+    """
+    step = 2
+
+    # Model Training and Prediction
+    print(f"🤖 STEP {step}: {label}Model Training & Prediction")
+    print("-" * 40)
+
+    try:
+        # Prepare data for modeling
+        print(f"🔧 Preparing {label}data for modeling...")
+        model_data = prepare_model_data(
+            completed_matches if fixtures is None else fixtures
+        )
+
+        if len(model_data) < 5:
+            print("⚠️  Not enough data for reliable modeling")
+            return
+
+        # Split data for training and prediction
+        train_size = int(len(model_data) * 0.8)
+        train_data = model_data.iloc[:train_size]
+        test_data = model_data.iloc[train_size:]
+
+        print(f"📊 Training data: {len(train_data)} {label}matches")
+        print(f"📊 Test data: {len(test_data)} {label}matches")
+
+        print("🏗️  Training Poisson Goals Model...")
+        model = fit_model(train_data)
+        print("✅ Model training completed")
+
+        print(f"🔮 Making {label}predictions...")
+        results_df = batch_predict(model, test_data)
+        print(f"✅ Generated {label}predictions for {len(results_df)} matches")
+
+        pred_file = output_dir / predictions_file
+        results_df.to_csv(pred_file, **CSV_OPTIONS)
+        print(f"💾 Saved {label}predictions to: {pred_file}")
+
+    except Exception as e:
+        print(f"❌ Error in {label}modeling: {e}")
+        print("❌ Cannot proceed without proper model training.")
+        return
+
+    print()
+
+    if enable_implied:
+        step += 1
+        print(f"💰 STEP {step}: Implied Probabilities")
+        print("-" * 35)
+
+        try:
+            print("🎲 Calculating implied probabilities...")
+            implied_df = vectorized_implied(results_df)
+            print(f"✅ Calculated implied probabilities for {len(implied_df)} matches")
+            print(f"   Average probability sum: {implied_df['total_prob'].mean():.6f}")
+
+            implied_file = output_dir / "implied_probabilities.csv"
+            implied_df.to_csv(implied_file, **CSV_OPTIONS)
+            print(f"💾 Saved implied probabilities to: {implied_file}")
+
+        except Exception as e:
+            print(f"❌ Error in implied probability calculation: {e}")
+
+        print()
+
+    step += 1
+    print(f"⭐ STEP {step}: {label}Team Ratings")
+    print("-" * 25)
+
+    try:
+        print("📊 Calculating Elo ratings...")
+        ratings_df = run_elo(completed_matches)
+        print(f"✅ Calculated ratings for {len(ratings_df)} {label}teams")
+        print(
+            f"   Top {label}team: {ratings_df.iloc[0]['team']} ({ratings_df.iloc[0]['rating']:.1f})"
+        )
+        print(
+            f"   Rating range: {ratings_df['rating'].min():.1f} - {ratings_df['rating'].max():.1f}"
+        )
+
+        ratings_path = output_dir / ratings_file
+        ratings_df.to_csv(ratings_path, **CSV_OPTIONS)
+        print(f"💾 Saved {label}ratings to: {ratings_path}")
+
+    except Exception as e:
+        print(f"❌ Error in {label}ratings calculation: {e}")
+
+    print()
+
+    if enable_metrics:
+        step += 1
+        print(f"📈 STEP {step}: Performance Metrics")
+        print("-" * 30)
+
+        try:
+            if len(results_df) > 0:
+                print("🎯 Calculating prediction metrics...")
+                metrics_df = vectorized_metrics(results_df)
+
+                if metrics_df is not None:
+                    avg_brier, accuracy = metrics_df["value"].iloc[:2]
+                    print(f"✅ Average Brier Score: {avg_brier:.4f}")
+                    print(f"   Lower is better (perfect = 0.0, random = 0.5)")
+                    print(f"✅ Prediction Accuracy: {accuracy:.1%}")
+
+                    metrics_file = output_dir / "performance_metrics.csv"
+                    metrics_df.to_csv(metrics_file, **CSV_OPTIONS)
+                    print(f"💾 Saved metrics to: {metrics_file}")
+
+        except Exception as e:
+            print(f"❌ Error in metrics calculation: {e}")
+
+        print()
+
+    # Final Summary
+    print(f"📋 {label.upper()}DEMO PIPELINE SUMMARY")
+    print("=" * 60)
+
+    output_files = list(output_dir.glob("*.csv"))
+    if output_files:
+        print(f"✅ Generated {label}output files:")
+        for file in sorted(output_files):
+            size_kb = file.stat().st_size / 1024
+            print(f"   📄 {file.name} ({size_kb:.1f} KB)")
+    else:
+        print("⚠️  No output files generated")
+
+    print()
+    print("🎉 Demo pipeline completed successfully!")
+    print(f"🔍 Check the {label}output directory: {output_dir.absolute()}")
+    print()
+    print("📚 Next steps:")
+    for suggestion in next_steps:
+        print(f"   • {suggestion}")
+    print("=" * 60)
@@ -60,7 +60,8 @@ def main():
             "goals_home": [2, -1, 3, 15],  # Negative goals, unusually high score
             "goals_away": [1, 1, 1, 12],
             "date": pd.to_datetime(
-                ["2023-10-01", "2023-10-02", "2023-10-03", "2025-10-04"]
+                ["2023-10-01", "2023-10-02", "2023-10-03", "2025-10-04"],
+                format="%Y-%m-%d",
             ),  # Future date
         }
     )
@@ -93,7 +94,7 @@ def main():
             "team_away": ["Tottenham", "Man United"],
             "goals_home": [2, 1],
             "goals_away": [1, 1],
-            "date": pd.to_datetime(["2023-10-01", "2023-10-02"]),
+            "date": pd.to_datetime(["2023-10-01", "2023-10-02"], format="%Y-%m-%d"),
         }
     )
 
@@ -103,7 +104,7 @@ def main():
             "team_away": ["Tottenham", "Man United"],
             "goals_home": [2, 1],
             "goals_away": [1, 2],  # Different result for second match
-            "date": pd.to_datetime(["2023-10-01", "2023-10-02"]),
+            "date": pd.to_datetime(["2023-10-01", "2023-10-02"], format="%Y-%m-%d"),
         }
     )
 
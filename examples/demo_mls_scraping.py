@@ -9,15 +9,10 @@ This script demonstrates:
 4. Integrating with existing penaltyblog workflow
 """
 
-import sys
-from pathlib import Path
 import pandas as pd
 import logging
 
-# Add the project root to Python path for imports
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
+from penaltyblog.scrapers._http import get_session
 from penaltyblog.scrapers.mls_official import MLSOfficial
 from penaltyblog.scrapers.team_mappings import get_mls_team_mappings
 from penaltyblog.scrapers.fbref import FBRef
@@ -27,6 +22,9 @@ from penaltyblog.config.leagues import get_league_by_code
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# One pooled session for every scraper in the demo
+SESSION = get_session()
+
 
 def demo_mls_teams():
     """Demonstrate getting MLS team data."""
@@ -36,7 +34,7 @@ def demo_mls_teams():
     
     try:
         # Initialize MLS scraper
-        mls_scraper = MLSOfficial(season="2024")
+        mls_scraper = MLSOfficial(season="2024", session=SESSION)
         
         # Get teams data
         teams_df = mls_scraper.get_teams()
@@ -49,13 +47,13 @@ def demo_mls_teams():
             for conference in teams_df['conference'].unique():
                 conf_teams = teams_df[teams_df['conference'] == conference]
                 print(f"\n{conference} Conference ({len(conf_teams)} teams):")
-                for _, team in conf_teams.iterrows():
-                    print(f"  - {team['team_name']} ({team['city']}, founded {team['founded']})")
+                for team in conf_teams[['team_name', 'city', 'founded']].itertuples(index=False):
+                    print(f"  - {team.team_name} ({team.city}, founded {team.founded})")
         else:
             print("No teams data retrieved")
             
     except Exception as e:
-        logger.error(f"Error in MLS teams demo: {e}")
+        logger.error("Error in MLS teams demo: %s", e)
 
 
 def demo_mls_team_mappings():
@@ -80,7 +78,7 @@ def demo_mls_team_mappings():
         print(f"... and {len(mappings) - 5} more teams")
         
     except Exception as e:
-        logger.error(f"Error in team mappings demo: {e}")
+        logger.error("Error in team mappings demo: %s", e)
 
 
 def demo_mls_fixtures():
@@ -91,7 +89,7 @@ def demo_mls_fixtures():
     
     try:
         # Initialize MLS scraper for current season
-        mls_scraper = MLSOfficial(season="2024")
+        mls_scraper = MLSOfficial(season="2024", session=SESSION)
         
         print("Attempting to fetch MLS fixtures...")
         print("Note: This requires live internet connection and may take a moment")
@@ -113,7 +111,7 @@ def demo_mls_fixtures():
             print("No fixtures data retrieved (this may be normal for demo purposes)")
             
     except Exception as e:
-        logger.error(f"Error in MLS fixtures demo: {e}")
+        logger.error("Error in MLS fixtures demo: %s", e)
         print("Note: Fixtures scraping requires specific HTML parsing which may need adjustment")
 
 
@@ -137,7 +135,8 @@ def demo_fbref_mls():
             fbref_scraper = FBRef(
                 competition="USA Major League Soccer",
                 season="2024",
-                team_mappings=get_mls_team_mappings()
+                team_mappings=get_mls_team_mappings(),
+                session=SESSION,
             )
             
             print("FBRef MLS scraper initialized successfully")
@@ -146,7 +145,7 @@ def demo_fbref_mls():
             print("MLS not currently available in FBRef competitions")
             
     except Exception as e:
-        logger.error(f"Error in FBRef MLS demo: {e}")
+        logger.error("Error in FBRef MLS demo: %s", e)
 
 
 def demo_league_configuration():
@@ -172,7 +171,7 @@ def demo_league_configuration():
             print("MLS league configuration not found")
             
     except Exception as e:
-        logger.error(f"Error in league configuration demo: {e}")
+        logger.error("Error in league configuration demo: %s", e)
 
 
 def demo_integration_workflow():
@@ -215,7 +214,7 @@ def demo_integration_workflow():
         print("4. teams = scraper.get_teams()")
         
     except Exception as e:
-        logger.error(f"Error in integration workflow demo: {e}")
+        logger.error("Error in integration workflow demo: %s", e)
 
 
 def main():
@@ -11,23 +11,22 @@ This script demonstrates the core functionality of penaltyblog using MLS data:
 5. Metrics evaluation
 
 Usage:
-    python examples/demo_pipeline_mls.py
+    python -m examples.demo_pipeline_mls
 """
 
-import os
-import sys
 import warnings
-from datetime import datetime, timedelta
 from pathlib import Path
 
 import pandas as pd
 import numpy as np
 
-# Add the project root to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 import penaltyblog as pb
 
+try:
+    from examples._pipeline_core import CSV_OPTIONS, run_pipeline
+except ImportError:  # run as a script from inside examples/
+    from _pipeline_core import CSV_OPTIONS, run_pipeline
+
 # Suppress warnings for cleaner output
 warnings.filterwarnings("ignore")
 
@@ -60,9 +59,10 @@ def main():
         print(
             f"   Date range: {df['datetime'].min().date()} to {df['datetime'].max().date()}"
         )
-        print(
-            f"   Teams: {df['team_home'].nunique() + df['team_away'].nunique() - len(set(df['team_home']) & set(df['team_away']))} unique teams"
+        all_teams = pd.unique(
+            np.concatenate([df["team_home"].to_numpy(), df["team_away"].to_numpy()])
         )
+        print(f"   Teams: {pd.notna(all_teams).sum()} unique teams")
 
         # Filter to completed matches only
         completed_matches = df.dropna(subset=["goals_home", "goals_away"])
@@ -76,7 +76,7 @@ def main():
 
         # Save scraped data
         output_file = output_dir / "mls_fixtures.csv"
-        completed_matches.to_csv(output_file, index=False)
+        completed_matches.to_csv(output_file, **CSV_OPTIONS)
         print(f"💾 Saved MLS data to: {output_file}")
 
     except Exception as e:
@@ -86,169 +86,26 @@ def main():
         
         # Save sample data
         output_file = output_dir / "mls_fixtures.csv"
-        completed_matches.to_csv(output_file, index=False)
+        completed_matches.to_csv(output_file, **CSV_OPTIONS)
         print(f"💾 Saved sample MLS data to: {output_file}")
 
     print()
 
-    # Step 2: Model Training and Prediction
-    print("🤖 STEP 2: MLS Model Training & Prediction")
-    print("-" * 45)
-
-    try:
-        # Prepare data for modeling
-        print("🔧 Preparing MLS data for modeling...")
-        model_data = prepare_model_data(completed_matches)
-
-        if len(model_data) < 5:
-            print("⚠️  Not enough data for reliable modeling")
-            return
-
-        # Split data for training and prediction
-        train_size = int(len(model_data) * 0.8)
-        train_data = model_data.iloc[:train_size]
-        test_data = model_data.iloc[train_size:]
-
-        print(f"📊 Training data: {len(train_data)} MLS matches")
-        print(f"📊 Test data: {len(test_data)} MLS matches")
-
-        # Initialize and fit Poisson model
-        print("🏗️  Training Poisson Goals Model on MLS data...")
-        model = pb.models.PoissonGoalsModel(
-            goals_home=train_data["goals_home"].values,
-            goals_away=train_data["goals_away"].values,
-            teams_home=train_data["team_home"].values,
-            teams_away=train_data["team_away"].values,
-        )
-
-        # Fit the model
-        model.fit()
-        print("✅ MLS model training completed")
-
-        # Make predictions on test data
-        print("🔮 Making MLS predictions...")
-        match_probs = []
-        for _, row in test_data.iterrows():
-            pred_grid = model.predict(row["team_home"], row["team_away"])
-            home_win = pred_grid.home_win
-            draw = pred_grid.draw
-            away_win = pred_grid.away_win
-            match_probs.append(
-                {"home_win": home_win, "draw": draw, "away_win": away_win}
-            )
-
-        # Create results dataframe
-        results_df = test_data.copy()
-        results_df["pred_home_win"] = [p["home_win"] for p in match_probs]
-        results_df["pred_draw"] = [p["draw"] for p in match_probs]
-        results_df["pred_away_win"] = [p["away_win"] for p in match_probs]
-
-        print(f"✅ Generated MLS predictions for {len(results_df)} matches")
-
-        # Save predictions
-        pred_file = output_dir / "mls_predictions.csv"
-        results_df.to_csv(pred_file, index=False)
-        print(f"💾 Saved MLS predictions to: {pred_file}")
-
-    except Exception as e:
-        print(f"❌ Error in MLS modeling: {e}")
-        print("❌ Cannot proceed without proper model training.")
-        return
-
-    print()
-
-    # Step 3: MLS Team Ratings
-    print("⭐ STEP 3: MLS Team Ratings")
-    print("-" * 30)
-
-    try:
-        print("📊 Calculating Elo ratings for MLS teams...")
-
-        # Initialize Elo rating system
-        elo_system = pb.ratings.Elo()
-
-        # Calculate ratings for all completed matches
-        ratings_history = []
-        for _, match in completed_matches.iterrows():
-            if pd.notna(match["goals_home"]) and pd.notna(match["goals_away"]):
-                home_team = match["team_home"]
-                away_team = match["team_away"]
-                home_goals = int(match["goals_home"])
-                away_goals = int(match["goals_away"])
-
-                # Determine result (0=away win, 1=draw, 2=home win)
-                if home_goals > away_goals:
-                    result = 2  # Home win
-                elif home_goals < away_goals:
-                    result = 0  # Away win
-                else:
-                    result = 1  # Draw
-
-                # Update ratings
-                elo_system.update_ratings(home_team, away_team, result)
-
-                ratings_history.append(
-                    {
-                        "date": match["datetime"],
-                        "home_team": home_team,
-                        "away_team": away_team,
-                        "result": result,
-                        "home_rating": elo_system.get_team_rating(home_team),
-                        "away_rating": elo_system.get_team_rating(away_team),
-                    }
-                )
-
-        # Get final ratings
-        final_ratings = []
-        for team in set(
-            completed_matches["team_home"].tolist()
-            + completed_matches["team_away"].tolist()
-        ):
-            if pd.notna(team):
-                rating = elo_system.get_team_rating(team)
-                final_ratings.append({"team": team, "rating": rating})
-
-        ratings_df = pd.DataFrame(final_ratings).sort_values("rating", ascending=False)
-        print(f"✅ Calculated ratings for {len(ratings_df)} MLS teams")
-        print(
-            f"   Top MLS team: {ratings_df.iloc[0]['team']} ({ratings_df.iloc[0]['rating']:.1f})"
-        )
-        print(
-            f"   Rating range: {ratings_df['rating'].min():.1f} - {ratings_df['rating'].max():.1f}"
-        )
-
-        # Save ratings
-        ratings_file = output_dir / "mls_team_ratings.csv"
-        ratings_df.to_csv(ratings_file, index=False)
-        print(f"💾 Saved MLS ratings to: {ratings_file}")
-
-    except Exception as e:
-        print(f"❌ Error in MLS ratings calculation: {e}")
-
-    print()
-
-    # Final Summary
-    print("📋 MLS DEMO PIPELINE SUMMARY")
-    print("=" * 60)
-
-    output_files = list(output_dir.glob("*.csv"))
-    if output_files:
-        print("✅ Generated MLS output files:")
-        for file in sorted(output_files):
-            size_kb = file.stat().st_size / 1024
-            print(f"   📄 {file.name} ({size_kb:.1f} KB)")
-    else:
-        print("⚠️  No output files generated")
-
-    print()
-    print("🎉 MLS demo pipeline completed successfully!")
-    print(f"🔍 Check the MLS output directory: {output_dir.absolute()}")
-    print()
-    print("📚 Next steps:")
-    print("   • Explore the generated MLS CSV files")
-    print("   • Compare with Premier League results")
-    print("   • Try different MLS seasons or teams")
-    print("=" * 60)
+    # Steps 2-3: modeling and ratings
+    run_pipeline(
+        completed_matches,
+        output_dir,
+        label="MLS ",
+        predictions_file="mls_predictions.csv",
+        ratings_file="mls_team_ratings.csv",
+        enable_implied=False,
+        enable_metrics=False,
+        next_steps=(
+            "Explore the generated MLS CSV files",
+            "Compare with Premier League results",
+            "Try different MLS seasons or teams",
+        ),
+    )
 
 
 def generate_sample_mls_data():
@@ -267,67 +124,39 @@ def generate_sample_mls_data():
         "D.C. United", "St. Louis City SC"
     ]
     
-    # Generate sample matches
-    matches = []
-    np.random.seed(42)  # For reproducible results
-    
-    # Generate matches for different months
-    for month in range(3, 11):  # March to October (MLS season)
-        for _ in range(20):  # 20 matches per month
-            home_team = np.random.choice(mls_teams)
-            away_team = np.random.choice([t for t in mls_teams if t != home_team])
-            
-            # Generate realistic MLS scores
-            home_goals = np.random.poisson(1.3)  # MLS average around 1.3 goals per team
-            away_goals = np.random.poisson(1.1)  # Slightly lower for away teams
-            
-            match_date = pd.Timestamp(f"2024-{month:02d}-{np.random.randint(1, 29):02d}")
-            
-            matches.append({
-                "datetime": match_date,
-                "team_home": home_team,
-                "team_away": away_team,
-                "goals_home": home_goals,
-                "goals_away": away_goals,
-                "competition": "USA Major League Soccer",
-                "season": "2024"
-            })
-    
-    return pd.DataFrame(matches)
-
-
-def prepare_model_data(df):
-    """Prepare data for model training."""
-    model_df = df.copy()
-
-    # Ensure we have the required columns
-    required_cols = ["team_home", "team_away", "goals_home", "goals_away", "datetime"]
-
-    for col in required_cols:
-        if col not in model_df.columns:
-            if col in ["goals_home", "goals_away"]:
-                # Use alternative column names if available
-                alt_names = {
-                    "goals_home": ["fthg", "home_goals", "FTHG"],
-                    "goals_away": ["ftag", "away_goals", "FTAG"],
-                }
-                for alt_name in alt_names.get(col, []):
-                    if alt_name in model_df.columns:
-                        model_df[col] = model_df[alt_name]
-                        break
-                else:
-                    # Column not found and no alternative - this indicates a data issue
-                    raise ValueError(f"Required column '{col}' not found in scraped data")
-
-    # Filter to completed matches
-    model_df = model_df.dropna(subset=["goals_home", "goals_away"])
-
-    # Ensure goals are integers
-    model_df["goals_home"] = model_df["goals_home"].astype(int)
-    model_df["goals_away"] = model_df["goals_away"].astype(int)
-
-    return model_df
+    # Generate 20 matches per month, March to October (MLS season)
+    rng = np.random.default_rng(42)  # For reproducible results
+    teams = np.array(mls_teams)
+    n_matches = 8 * 20
+
+    # Offsetting the away team from the home team guarantees they differ
+    home_idx = rng.integers(0, len(teams), n_matches)
+    away_idx = (home_idx + rng.integers(1, len(teams), n_matches)) % len(teams)
+
+    # Generate realistic MLS scores
+    home_goals = rng.poisson(1.3, n_matches)  # MLS average around 1.3 goals per team
+    away_goals = rng.poisson(1.1, n_matches)  # Slightly lower for away teams
+
+    match_dates = pd.to_datetime(
+        {
+            "year": np.full(n_matches, 2024),
+            "month": np.repeat(np.arange(3, 11), 20),
+            "day": rng.integers(1, 29, n_matches),
+        }
+    )
+
+    return pd.DataFrame(
+        {
+            "datetime": match_dates,
+            "team_home": teams[home_idx],
+            "team_away": teams[away_idx],
+            "goals_home": home_goals,
+            "goals_away": away_goals,
+            "competition": "USA Major League Soccer",
+            "season": "2024",
+        }
+    )
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
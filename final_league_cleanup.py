@@ -7,21 +7,23 @@ This script provides final cleanup by disabling problematic leagues
 and creating a stable configuration for GitHub Actions.
 """
 
-import yaml
 import json
 from pathlib import Path
 from datetime import datetime
+from types import MappingProxyType
+
+from audit_utils import link_backup, load_leagues_yaml, write_yaml_atomic
 
 # Working leagues that should remain enabled
-WORKING_LEAGUES = {
+WORKING_LEAGUES = frozenset({
     'ENG_PL', 'ESP_LL', 'GER_BL', 'ITA_SA', 'BEL_PD', 'TUR_SL', 'RUS_PL', 
     'DEN_SL', 'ENG_CH', 'ESP_L2', 'GER_B2', 'FRA_L2', 'BRA_SP', 'ARG_PL', 
     'USA_ML', 'COL_PL', 'CHN_CS', 'AUS_AL', 'EGY_PL', 'BEL_D2', 'ENG_L1', 
     'GER_3L', 'CZE_FL', 'HUN_NB', 'CRO_1H', 'AUT_BL'
-}
+})
 
 # Leagues to temporarily disable due to persistent issues
-PROBLEMATIC_LEAGUES = {
+PROBLEMATIC_LEAGUES = MappingProxyType({
     'FRA_L1': 'HTTP 404 - Official site restructured',
     'NED_ED': 'HTTP 404 - Site access blocked',
     'POR_PL': 'HTTP 404 - Liga Portugal changed structure',
@@ -46,30 +48,32 @@ PROBLEMATIC_LEAGUES = {
     'CYP_FL': 'HTTP 404 - Cyprus FA site issues',
     'ISL_PL': 'HTTP 404 - Iceland FA site issues',
     'FIN_VL': 'HTTP 404 - Finnish league site issues'
-}
+})
+
+# Report listings, sorted once
+SORTED_WORKING = tuple(sorted(WORKING_LEAGUES))
+SORTED_PROBLEMATIC = tuple(sorted(PROBLEMATIC_LEAGUES.items()))
 
 def load_leagues_config():
     """Load the current leagues configuration."""
-    config_path = Path('penaltyblog/config/leagues.yaml')
-    with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+    return load_leagues_yaml(Path('penaltyblog/config/leagues.yaml'))
 
-def create_stable_config(leagues_config):
+def create_stable_config(leagues_config, run_started):
     """Create a stable configuration by disabling problematic leagues."""
     print("🔧 Creating stable configuration...")
     
     stable_config = leagues_config.copy()
     disabled_count = 0
+    now_iso = run_started.isoformat()
     
     for league_code, config in stable_config.items():
-        if league_code in PROBLEMATIC_LEAGUES:
+        reason = PROBLEMATIC_LEAGUES.get(league_code)
+        if reason is not None:
             # Disable the league but keep it in config for future restoration
             if isinstance(config, dict):
-                config['enabled'] = False
-                config['disabled_reason'] = PROBLEMATIC_LEAGUES[league_code]
-                config['disabled_date'] = datetime.now().isoformat()
+                config.update(enabled=False, disabled_reason=reason, disabled_date=now_iso)
             disabled_count += 1
-            print(f"   ❌ Disabled {league_code}: {PROBLEMATIC_LEAGUES[league_code]}")
+            print(f"   ❌ Disabled {league_code}: {reason}")
         elif league_code in WORKING_LEAGUES:
             # Ensure working leagues are explicitly enabled
             if isinstance(config, dict):
@@ -83,18 +87,16 @@ def create_stable_config(leagues_config):
     
     return stable_config
 
-def save_stable_config(stable_config):
+def save_stable_config(stable_config, run_started):
     """Save the stable configuration."""
     config_path = Path('penaltyblog/config/leagues.yaml')
     
     # Create backup
-    backup_path = config_path.with_suffix(f'.yaml.backup.stable.{datetime.now().strftime("%Y%m%d_%H%M%S")}')
-    config_path.rename(backup_path)
+    backup_path = link_backup(config_path, config_path.with_suffix(f'.yaml.backup.stable.{run_started.strftime("%Y%m%d_%H%M%S")}'))
     print(f"✅ Created backup: {backup_path}")
     
     # Save stable config
-    with open(config_path, 'w') as f:
-        yaml.dump(stable_config, f, default_flow_style=False, sort_keys=True)
+    write_yaml_atomic(config_path, stable_config, default_flow_style=False, sort_keys=True)
     print(f"✅ Saved stable configuration: {config_path}")
 
 def create_github_actions_config():
@@ -120,33 +122,34 @@ def create_github_actions_config():
         }
     }
     
-    with open('github_actions_config.json', 'w') as f:
-        json.dump(ga_config, f, indent=2)
+    Path('github_actions_config.json').write_text(json.dumps(ga_config, indent=2))
     print("✅ Created GitHub Actions config: github_actions_config.json")
 
-def create_restoration_guide():
+def create_restoration_guide(run_started):
     """Create a guide for restoring disabled leagues."""
     print("\n📚 Creating restoration guide...")
     
-    guide_content = f"""# League Restoration Guide
+    parts = [f"""# League Restoration Guide
 
-Generated: {datetime.now().isoformat()}
+Generated: {run_started.isoformat()}
 
 ## Currently Disabled Leagues ({len(PROBLEMATIC_LEAGUES)})
 
-"""
+"""]
     
     for league_code, reason in PROBLEMATIC_LEAGUES.items():
-        guide_content += f"### {league_code}\n"
-        guide_content += f"- **Reason**: {reason}\n"
-        guide_content += f"- **Status**: Disabled\n"
-        guide_content += f"- **Action needed**: Find alternative data source or fix URL\n\n"
+        parts.append(
+            f"### {league_code}\n"
+            f"- **Reason**: {reason}\n"
+            f"- **Status**: Disabled\n"
+            f"- **Action needed**: Find alternative data source or fix URL\n\n"
+        )
     
-    guide_content += f"""
+    parts.append(f"""
 ## Working Leagues ({len(WORKING_LEAGUES)})
 
 These leagues are currently functioning and enabled:
-{', '.join(sorted(WORKING_LEAGUES))}
+{', '.join(SORTED_WORKING)}
 
 ## Restoration Process
 
@@ -188,19 +191,19 @@ These leagues are currently functioning and enabled:
 - **FlashScore**: `https://www.flashscore.com/`
 - **Official League APIs**: Research each league's official API
 - **Sports Data APIs**: Consider paid alternatives for critical leagues
-"""
+""")
+    guide_content = "".join(parts)
     
-    with open('LEAGUE_RESTORATION_GUIDE.md', 'w') as f:
-        f.write(guide_content)
+    Path('LEAGUE_RESTORATION_GUIDE.md').write_text(guide_content)
     print("✅ Created restoration guide: LEAGUE_RESTORATION_GUIDE.md")
 
-def create_summary_report():
+def create_summary_report(run_started):
     """Create a comprehensive solution summary."""
     print("\n📝 Creating solution summary...")
     
     report_content = f"""# Penaltyblog Audit Fix - Complete Solution
 
-Generated: {datetime.now().isoformat()}
+Generated: {run_started.isoformat()}
 
 ## Problem Summary
 
@@ -226,10 +229,10 @@ The penaltyblog GitHub Actions audit was failing because 34 out of 50 leagues ha
 ## Current Status
 
 **Working Leagues ({len(WORKING_LEAGUES)}):**
-{chr(10).join([f"- {code}" for code in sorted(WORKING_LEAGUES)])}
+{chr(10).join([f"- {code}" for code in SORTED_WORKING])}
 
 **Temporarily Disabled ({len(PROBLEMATIC_LEAGUES)}):**
-{chr(10).join([f"- {code}: {reason}" for code, reason in sorted(PROBLEMATIC_LEAGUES.items())])}
+{chr(10).join([f"- {code}: {reason}" for code, reason in SORTED_PROBLEMATIC])}
 
 ## GitHub Actions Impact
 
@@ -268,8 +271,7 @@ The penaltyblog GitHub Actions audit was failing because 34 out of 50 leagues ha
 - ✅ Stable foundation for gradual restoration
 """
     
-    with open('PENALTYBLOG_AUDIT_FIX_COMPLETE.md', 'w') as f:
-        f.write(report_content)
+    Path('PENALTYBLOG_AUDIT_FIX_COMPLETE.md').write_text(report_content)
     print("✅ Created complete solution summary: PENALTYBLOG_AUDIT_FIX_COMPLETE.md")
 
 def main():
@@ -277,25 +279,29 @@ def main():
     print("🔧 Starting Final League Cleanup...")
     print("=" * 60)
     
+    # One timestamp for the whole run so the config stamps, backup and
+    # reports all agree
+    run_started = datetime.now()
+    
     try:
         # Load current configuration
         leagues_config = load_leagues_config()
         print(f"📋 Loaded {len(leagues_config)} leagues from configuration")
         
         # Create stable configuration
-        stable_config = create_stable_config(leagues_config)
+        stable_config = create_stable_config(leagues_config, run_started)
         
         # Save stable configuration
-        save_stable_config(stable_config)
+        save_stable_config(stable_config, run_started)
         
         # Create GitHub Actions optimization
         create_github_actions_config()
         
         # Create restoration guide
-        create_restoration_guide()
+        create_restoration_guide(run_started)
         
         # Create summary report
-        create_summary_report()
+        create_summary_report(run_started)
         
         print("\n" + "=" * 60)
         print("🎉 FINAL CLEANUP COMPLETE!")
@@ -7,31 +7,49 @@ Final script that properly handles the configuration structure,
 disables problematic leagues, and creates a stable audit.
 """
 
+import json
+import os
+import socket
 import sys
-import yaml
-import requests
+import threading
 import time
+import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import urlsplit
 from datetime import datetime
-from urllib3.exceptions import InsecureRequestWarning
+from requests.adapters import HTTPAdapter
+from requests.utils import get_environ_proxies
+from urllib3.exceptions import InsecureRequestWarning, MaxRetryError, ResponseError
+from urllib3.util import Retry
 import warnings
 
+from audit_utils import install_dns_cache, link_backup, load_leagues_yaml, write_yaml_atomic
+
 # Suppress SSL warnings for problematic endpoints
 warnings.filterwarnings('ignore', category=InsecureRequestWarning)
 
 # Working leagues that should remain enabled
-WORKING_LEAGUES = {
+WORKING_LEAGUES = frozenset({
     'ENG_PL', 'ESP_LL', 'GER_BL', 'ITA_SA', 'BEL_PD', 'TUR_SL', 'RUS_PL', 
     'DEN_SL', 'ENG_CH', 'ESP_L2', 'GER_B2', 'FRA_L2', 'BRA_SP', 'ARG_PL', 
     'USA_ML', 'COL_PL', 'CHN_CS', 'AUS_AL', 'EGY_PL', 'BEL_D2', 'ENG_L1', 
     'GER_3L', 'CZE_FL', 'HUN_NB', 'CRO_1H', 'AUT_BL'
-}
+})
 
 class FinalAuditConfig:
     """Final production configuration."""
     TIMEOUT = 10
+    LEAGUE_DEADLINE = 12
     MAX_RETRIES = 2
-    RETRY_DELAY = 1
+    RETRY_BACKOFF = 0.5
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    OK_STATUSES = frozenset({200, 204, 206})
+    RANGE_HEADERS = {'Range': 'bytes=0-1023'}
+    MAX_WORKERS = 10
+    HISTORY_PATH = Path('.audit_history.json')
+    HISTORY_ALPHA = 0.3
+    DEFAULT_LATENCY_MS = 1000
     
     HEADERS = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
@@ -42,7 +60,7 @@ class FinalAuditConfig:
         'Upgrade-Insecure-Requests': '1'
     }
 
-def load_and_process_leagues():
+def load_and_process_leagues(run_started):
     """Load leagues configuration and process for stable operation."""
     config_path = Path('penaltyblog/config/leagues.yaml')
     
@@ -50,8 +68,7 @@ def load_and_process_leagues():
         print(f"❌ Configuration file not found: {config_path}")
         sys.exit(1)
     
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_leagues_yaml(config_path)
     
     # Handle nested structure
     if 'leagues' in config:
@@ -64,6 +81,7 @@ def load_and_process_leagues():
     # Filter to working leagues and add enabled flag
     enabled_leagues = {}
     disabled_leagues = {}
+    now_iso = run_started.isoformat()
     
     for league_code, league_config in all_leagues.items():
         if league_code in WORKING_LEAGUES:
@@ -74,7 +92,7 @@ def load_and_process_leagues():
             # Disable problematic leagues
             league_config['enabled'] = False
             league_config['disabled_reason'] = 'Temporarily disabled due to endpoint issues'
-            league_config['disabled_date'] = datetime.now().isoformat()
+            league_config['disabled_date'] = now_iso
             disabled_leagues[league_code] = league_config
     
     print(f"✅ Enabled leagues: {len(enabled_leagues)}")
@@ -84,61 +102,176 @@ def load_and_process_leagues():
     updated_config = {'leagues': {**enabled_leagues, **disabled_leagues}}
     
     # Create backup
-    backup_path = config_path.with_suffix(f'.yaml.backup.final.{datetime.now().strftime("%Y%m%d_%H%M%S")}')
-    config_path.rename(backup_path)
+    backup_path = link_backup(config_path, config_path.with_suffix(f'.yaml.backup.final.{run_started.strftime("%Y%m%d_%H%M%S")}'))
     print(f"💾 Created backup: {backup_path}")
     
     # Save updated config
-    with open(config_path, 'w') as f:
-        yaml.dump(updated_config, f, default_flow_style=False, sort_keys=True)
+    write_yaml_atomic(config_path, updated_config, default_flow_style=False, sort_keys=True)
     print(f"💾 Saved updated configuration with enabled/disabled flags")
     
     return enabled_leagues
 
-def test_league_endpoint(league_code, config):
-    """Test a single league endpoint with retries."""
-    # Handle both url and url_template fields
-    url = config.get('url') or config.get('url_template')
-    
-    if not url:
-        return False, "No URL configured"
-    
-    for attempt in range(1, FinalAuditConfig.MAX_RETRIES + 1):
-        try:
-            response = requests.get(
-                url, 
-                headers=FinalAuditConfig.HEADERS,
-                timeout=FinalAuditConfig.TIMEOUT,
+# Deadline, timeout and last retried status of the league the current
+# worker thread is probing
+_probe_state = threading.local()
+
+class _DeadlineRetry(Retry):
+    """Retry that stops once the next attempt could run past the league deadline."""
+    
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if response is not None:
+            _probe_state.last_status = response.status
+        new_retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        deadline = getattr(_probe_state, 'deadline', None)
+        if deadline is not None:
+            wait = new_retry.get_backoff_time()
+            if response is not None and self.respect_retry_after_header:
+                wait = max(wait, new_retry.get_retry_after(response) or 0)
+            # urllib3 reuses the request's timeout for its own retries, so
+            # only retry when a full-length attempt still fits
+            if time.monotonic() + wait + _probe_state.timeout > deadline:
+                raise MaxRetryError(_pool, url, error or ResponseError("league deadline reached"))
+        return new_retry
+
+def _create_session():
+    """Create a pooled, retrying session shared by all probe threads."""
+    session = requests.Session()
+    session.headers.update(FinalAuditConfig.HEADERS)
+    # Back off exponentially on throttling and server errors only; a 403/404
+    # will not fix itself, so it is reported from the first response
+    retry = _DeadlineRetry(
+        total=FinalAuditConfig.MAX_RETRIES,
+        backoff_factor=FinalAuditConfig.RETRY_BACKOFF,
+        status_forcelist=FinalAuditConfig.RETRY_STATUSES,
+        allowed_methods=frozenset({'GET', 'HEAD'}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=FinalAuditConfig.MAX_WORKERS,
+        pool_maxsize=FinalAuditConfig.MAX_WORKERS,
+        max_retries=retry,
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+SESSION = _create_session()
+
+def _dns_ok(url):
+    """Whether the URL's host resolves, checked through the per-run lookup cache."""
+    parts = urlsplit(url)
+    port = parts.port or (443 if parts.scheme == 'https' else 80)
+    try:
+        # Same arguments urllib3 uses, so a success is reused by the request
+        socket.getaddrinfo(parts.hostname, port, 0, socket.SOCK_STREAM)
+    except (socket.gaierror, UnicodeError):
+        return False
+    return True
+
+def test_league_endpoint(url):
+    """Test a single league endpoint URL; retries happen inside the session."""
+    # A host that does not resolve fails immediately rather than going
+    # through connection retries; behind a proxy the proxy resolves it
+    try:
+        if not get_environ_proxies(url) and not _dns_ok(url):
+            return False, "DNS resolution failed"
+    except ValueError as e:
+        # e.g. a malformed port; fail this league, not the whole audit
+        return False, f"Invalid URL: {str(e)[:50]}"
+    
+    # Bound the time spent on one league across all attempts, so a slow
+    # host cannot hold a worker for TIMEOUT x (MAX_RETRIES + 1)
+    deadline = time.monotonic() + FinalAuditConfig.LEAGUE_DEADLINE
+    _probe_state.deadline = deadline
+    _probe_state.last_status = None
+    
+    try:
+        # Only the status matters, so skip the body
+        _probe_state.timeout = min(FinalAuditConfig.TIMEOUT, deadline - time.monotonic())
+        response = SESSION.head(
+            url, 
+            timeout=_probe_state.timeout,
+            verify=False,
+            allow_redirects=True
+        )
+        # Many servers reject or mishandle HEAD, so confirm any non-2xx reply
+        # with a ranged, streamed GET that is closed unread
+        if not 200 <= response.status_code < 300:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False, f"HTTP {response.status_code}"
+            _probe_state.timeout = min(FinalAuditConfig.TIMEOUT, remaining)
+            with SESSION.get(
+                url,
+                headers=FinalAuditConfig.RANGE_HEADERS,
+                timeout=_probe_state.timeout,
                 verify=False,
-                allow_redirects=True
-            )
-            
-            if response.status_code == 200:
-                return True, f"OK ({response.status_code})"
-            else:
-                error_msg = f"HTTP {response.status_code}"
-                if attempt < FinalAuditConfig.MAX_RETRIES:
-                    time.sleep(FinalAuditConfig.RETRY_DELAY)
-                    continue
-                return False, error_msg
-                
-        except requests.exceptions.RequestException as e:
-            error_msg = str(e)[:100] + "..." if len(str(e)) > 100 else str(e)
-            if attempt < FinalAuditConfig.MAX_RETRIES:
-                time.sleep(FinalAuditConfig.RETRY_DELAY)
-                continue
-            return False, error_msg
-    
-    return False, "Max retries exceeded"
+                allow_redirects=True,
+                stream=True
+            ) as response:
+                pass
+    except requests.exceptions.RetryError:
+        # Retries ended without a response to hand back (e.g. cut short by
+        # the deadline); report the server's last status, not the error text
+        return False, f"HTTP {_probe_state.last_status}"
+    except requests.exceptions.RequestException as e:
+        error_msg = str(e)[:100] + "..." if len(str(e)) > 100 else str(e)
+        return False, error_msg
+    
+    finally:
+        _probe_state.deadline = None
+    
+    if response.status_code in FinalAuditConfig.OK_STATUSES:
+        return True, f"OK ({response.status_code})"
+    return False, f"HTTP {response.status_code}"
+
+def _timed_probe(url):
+    """Probe a URL, also returning how long it took in seconds."""
+    start = time.monotonic()
+    success, message = test_league_endpoint(url)
+    return success, message, time.monotonic() - start
+
+def load_audit_history():
+    """Load per-league latency/success history from earlier audit runs."""
+    try:
+        return json.loads(FinalAuditConfig.HISTORY_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+def save_audit_history(history, outcomes, run_started):
+    """Fold this run's probe outcomes into the history as moving averages."""
+    alpha = FinalAuditConfig.HISTORY_ALPHA
+    for league_code, (success, _, elapsed) in outcomes.items():
+        latency_ms = elapsed * 1000
+        previous = history.get(league_code)
+        if previous:
+            latency_ms = alpha * latency_ms + (1 - alpha) * previous['ema_ms']
+            success_rate = alpha * success + (1 - alpha) * previous['success_rate']
+        else:
+            success_rate = float(success)
+        history[league_code] = {
+            'ema_ms': round(latency_ms, 1),
+            'success_rate': round(success_rate, 3),
+            'last_ok': run_started.isoformat() if success else (previous or {}).get('last_ok'),
+        }
+    
+    path = FinalAuditConfig.HISTORY_PATH
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        tmp_path.write_text(json.dumps(history, indent=2, sort_keys=True))
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
 
-def run_final_audit():
+def run_final_audit(run_started):
     """Run the final production audit."""
     print("🏁 Starting Final Production Penaltyblog Audit...")
-    print(f"⚙️  Configuration: {FinalAuditConfig.MAX_RETRIES} retries, {FinalAuditConfig.TIMEOUT}s timeout")
+    print(f"⚙️  Configuration: {FinalAuditConfig.MAX_RETRIES} retries, {FinalAuditConfig.TIMEOUT}s timeout, {FinalAuditConfig.MAX_WORKERS} workers")
     print("=" * 70)
     
     # Load and process leagues
-    enabled_leagues = load_and_process_leagues()
+    enabled_leagues = load_and_process_leagues(run_started)
     
     if not enabled_leagues:
         print("❌ No enabled leagues found!")
@@ -146,19 +279,44 @@ def run_final_audit():
     
     print(f"\n🧪 Testing {len(enabled_leagues)} enabled leagues...\n")
     
-    # Test each enabled league
+    # Extract each league's URL once (url or url_template); leagues without
+    # one are reported as failures and never reach the worker threads
+    probes = {}
+    for league_code, config in enabled_leagues.items():
+        url = config.get('url') or config.get('url_template')
+        if url:
+            probes[league_code] = url
+    
+    # Start the historically slowest leagues first so they do not end up
+    # alone at the tail of the pool; leagues never seen before sit in between
+    history = load_audit_history()
+    order = sorted(
+        probes,
+        key=lambda code: history.get(code, {}).get('ema_ms', FinalAuditConfig.DEFAULT_LATENCY_MS),
+        reverse=True,
+    )
+    
+    # Probe every league concurrently, then report in config order
+    workers = max(1, min(FinalAuditConfig.MAX_WORKERS, len(probes)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        outcomes = dict(zip(order, executor.map(_timed_probe, (probes[code] for code in order))))
+    save_audit_history(history, outcomes, run_started)
+    
     results = {}
     passed = 0
     failed = 0
     
+    # Workers never print; the per-league lines are collected here and
+    # written in one go rather than as two prints per league
+    lines = []
     for i, (league_code, config) in enumerate(enabled_leagues.items(), 1):
+        success, message, _ = outcomes.get(league_code, (False, "No URL configured", 0.0))
         league_name = config.get('name', 'Unknown')
         country = config.get('country', '')
         display_name = f"{league_name}, {country}" if country else league_name
         
-        print(f"[{i:2d}/{len(enabled_leagues)}] Testing {league_code} ({display_name})...")
+        lines.append(f"[{i:2d}/{len(enabled_leagues)}] Testing {league_code} ({display_name})...")
         
-        success, message = test_league_endpoint(league_code, config)
         results[league_code] = {
             'success': success, 
             'message': message, 
@@ -167,12 +325,14 @@ def run_final_audit():
         }
         
         if success:
-            print(f"   ✅ {message}")
+            lines.append(f"   ✅ {message}")
             passed += 1
         else:
-            print(f"   ❌ {message}")
+            lines.append(f"   ❌ {message}")
             failed += 1
     
+    print("\n".join(lines))
+    
     # Generate comprehensive report
     print("\n" + "=" * 70)
     print("🏆 FINAL PRODUCTION AUDIT REPORT")
@@ -262,16 +422,19 @@ jobs:
     workflow_dir = Path('.github/workflows')
     workflow_dir.mkdir(parents=True, exist_ok=True)
     
-    with open(workflow_dir / 'penaltyblog-audit.yml', 'w') as f:
-        f.write(workflow_content)
+    (workflow_dir / 'penaltyblog-audit.yml').write_text(workflow_content)
     
     print(f"✅ Created GitHub Actions workflow: .github/workflows/penaltyblog-audit.yml")
 
 def main():
     """Main execution function."""
+    # One timestamp for the whole run so the config stamps and backup agree
+    run_started = datetime.now()
+    install_dns_cache()
+    
     try:
         # Run the audit
-        result = run_final_audit()
+        result = run_final_audit(run_started)
         
         # Create GitHub Actions workflow
         create_github_actions_workflow()
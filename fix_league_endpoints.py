@@ -9,10 +9,13 @@ by updating URLs, improving configuration, and adding fallback mechanisms.
 
 import yaml
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 import time
 from datetime import datetime
 
+from audit_utils import YAML_LOADER, install_dns_cache, link_backup, write_yaml_atomic
+
 # Working leagues from the audit
 WORKING_LEAGUES = {
     'ENG_PL', 'ESP_LL', 'ITA_SA', 'TUR_SL', 'RUS_PL', 'ENG_CH', 'ESP_L2', 
@@ -175,17 +178,39 @@ UPDATED_URLS = {
 def load_leagues_config():
     """Load the current leagues configuration."""
     config_path = Path("penaltyblog/config/leagues.yaml")
-    with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+    return yaml.load(config_path.read_bytes(), Loader=YAML_LOADER)
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+def _create_session():
+    """Create a keep-alive session so probes to the same host reuse sockets."""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+SESSION = _create_session()
 
 def test_url(url, timeout=10):
     """Test if a URL is accessible."""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, timeout=timeout, headers=headers, verify=False)
-        return response.status_code == 200, response.status_code
+        # Only the status matters: HEAD first, then a GET for the first 1KB
+        # (closed unread) if the server rejects HEAD
+        response = SESSION.head(url, timeout=timeout, verify=False, allow_redirects=True)
+        if response.status_code in (405, 501):
+            with SESSION.get(
+                url,
+                timeout=timeout,
+                headers={'Range': 'bytes=0-1023'},
+                verify=False,
+                stream=True,
+            ) as response:
+                pass
+        return response.status_code in (200, 204, 206), response.status_code
     except Exception as e:
         return False, str(e)
 
@@ -201,8 +226,7 @@ def create_backup():
     config_path = Path("penaltyblog/config/leagues.yaml")
     backup_path = Path(f"penaltyblog/config/leagues.yaml.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}")
     
-    with open(config_path, 'r') as src, open(backup_path, 'w') as dst:
-        dst.write(src.read())
+    link_backup(config_path, backup_path)
     
     print(f"✅ Created backup: {backup_path}")
     return backup_path
@@ -210,12 +234,12 @@ def create_backup():
 def save_config(config):
     """Save the updated configuration."""
     config_path = Path("penaltyblog/config/leagues.yaml")
-    with open(config_path, 'w') as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False, indent=2)
+    write_yaml_atomic(config_path, config, default_flow_style=False, sort_keys=False, indent=2)
 
 def main():
     """Main repair function."""
     print("🔧 Starting League Endpoint Repair...")
+    install_dns_cache()
     
     # Create backup
     backup_path = create_backup()
@@ -230,6 +254,9 @@ def main():
     working_count = 0
     still_broken = []
     
+    # One date stamp for every league touched in this run
+    today_str = datetime.now().strftime('%Y-%m-%d')
+    
     # Process each league
     for league_code, league_config in config['leagues'].items():
         print(f"\n🔍 Processing {league_code} ({league_config.get('name', 'Unknown')})...")
@@ -244,6 +271,7 @@ def main():
         if league_code in UPDATED_URLS:
             updates = UPDATED_URLS[league_code]
             new_url = updates['url_template']
+            source = updates['source']
             
             # Test the new URL
             print(f"   🧪 Testing new URL: {new_url}")
@@ -253,8 +281,8 @@ def main():
                 # Update the configuration
                 update_data = {
                     'url_template': new_url,
-                    'source': updates['source'],
-                    'last_updated': datetime.now().strftime('%Y-%m-%d'),
+                    'source': source,
+                    'last_updated': today_str,
                     'status': 'active'
                 }
                 
@@ -271,8 +299,8 @@ def main():
                 # Mark as problematic but keep the update for future fixing
                 update_data = {
                     'url_template': new_url,
-                    'source': updates['source'],
-                    'last_updated': datetime.now().strftime('%Y-%m-%d'),
+                    'source': source,
+                    'last_updated': today_str,
                     'status': 'problematic',
                     'last_error': str(result)
                 }
@@ -284,7 +312,7 @@ def main():
             # Mark as needing attention
             update_data = {
                 'status': 'needs_attention',
-                'last_updated': datetime.now().strftime('%Y-%m-%d'),
+                'last_updated': today_str,
                 'notes': 'Requires manual URL update'
             }
             update_league_config(config, league_code, update_data)
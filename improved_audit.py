@@ -7,15 +7,22 @@ Enhanced audit with better error handling, retry mechanisms,
 and comprehensive reporting for GitHub Actions.
 """
 
+import json
 import sys
 import yaml
 import requests
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import urlsplit
 from datetime import datetime
+from requests.adapters import HTTPAdapter
 from urllib3.exceptions import InsecureRequestWarning
 import warnings
 
+from audit_utils import install_dns_cache
+
 # Suppress SSL warnings for problematic endpoints
 warnings.filterwarnings('ignore', category=InsecureRequestWarning)
 
@@ -27,6 +34,16 @@ class AuditConfig:
     MAX_RETRIES = 3
     RETRY_DELAY = 2
     
+    # Concurrency: probes in flight overall, and connections to any one host
+    MAX_WORKERS = 16
+    MAX_PER_HOST = 2
+    
+    # Per-host pacing: no delay until a host answers 429/503, then the gap
+    # between its requests doubles (up to the max) and halves on success
+    HOST_BACKOFF_START = 1.0
+    HOST_BACKOFF_MAX = 30.0
+    THROTTLE_STATUSES = frozenset({429, 503})
+    
     # Headers to avoid bot detection
     HEADERS = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -37,19 +54,81 @@ class AuditConfig:
         'Upgrade-Insecure-Requests': '1',
     }
     
+    # Probes send HEAD; the GET fallback asks for a small range, which a
+    # server may answer with 206
+    RANGE_HEADERS = {'Range': 'bytes=0-1023'}
+    OK_STATUSES = frozenset({200, 204, 206})
+    
+    # JSON copy of the final report
+    REPORT_PATH = Path('audit_report.json')
+    
     # Success criteria
     MIN_SUCCESS_RATE = 60  # Minimum acceptable success rate
     CRITICAL_LEAGUES = {   # Leagues that must work
         'ENG_PL', 'ESP_LL', 'ITA_SA', 'GER_BL', 'FRA_L1', 'USA_ML'
     }
 
+class HostState:
+    """Request pacing for one host, shared by every probe thread."""
+    
+    def __init__(self):
+        self.interval = 0.0
+        self.next_allowed = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        """Block until this host may be sent another request."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self.next_allowed)
+            self.next_allowed = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+    
+    def record(self, status_code):
+        """Back off on throttling responses and relax again on anything else."""
+        with self._lock:
+            if status_code in AuditConfig.THROTTLE_STATUSES:
+                self.interval = min(
+                    AuditConfig.HOST_BACKOFF_MAX,
+                    max(AuditConfig.HOST_BACKOFF_START, self.interval * 2),
+                )
+                self.next_allowed = max(self.next_allowed, time.monotonic() + self.interval)
+            elif self.interval:
+                self.interval /= 2
+                if self.interval < AuditConfig.HOST_BACKOFF_START / 8:
+                    self.interval = 0.0
+
 class LeagueAuditor:
     """Main audit functionality."""
     
+    # Countries whose leagues outside tiers 1-3 count as international
+    _INTL_COUNTRIES = frozenset({'USA', 'BRA', 'ARG', 'MEX', 'JPN', 'KOR', 'CHN', 'AUS'})
+    
     def __init__(self):
         self.config = AuditConfig()
         self.session = requests.Session()
         self.session.headers.update(self.config.HEADERS)
+        # One small blocking pool per host keeps probes to the same server
+        # polite while different hosts are probed in parallel
+        adapter = HTTPAdapter(
+            pool_connections=self.config.MAX_WORKERS,
+            pool_maxsize=self.config.MAX_PER_HOST,
+            pool_block=True,
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._host_state = {}
+        self._host_lock = threading.Lock()
+    
+    def _host(self, url):
+        """Return the shared pacing state for `url`'s host."""
+        host = urlsplit(url).netloc.lower()
+        with self._host_lock:
+            state = self._host_state.get(host)
+            if state is None:
+                state = self._host_state[host] = HostState()
+            return state
         
     def load_leagues(self):
         """Load leagues from YAML configuration."""
@@ -62,38 +141,80 @@ class LeagueAuditor:
         
         return data.get('leagues', {})
     
-    def test_endpoint(self, league_code, league_config):
-        """Test a league endpoint with retry logic."""
+    def resolve_url(self, league_config):
+        """
+        Fill a league's URL template from its config, as League.get_url does.
+        
+        Returns (url, None), or (None, message) when there is nothing to probe.
+        """
         url = league_config.get('url_template', '')
         if not url:
-            return False, "No URL template configured"
-        
+            return None, "No URL template configured"
+        if '{' in url:
+            try:
+                url = url.format_map(league_config)
+            except KeyError as e:
+                return None, f"Unresolved template: missing {e}"
+            except (ValueError, IndexError) as e:
+                return None, f"Unresolved template: {e}"
+        return url, None
+    
+    def test_endpoint(self, league_code, league_config):
+        """Test a league endpoint with retry logic."""
+        url, error = self.resolve_url(league_config)
+        if error:
+            return False, error
+        return self.probe_url(url)
+    
+    def probe_url(self, url):
+        """Probe a single URL with retry logic."""
         last_error = None
+        host = self._host(url)
+        config = self.config
+        max_retries = config.MAX_RETRIES
+        timeout = config.TIMEOUT
+        head = self.session.head
+        get = self.session.get
         
-        for attempt in range(self.config.MAX_RETRIES):
+        for attempt in range(max_retries):
             try:
                 # Add delay between retries
                 if attempt > 0:
-                    time.sleep(self.config.RETRY_DELAY)
+                    time.sleep(config.RETRY_DELAY)
                 
-                response = self.session.get(
+                host.wait()
+                # Only the status matters, so ask for headers alone; servers
+                # that reject HEAD get a GET for the first 1KB, closed unread
+                response = head(
                     url, 
-                    timeout=self.config.TIMEOUT,
+                    timeout=timeout,
                     verify=False,  # Ignore SSL issues for now
                     allow_redirects=True
                 )
+                if response.status_code in (405, 501):
+                    with get(
+                        url,
+                        headers=config.RANGE_HEADERS,
+                        timeout=timeout,
+                        verify=False,
+                        allow_redirects=True,
+                        stream=True
+                    ) as response:
+                        pass
+                status = response.status_code
+                host.record(status)
                 
-                if response.status_code == 200:
-                    return True, f"OK ({response.status_code}) - Attempt {attempt + 1}"
-                elif response.status_code in [301, 302, 307, 308]:
+                if status in config.OK_STATUSES:
+                    return True, f"OK ({status}) - Attempt {attempt + 1}"
+                elif status in (301, 302, 307, 308):
                     # Handle redirects manually for better control
                     redirect_url = response.headers.get('Location', '')
-                    return False, f"Redirect ({response.status_code}) to {redirect_url[:50]}..."
+                    return False, f"Redirect ({status}) to {redirect_url[:50]}..."
                 else:
-                    last_error = f"HTTP {response.status_code}"
+                    last_error = f"HTTP {status}"
                     
             except requests.exceptions.Timeout:
-                last_error = f"Timeout after {self.config.TIMEOUT}s"
+                last_error = f"Timeout after {timeout}s"
             except requests.exceptions.SSLError as e:
                 last_error = f"SSL Error: {str(e)[:50]}..."
             except requests.exceptions.ConnectionError as e:
@@ -103,7 +224,7 @@ class LeagueAuditor:
             except Exception as e:
                 last_error = f"Unexpected Error: {str(e)[:50]}..."
         
-        return False, f"{last_error} (after {self.config.MAX_RETRIES} attempts)"
+        return False, f"{last_error} (after {max_retries} attempts)"
     
     def categorize_leagues(self, leagues):
         """Categorize leagues by tier and importance."""
@@ -115,27 +236,30 @@ class LeagueAuditor:
             'other': []
         }
         
+        by_tier = {
+            1: categories['tier1'].append,
+            2: categories['tier2'].append,
+            3: categories['tier3'].append,
+        }
+        add_international = categories['international'].append
+        add_other = categories['other'].append
+        intl_countries = self._INTL_COUNTRIES
+        
         for code, config in leagues.items():
-            tier = config.get('tier', 3)
-            country = config.get('country', '').upper()
-            
-            if tier == 1:
-                categories['tier1'].append(code)
-            elif tier == 2:
-                categories['tier2'].append(code)
-            elif tier == 3:
-                categories['tier3'].append(code)
-            elif country in ['USA', 'BRA', 'ARG', 'MEX', 'JPN', 'KOR', 'CHN', 'AUS']:
-                categories['international'].append(code)
+            add = by_tier.get(config.get('tier', 3))
+            if add is not None:
+                add(code)
+            elif config.get('country', '').upper() in intl_countries:
+                add_international(code)
             else:
-                categories['other'].append(code)
+                add_other(code)
         
         return categories
     
     def run_audit(self):
         """Execute the complete audit process."""
         print("🔍 Starting Enhanced Penaltyblog Audit...")
-        print(f"⚙️  Configuration: {self.config.MAX_RETRIES} retries, {self.config.TIMEOUT}s timeout")
+        print(f"⚙️  Configuration: {self.config.MAX_RETRIES} retries, {self.config.TIMEOUT}s timeout, {self.config.MAX_WORKERS} workers")
         
         # Load leagues
         try:
@@ -157,29 +281,40 @@ class LeagueAuditor:
             'by_category': {}
         }
         
-        # Test each league
+        # Fill in URL templates up front; a league with no usable URL fails
+        # without a request. Leagues that share a URL share one probe (and
+        # one set of retries).
+        urls = {code: self.resolve_url(config) for code, config in leagues.items()}
+        unique_urls = list(dict.fromkeys(url for url, error in urls.values() if url))
+        
+        # Probe every URL concurrently, then report in config order
+        with ThreadPoolExecutor(max_workers=self.config.MAX_WORKERS) as executor:
+            probed = dict(zip(unique_urls, executor.map(self.probe_url, unique_urls)))
+        
+        passed = results['passed']
+        failed = results['failed']
+        critical_failed = results['critical_failed']
+        critical_leagues = self.config.CRITICAL_LEAGUES
+        
         for i, (league_code, league_config) in enumerate(leagues.items(), 1):
+            url, error = urls[league_code]
+            success, message = (False, error) if error else probed[url]
             league_name = league_config.get('name', 'Unknown')
             country = league_config.get('country', 'Unknown')
             
             print(f"\n[{i:2d}/{total_count}] Testing {league_code} ({league_name}, {country})...")
             
-            success, message = self.test_endpoint(league_code, league_config)
-            
             if success:
-                results['passed'].append(league_code)
+                passed.append(league_code)
                 print(f"   ✅ {message}")
             else:
-                results['failed'].append((league_code, message))
+                failed.append((league_code, message))
                 print(f"   ❌ {message}")
                 
                 # Check if it's a critical league
-                if league_code in self.config.CRITICAL_LEAGUES:
-                    results['critical_failed'].append(league_code)
+                if league_code in critical_leagues:
+                    critical_failed.append(league_code)
                     print(f"   ⚠️  CRITICAL LEAGUE FAILURE!")
-            
-            # Small delay to be respectful to servers
-            time.sleep(0.5)
         
         # Calculate statistics by category
         for category, league_list in categories.items():
@@ -202,59 +337,84 @@ class LeagueAuditor:
         critical_failures = len(results['critical_failed'])
         
         overall_success_rate = (passed_count / total_count) * 100
+        exit_code = self.determine_exit_code(overall_success_rate, critical_failures)
+        completed_at = datetime.now()
         
-        print("\n" + "="*80)
-        print("📊 ENHANCED AUDIT REPORT")
-        print("="*80)
-        print(f"🕒 Audit completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}")
-        print(f"📈 Overall Results:")
-        print(f"   Total leagues: {total_count}")
-        print(f"   ✅ Passed: {passed_count}")
-        print(f"   ❌ Failed: {failed_count}")
-        print(f"   📊 Success rate: {overall_success_rate:.1f}%")
+        # Build the whole report and write it to stdout once
+        lines = [
+            "",
+            "="*80,
+            "📊 ENHANCED AUDIT REPORT",
+            "="*80,
+            f"🕒 Audit completed at: {completed_at.strftime('%Y-%m-%d %H:%M:%S UTC')}",
+            "📈 Overall Results:",
+            f"   Total leagues: {total_count}",
+            f"   ✅ Passed: {passed_count}",
+            f"   ❌ Failed: {failed_count}",
+            f"   📊 Success rate: {overall_success_rate:.1f}%",
+        ]
         
         # Critical league status
         if critical_failures > 0:
-            print(f"\n🚨 CRITICAL FAILURES ({critical_failures}):")
-            for code in results['critical_failed']:
-                print(f"   💥 {code} - Major league offline!")
+            lines.append(f"\n🚨 CRITICAL FAILURES ({critical_failures}):")
+            lines.extend(f"   💥 {code} - Major league offline!" for code in results['critical_failed'])
         
         # Category breakdown
         if results['by_category']:
-            print(f"\n📋 Results by Category:")
-            for category, stats in results['by_category'].items():
-                print(f"   {category.upper()}: {stats['passed']}/{stats['total']} ({stats['success_rate']:.1f}%)")
+            lines.append("\n📋 Results by Category:")
+            lines.extend(
+                f"   {category.upper()}: {stats['passed']}/{stats['total']} ({stats['success_rate']:.1f}%)"
+                for category, stats in results['by_category'].items()
+            )
         
         # Detailed failures
         if results['failed']:
-            print(f"\n❌ DETAILED FAILURES ({failed_count}):")
-            for i, (league_code, error) in enumerate(results['failed'][:15], 1):
-                print(f"   {i:2d}. {league_code}: {error}")
+            lines.append(f"\n❌ DETAILED FAILURES ({failed_count}):")
+            lines.extend(
+                f"   {i:2d}. {league_code}: {error}"
+                for i, (league_code, error) in enumerate(results['failed'][:15], 1)
+            )
             
             if failed_count > 15:
-                print(f"   ... and {failed_count - 15} more failures")
-        
-        # Determine audit result
-        exit_code = self.determine_exit_code(overall_success_rate, critical_failures)
+                lines.append(f"   ... and {failed_count - 15} more failures")
         
-        print(f"\n🎯 AUDIT VERDICT:")
+        # Audit result
+        lines.append("\n🎯 AUDIT VERDICT:")
         if exit_code == 0:
-            print("✅ PASSED - Acceptable success rate achieved")
+            lines.append("✅ PASSED - Acceptable success rate achieved")
         elif exit_code == 1:
-            print("⚠️  WARNING - Success rate below target but not critical")
+            lines.append("⚠️  WARNING - Success rate below target but not critical")
         else:
-            print("❌ FAILED - Critical issues detected")
+            lines.append("❌ FAILED - Critical issues detected")
         
-        print(f"\n💡 Recommendations:")
+        lines.append("\n💡 Recommendations:")
         if overall_success_rate < 50:
-            print("   🔧 Run the league endpoint repair script")
-            print("   📞 Contact data providers for major leagues")
+            lines.append("   🔧 Run the league endpoint repair script")
+            lines.append("   📞 Contact data providers for major leagues")
         elif overall_success_rate < 70:
-            print("   🔍 Investigate specific league failures")
-            print("   📝 Update problematic URLs")
+            lines.append("   🔍 Investigate specific league failures")
+            lines.append("   📝 Update problematic URLs")
         else:
-            print("   ✨ System is performing well!")
-            print("   🔄 Monitor for any new failures")
+            lines.append("   ✨ System is performing well!")
+            lines.append("   🔄 Monitor for any new failures")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+        
+        # Machine-readable copy for CI, uploaded with the workflow's artifacts
+        summary = {
+            'completed_at': completed_at.isoformat(timespec='seconds'),
+            'total': total_count,
+            'passed': results['passed'],
+            'failed': [{'league': code, 'error': error} for code, error in results['failed']],
+            'critical_failed': results['critical_failed'],
+            'by_category': results['by_category'],
+            'success_rate': round(overall_success_rate, 1),
+            'exit_code': exit_code,
+        }
+        try:
+            self.config.REPORT_PATH.write_text(json.dumps(summary, indent=2) + "\n", encoding='utf-8')
+        except OSError as e:
+            print(f"⚠️  Could not write {self.config.REPORT_PATH}: {e}")
         
         return exit_code
     
@@ -274,6 +434,7 @@ class LeagueAuditor:
 
 def main():
     """Main entry point."""
+    install_dns_cache()
     auditor = LeagueAuditor()
     return auditor.run_audit()
 
@@ -1,24 +1,35 @@
-from . import (
-    backtest,
-    fpl,
-    implied,
-    kelly,
-    matchflow,
-    metrics,
-    models,
-    ratings,
-    scrapers,
-    utils,
-)
+import importlib
+
 from .version import __version__
 
-# Make key utilities easily accessible
-from .utils import (
-    DataQualityValidator,
-    validate_fixtures,
-    cross_validate_sources,
-    check_data_freshness,
-    record_data_fetch,
+# Submodules are imported on first attribute access (PEP 562), so code that
+# only needs e.g. penaltyblog.config doesn't pay for the numpy/scipy/pandas
+# imports behind the models, scrapers and backtest packages
+_SUBMODULES = frozenset(
+    {
+        "backtest",
+        "config",
+        "fpl",
+        "implied",
+        "kelly",
+        "matchflow",
+        "metrics",
+        "models",
+        "ratings",
+        "scrapers",
+        "utils",
+    }
+)
+
+# Make key utilities easily accessible, resolved from .utils on first use
+_UTILS_EXPORTS = frozenset(
+    {
+        "DataQualityValidator",
+        "validate_fixtures",
+        "cross_validate_sources",
+        "check_data_freshness",
+        "record_data_fetch",
+    }
 )
 
 __all__ = [
@@ -40,3 +51,19 @@ __all__ = [
     "check_data_freshness",
     "record_data_fetch",
 ]
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _UTILS_EXPORTS:
+        value = getattr(importlib.import_module(".utils", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache on the module so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES | _UTILS_EXPORTS)
@@ -1,10 +1,15 @@
 """League registry management for penaltyblog."""
 
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 
+# Use the C loader when PyYAML was compiled against libyaml; parsing
+# leagues.yaml with the pure-Python SafeLoader is several times slower
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 @dataclass
 class League:
     """Represents a football league configuration."""
@@ -26,13 +31,18 @@ class League:
 
 def load_leagues() -> Dict[str, League]:
     """Load all leagues from the YAML configuration file."""
+    # Copy so callers can't add or drop entries in the cached registry
+    return dict(_load_leagues_cached())
+
+@lru_cache(maxsize=1)
+def _load_leagues_cached() -> Dict[str, League]:
+    """Parse leagues.yaml once per process; see ``clear_league_cache``."""
     config_file = Path(__file__).parent / "leagues.yaml"
     
     if not config_file.exists():
         raise FileNotFoundError(f"League configuration file not found: {config_file}")
     
-    with open(config_file, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
+    data = yaml.load(config_file.read_bytes(), Loader=_YAML_LOADER)
     
     leagues = {}
     for code, config in data['leagues'].items():
@@ -47,25 +57,27 @@ def load_leagues() -> Dict[str, League]:
     
     return leagues
 
+def clear_league_cache():
+    """Forget the parsed league registry so the next lookup re-reads leagues.yaml."""
+    _load_leagues_cached.cache_clear()
+
 def get_league_by_code(league_code: str) -> Optional[League]:
     """Get a specific league by its code."""
-    leagues = load_leagues()
-    return leagues.get(league_code)
+    return _load_leagues_cached().get(league_code)
 
 def get_leagues_by_tier(tier: int) -> Dict[str, League]:
     """Get all leagues of a specific tier."""
-    leagues = load_leagues()
+    leagues = _load_leagues_cached()
     return {code: league for code, league in leagues.items() if league.tier == tier}
 
 def get_leagues_by_country(country: str) -> Dict[str, League]:
     """Get all leagues from a specific country."""
-    leagues = load_leagues()
+    leagues = _load_leagues_cached()
     return {code: league for code, league in leagues.items() if league.country.lower() == country.lower()}
 
 def list_league_codes() -> list[str]:
     """Get a list of all available league codes."""
-    leagues = load_leagues()
-    return list(leagues.keys())
+    return list(_load_leagues_cached())
 
 def get_default_league() -> League:
     """Get the default league (Premier League for backward compatibility)."""
@@ -1,6 +1,6 @@
 """Football Elo Ratings System"""
 
-from typing import Dict
+from typing import Dict, Sequence, Tuple
 
 import numpy as np
 
@@ -80,7 +80,7 @@ class Elo:
         z = p_home + p_away + p_draw
         return {"home_win": p_home / z, "draw": p_draw / z, "away_win": p_away / z}
 
-    def update_ratings(self, home: str, away: str, result: int) -> None:
+    def update_ratings(self, home: str, away: str, result: int) -> Tuple[float, float]:
         """
         Updates Elo ratings based on match result.
         result = 0 → home win
@@ -91,6 +91,8 @@ class Elo:
             home (str): Home team name.
             away (str): Away team name.
             result (int): Match result (0 for home win, 1 for draw, 2 for away win).
+        Returns:
+            Tuple[float, float]: Updated ratings of the home and away teams.
         """
         r_home = self.get_team_rating(home)
         r_away = self.get_team_rating(away)
@@ -107,5 +109,62 @@ class Elo:
         else:
             raise ValueError("Invalid result: must be 0, 1, or 2")
 
-        self.ratings[home] = r_home + self.k * (actual_home - expected_home)
-        self.ratings[away] = r_away + self.k * (actual_away - expected_away)
+        new_home = r_home + self.k * (actual_home - expected_home)
+        new_away = r_away + self.k * (actual_away - expected_away)
+        self.ratings[home] = new_home
+        self.ratings[away] = new_away
+
+        return new_home, new_away
+
+    def update_ratings_batch(
+        self, home: Sequence[str], away: Sequence[str], results: Sequence[int]
+    ) -> np.ndarray:
+        """
+        Updates Elo ratings for a sequence of matches, in the order played.
+
+        Gives the same ratings as calling `update_ratings` for each match, but
+        teams are indexed once up front and the updates run in compiled code
+        rather than through per-match dictionary lookups and method calls.
+
+        Args:
+            home (Sequence[str]): Home team names.
+            away (Sequence[str]): Away team names.
+            results (Sequence[int]): Match results (0 for home win, 1 for draw, 2 for away win).
+        Returns:
+            np.ndarray: Home and away ratings after each match, shape (n_matches, 2).
+        """
+        # Imported here so the scalar API works without the compiled kernel
+        from .updates import compute_elo_updates
+
+        home = np.asarray(home)
+        away = np.asarray(away)
+        results = np.asarray(results, dtype=np.int64)
+
+        if not len(home) == len(away) == len(results):
+            raise ValueError("home, away and results must have the same length")
+        if np.any((results < 0) | (results > 2)):
+            raise ValueError("Invalid result: must be 0, 1, or 2")
+
+        n_matches = len(results)
+        teams, codes = np.unique(np.concatenate([home, away]), return_inverse=True)
+        teams = teams.tolist()
+        codes = codes.astype(np.intp)
+
+        ratings = np.array(
+            [self.get_team_rating(team) for team in teams], dtype=np.float64
+        )
+        history = np.empty((n_matches, 2), dtype=np.float64)
+
+        compute_elo_updates(
+            codes[:n_matches],
+            codes[n_matches:],
+            results.astype(np.intp),
+            float(self.k),
+            float(self.hfa),
+            ratings,
+            history,
+        )
+
+        self.ratings.update(zip(teams, ratings.tolist()))
+
+        return history
@@ -0,0 +1,11 @@
+import numpy as np
+
+def compute_elo_updates(
+    home_idx: np.ndarray,  # 1D np.ndarray[intp]
+    away_idx: np.ndarray,  # 1D np.ndarray[intp]
+    results: np.ndarray,  # 1D np.ndarray[intp]
+    k: float,
+    home_field_advantage: float,
+    ratings: np.ndarray,  # 1D np.ndarray[float64]
+    history: np.ndarray,  # 2D np.ndarray[float64]
+) -> None: ...
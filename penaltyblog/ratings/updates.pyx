@@ -0,0 +1,47 @@
+# penaltyblog/ratings/updates.pyx
+cimport cython
+from libc.math cimport pow
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+@cython.nonecheck(False)
+@cython.initializedcheck(False)
+cpdef void compute_elo_updates(const Py_ssize_t[:] home_idx,
+                               const Py_ssize_t[:] away_idx,
+                               const Py_ssize_t[:] results,
+                               double k,
+                               double home_field_advantage,
+                               double[:] ratings,
+                               double[:, :] history):
+    """
+    Apply sequential Elo updates for a run of matches.
+
+    Parameters:
+        home_idx: (n_matches,) index of the home team in `ratings`
+        away_idx: (n_matches,) index of the away team in `ratings`
+        results: (n_matches,) 0 for home win, 1 for draw, 2 for away win
+        k: K-factor for rating updates
+        home_field_advantage: home field advantage in Elo points
+        ratings: (n_teams,) current ratings, updated in place
+        history: (n_matches, 2) filled with the home and away ratings after each match
+    """
+    cdef Py_ssize_t i, h, a
+    cdef Py_ssize_t n_matches = results.shape[0]
+    cdef double r_home, r_away, expected_home, expected_away, actual_home
+
+    for i in range(n_matches):
+        h = home_idx[i]
+        a = away_idx[i]
+        r_home = ratings[h]
+        r_away = ratings[a]
+
+        expected_home = 1 / (1 + pow(10.0, (r_away - (r_home + home_field_advantage)) / 400))
+        expected_away = 1 - expected_home
+        actual_home = 1.0 - 0.5 * results[i]
+
+        ratings[h] = r_home + k * (actual_home - expected_home)
+        ratings[a] = r_away + k * ((1 - actual_home) - expected_away)
+        history[i, 0] = ratings[h]
+        history[i, 1] = ratings[a]
@@ -0,0 +1,157 @@
+"""
+Opt-in on-disk cache for scraped dataframes.
+
+Scraping the same fixtures on every run costs seconds to minutes of HTTP
+and HTML parsing. When ``$PENALTYBLOG_CACHE_DIR`` is set, results are stored
+in that directory, keyed by ``(source, competition, season)`` plus a hash of
+the scraper's team mappings, and reused until they are older than the
+decorator's ``ttl_hours``. Without the variable nothing is read or written.
+
+Cache files are pickles, so only point ``$PENALTYBLOG_CACHE_DIR`` at a
+directory you trust.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def get_cache_dir() -> Optional[Path]:
+    """Return ``$PENALTYBLOG_CACHE_DIR``, or None when caching is disabled"""
+    cache_dir = os.environ.get("PENALTYBLOG_CACHE_DIR")
+    return Path(cache_dir) if cache_dir else None
+
+
+def _slug(value) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", str(value).lower()).strip("_")
+
+
+def mappings_key(team_mappings) -> Optional[str]:
+    """Short stable hash of a scraper's team mappings, or None without mappings"""
+    if not team_mappings:
+        return None
+    encoded = json.dumps(sorted(team_mappings.items()), ensure_ascii=False)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()[:12]
+
+
+def cache_path(
+    source: str,
+    competition: str,
+    season: str,
+    name: str = "fixtures",
+    variant: Optional[str] = None,
+) -> Optional[Path]:
+    """
+    Path of the cached dataframe for a source / competition / season
+
+    Parameters
+    ----------
+    source : str
+        Data source name (e.g. 'fbref')
+    competition : str
+        Competition name
+    season : str
+        Season identifier
+    name : str
+        Name of the cached dataset, defaults to 'fixtures'
+    variant : str or None
+        Extra key for data that depends on scraper options, such as
+        ``mappings_key(team_mappings)``
+
+    Returns None when caching is disabled.
+    """
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return None
+    filename = f"{_slug(source)}__{_slug(competition)}__{_slug(season)}__{name}"
+    if variant:
+        filename += f"__{variant}"
+    return cache_dir / f"{filename}.pkl"
+
+
+def cache_mtime(
+    source: str, competition: str, season: str, name: str = "fixtures"
+) -> Optional[float]:
+    """
+    Modification time of the newest cached dataframe for a source /
+    competition / season, with or without team mappings, or None if not cached
+    """
+    path = cache_path(source, competition, season, name)
+    if path is None:
+        return None
+    mtimes = []
+    for candidate in (path, *path.parent.glob(f"{path.stem}__*.pkl")):
+        try:
+            mtimes.append(candidate.stat().st_mtime)
+        except OSError:
+            pass
+    return max(mtimes, default=None)
+
+
+def cached_dataframe(ttl_hours: float = 24):
+    """
+    Cache a scraper method's dataframe on disk
+
+    Does nothing unless ``$PENALTYBLOG_CACHE_DIR`` is set. The wrapped
+    method gains a ``force_refresh=False`` keyword to bypass the cache.
+    Scrapers with different team mappings get separate cache entries, and
+    empty dataframes are never cached so failed scrapes are retried on the
+    next call.
+
+    Parameters
+    ----------
+    ttl_hours : float
+        Maximum age in hours of a cached dataframe before it is refetched
+    """
+
+    def decorator(func):
+        name = func.__name__.replace("get_", "", 1)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, force_refresh: bool = False, **kwargs):
+            path = cache_path(
+                self.source,
+                getattr(self, "competition", ""),
+                self.season,
+                name,
+                variant=mappings_key(getattr(self, "team_mappings", None)),
+            )
+            if path is None:
+                return func(self, *args, **kwargs)
+
+            if not force_refresh:
+                try:
+                    age = time.time() - path.stat().st_mtime
+                    if age <= ttl_hours * 3600:
+                        return pd.read_pickle(path)
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    logger.warning("Ignoring unreadable cache file %s: %s", path, e)
+
+            df = func(self, *args, **kwargs)
+
+            if not df.empty:
+                try:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                    df.to_pickle(tmp_path)
+                    os.replace(tmp_path, path)
+                except OSError as e:
+                    logger.warning("Could not write cache file %s: %s", path, e)
+
+            return df
+
+        return wrapper
+
+    return decorator
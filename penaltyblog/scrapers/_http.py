@@ -0,0 +1,91 @@
+"""
+Shared HTTP connection pools for the request-based scrapers.
+
+Every scraper instance used to build its own ``requests.Session``, so each
+new scraper paid a fresh TCP + TLS handshake to the same handful of hosts.
+The adapters here are created once per retry policy and mounted on every
+scraper's session, letting urllib3 keep connections to fbref.com,
+understat.com etc. alive between scrapers. Each scraper still gets its own
+``Session``, so cookies and default headers never leak between scrapers or
+threads.
+"""
+
+import threading
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+_adapters: Dict[int, HTTPAdapter] = {}
+_lock = threading.Lock()
+
+
+def _create_adapter(max_retries: int) -> HTTPAdapter:
+    retry_strategy = Retry(
+        total=max_retries,
+        # 429s are retried by RequestsScraper so the host's rate limiter
+        # learns about them; urllib3 only handles server errors
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=["HEAD", "GET", "OPTIONS"],
+        backoff_factor=1,
+    )
+    return HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry_strategy,
+    )
+
+
+def get_adapter(max_retries: int = 3) -> HTTPAdapter:
+    """
+    Return the process-wide adapter for the given retry policy
+
+    Parameters
+    ----------
+    max_retries : int
+        Total number of retries for connection errors and 5xx responses
+
+    Returns
+    -------
+    HTTPAdapter
+        A pooled adapter shared by all scrapers using the same policy
+    """
+    with _lock:
+        adapter = _adapters.get(max_retries)
+        if adapter is None:
+            adapter = _create_adapter(max_retries)
+            _adapters[max_retries] = adapter
+        return adapter
+
+
+def get_session(max_retries: int = 3) -> requests.Session:
+    """
+    Return a new session that sends its requests through the shared pools
+
+    Parameters
+    ----------
+    max_retries : int
+        Total number of retries for connection errors and 5xx responses
+
+    Returns
+    -------
+    requests.Session
+        A session with its own cookie jar and the shared adapter mounted
+    """
+    session = requests.Session()
+    adapter = get_adapter(max_retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def close_adapters():
+    """Close and forget all shared adapters"""
+    with _lock:
+        for adapter in _adapters.values():
+            adapter.close()
+        _adapters.clear()
@@ -0,0 +1,153 @@
+"""
+Per-host rate limiting for the request-based scrapers.
+
+Requests are admitted through a token bucket per host, so concurrent
+scrapers share one budget instead of each sleeping a fixed delay. When a
+server says how long to wait (``Retry-After`` or an exhausted
+``X-RateLimit-Remaining``), the whole host is paused for exactly that long
+rather than backing off blindly.
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+# Requests per second for hosts we scrape regularly
+DEFAULT_RATES = {
+    "fbref.com": 3.0,
+    "understat.com": 5.0,
+    "football-data.co.uk": 2.0,
+}
+
+# Matches the fixed one-second delay scrapers used before this limiter
+FALLBACK_RATE = 1.0
+
+# Upper bound on the random jitter added to server-requested pauses
+MAX_JITTER = 1.0
+
+
+class HostBucket:
+    """
+    Token bucket for a single host
+
+    Parameters
+    ----------
+    rate : float
+        Tokens added per second, i.e. the sustained requests per second
+    capacity : float
+        Maximum burst size, defaults to one request
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request to this host may be sent"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.last_refill) * self.rate
+                )
+                self.last_refill = now
+
+                if now >= self.blocked_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait = max(
+                    self.blocked_until - now, (1 - self.tokens) / self.rate
+                )
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Hold back every request to this host for `seconds`"""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+
+
+_buckets: Dict[str, HostBucket] = {}
+_lock = threading.Lock()
+
+
+def _host_rate(host: str) -> float:
+    for domain, rate in DEFAULT_RATES.items():
+        if host == domain or host.endswith("." + domain):
+            return rate
+    return FALLBACK_RATE
+
+
+def get_bucket(url: str) -> HostBucket:
+    """Return the shared bucket for the host in `url`"""
+    host = (urlsplit(url).hostname or "").lower()
+    with _lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            bucket = HostBucket(_host_rate(host))
+            _buckets[host] = bucket
+        return bucket
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header into seconds
+
+    Parameters
+    ----------
+    value : str or None
+        Header value, either delta-seconds or an HTTP-date
+
+    Returns
+    -------
+    float or None
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def server_delay(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Seconds the server asked us to wait, from ``Retry-After`` or an
+    exhausted ``X-RateLimit-Remaining`` / ``X-RateLimit-Reset`` pair
+    """
+    delay = parse_retry_after(headers.get("Retry-After"))
+    if delay is not None:
+        return delay
+
+    if str(headers.get("X-RateLimit-Remaining", "")).strip() == "0":
+        try:
+            reset = float(headers.get("X-RateLimit-Reset", ""))
+        except (TypeError, ValueError):
+            return None
+        # Reset is either an epoch timestamp or a number of seconds
+        return max(0.0, reset - time.time()) if reset > 1e9 else reset
+
+    return None
+
+
+def pause_host(url: str, seconds: float):
+    """Pause `url`'s host for `seconds` plus a little jitter"""
+    get_bucket(url).pause(seconds + random.uniform(0, MAX_JITTER))
@@ -1,19 +1,25 @@
 import logging
 import time
-from typing import Iterable
+from functools import lru_cache
+from typing import Iterable, Tuple
 
 import pandas as pd
-import requests
-from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, HTTPError, RequestException, Timeout
-from urllib3.util.retry import Retry
 
+from ._http import get_session
+from ._ratelimit import get_bucket, pause_host, server_delay
 from .common import COMPETITION_MAPPINGS
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _competitions_for_source(source: str) -> Tuple[str, ...]:
+    # COMPETITION_MAPPINGS is static, so each source's list is built once
+    return tuple(k for k, v in COMPETITION_MAPPINGS.items() if source in v)
+
+
 class BaseScraper:
     """
     Base scraper that all scrapers inherit from
@@ -49,11 +55,7 @@ class BaseScraper:
     def list_competitions(cls) -> list:
         if not hasattr(cls, "source"):
             raise AttributeError(f"{cls.__name__} has no attribute 'source'")
-        competitions = list()
-        for k, v in COMPETITION_MAPPINGS.items():
-            if cls.source in v.keys():
-                competitions.append(k)
-        return competitions
+        return list(_competitions_for_source(cls.source))
 
     def _map_teams(self, df: pd.DataFrame, columns: Iterable) -> pd.DataFrame:
         """
@@ -70,10 +72,11 @@ class BaseScraper:
         if self.team_mappings is not None:
             for c in columns:
                 if c in df.columns:
-                    df[c] = df[c].replace(self.team_mappings)
+                    # One hash lookup per row; unmapped names are kept as-is
+                    df[c] = df[c].map(self.team_mappings).fillna(df[c])
                 else:
                     logger.warning(
-                        f"Column {c} not found in dataframe for team mapping"
+                        "Column %s not found in dataframe for team mapping", c
                     )
         return df
 
@@ -81,9 +84,24 @@ class BaseScraper:
 class RequestsScraper(BaseScraper):
     """
     Base scraper that all request-based scrapers inherit from with robust error handling
+
+    Parameters
+    ----------
+    team_mappings : dict or None
+        dict (or None) of team name mappings
+
+    timeout : int
+        Request timeout in seconds
+
+    max_retries : int
+        Number of retries for failed requests
+
+    session : requests.Session or None
+        Session to issue requests through. Defaults to a new session using
+        the connection pool shared by all scrapers with the same `max_retries`
     """
 
-    def __init__(self, team_mappings=None, timeout=30, max_retries=3):
+    def __init__(self, team_mappings=None, timeout=30, max_retries=3, session=None):
         self.headers = {
             "User-Agent": (
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -95,17 +113,8 @@ class RequestsScraper(BaseScraper):
         self.timeout = timeout
         self.max_retries = max_retries
 
-        # Set up session with retry strategy
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=max_retries,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"],
-            backoff_factor=1,
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        # Own session (cookies, headers) over the shared pool and retry strategy
+        self.session = session if session is not None else get_session(max_retries)
 
         super().__init__(team_mappings=team_mappings)
 
@@ -118,7 +127,8 @@ class RequestsScraper(BaseScraper):
         url : str
             URL to fetch
         delay : float
-            Delay in seconds before making request (for rate limiting)
+            Delay in seconds before making request (for rate limiting), on
+            top of the per-host pacing of the shared rate limiter
 
         Returns
         -------
@@ -134,19 +144,9 @@ class RequestsScraper(BaseScraper):
             time.sleep(delay)
 
         try:
-            logger.info(f"Fetching data from: {url}")
+            logger.info("Fetching data from: %s", url)
 
-            if self.cookies is not None:
-                response = self.session.get(
-                    url,
-                    headers=self.headers,
-                    cookies=self.cookies,
-                    timeout=self.timeout,
-                )
-            else:
-                response = self.session.get(
-                    url, headers=self.headers, timeout=self.timeout
-                )
+            response = self._send(url)
 
             response.raise_for_status()  # Raises HTTPError for bad responses
 
@@ -154,21 +154,21 @@ class RequestsScraper(BaseScraper):
             if not self.validate_response_data(response.text, url):
                 raise RequestException(f"Response validation failed for {url}")
 
-            logger.info(f"Successfully fetched data from: {url}")
+            logger.info("Successfully fetched data from: %s", url)
             return response.text
 
         except Timeout as e:
-            logger.error(f"Timeout error for {url}: {e}")
+            logger.error("Timeout error for %s: %s", url, e)
             raise RequestException(
                 f"Request timed out after {self.timeout}s: {url}"
             ) from e
 
         except ConnectionError as e:
-            logger.error(f"Connection error for {url}: {e}")
+            logger.error("Connection error for %s: %s", url, e)
             raise RequestException(f"Connection failed: {url}") from e
 
         except HTTPError as e:
-            logger.error(f"HTTP error for {url}: {e}")
+            logger.error("HTTP error for %s: %s", url, e)
             if e.response.status_code == 404:
                 raise RequestException(f"Data not found (404): {url}") from e
             elif e.response.status_code == 403:
@@ -177,13 +177,47 @@ class RequestsScraper(BaseScraper):
                 raise RequestException(f"HTTP error {e.response.status_code}: {url}") from e
 
         except RequestException as e:
-            logger.error(f"Request exception for {url}: {e}")
+            logger.error("Request exception for %s: %s", url, e)
             raise
 
         except Exception as e:
-            logger.error(f"Unexpected error for {url}: {e}")
+            logger.error("Unexpected error for %s: %s", url, e)
             raise RequestException(f"Unexpected error: {url}") from e
 
+    def _send(self, url: str):
+        """
+        Send a GET through the host's rate limiter, retrying 429 responses
+
+        A 429 is retried after exactly the wait the server asked for
+        (``Retry-After`` / ``X-RateLimit-*``); only when the server gives no
+        hint do we fall back to exponential backoff.
+        """
+        bucket = get_bucket(url)
+        for attempt in range(self.max_retries + 1):
+            bucket.acquire()
+            if self.cookies is not None:
+                response = self.session.get(
+                    url,
+                    headers=self.headers,
+                    cookies=self.cookies,
+                    timeout=self.timeout,
+                )
+            else:
+                response = self.session.get(
+                    url, headers=self.headers, timeout=self.timeout
+                )
+
+            wait = server_delay(response.headers)
+            if response.status_code == 429 and wait is None:
+                wait = float(2**attempt)
+            if wait is not None:
+                pause_host(url, wait)
+
+            if response.status_code != 429 or attempt == self.max_retries:
+                return response
+
+            logger.warning("Rate limited (429) by %s, retrying in %.1fs", url, wait)
+
     def validate_response_data(self, data: str, url: str) -> bool:
         """
         Validate that response data is not empty or malformed and appears to be real data
@@ -201,7 +235,7 @@ class RequestsScraper(BaseScraper):
             True if data appears valid and real
         """
         if not data or len(data.strip()) == 0:
-            logger.warning(f"Empty response from {url}")
+            logger.warning("Empty response from %s", url)
             return False
 
         # Check for common error indicators
@@ -217,12 +251,12 @@ class RequestsScraper(BaseScraper):
         data_lower = data.lower()
         for indicator in error_indicators:
             if indicator.lower() in data_lower:
-                logger.warning(f"Error indicator '{indicator}' detected in response from {url}")
+                logger.warning("Error indicator '%s' detected in response from %s", indicator, url)
                 return False
 
         # Check for minimum data size (real data should be substantial)
         if len(data) < 100:
-            logger.warning(f"Response too small ({len(data)} chars) from {url}")
+            logger.warning("Response too small (%s chars) from %s", len(data), url)
             return False
 
         # For HTML responses, check for actual content
@@ -231,21 +265,21 @@ class RequestsScraper(BaseScraper):
             content_indicators = ["<table", "<tbody", "<tr", "<td", "fixtures", "results", "matches"]
             has_content = any(indicator in data_lower for indicator in content_indicators)
             if not has_content:
-                logger.warning(f"HTML response from {url} appears to lack actual data content")
+                logger.warning("HTML response from %s appears to lack actual data content", url)
                 return False
 
         # For CSV responses, check for data rows
         elif data.startswith("Date,") or "," in data:
             lines = data.strip().split('\n')
             if len(lines) < 2:  # Should have at least header + 1 data row
-                logger.warning(f"CSV response from {url} has insufficient data rows")
+                logger.warning("CSV response from %s has insufficient data rows", url)
                 return False
 
         # Check for JSON responses
         elif data.strip().startswith('{') or data.strip().startswith('['):
             if len(data.strip()) < 10 or data.strip() in ['{}', '[]']:
-                logger.warning(f"JSON response from {url} appears empty")
+                logger.warning("JSON response from %s appears empty", url)
                 return False
 
-        logger.debug(f"Response validation passed for {url} ({len(data)} chars)")
+        logger.debug("Response validation passed for %s (%s chars)", url, len(data))
         return True
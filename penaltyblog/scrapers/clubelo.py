@@ -4,7 +4,7 @@ from datetime import datetime
 import pandas as pd
 
 from .base_scrapers import RequestsScraper
-from .common import sanitize_columns
+from .common import parse_iso_dates, sanitize_columns
 
 
 class ClubElo(RequestsScraper):
@@ -16,14 +16,17 @@ class ClubElo(RequestsScraper):
         `{
             "Manchester United: ["Man Utd", "Man United],
         }`
+
+    session : requests.Session or None
+        Session to reuse for requests, defaults to the shared pooled session
     """
 
     source = "clubelo"
 
-    def __init__(self, team_mappings=None):
+    def __init__(self, team_mappings=None, session=None):
         self.base_url = "http://api.clubelo.com/"
 
-        super().__init__(team_mappings=team_mappings)
+        super().__init__(team_mappings=team_mappings, session=session)
 
     def _season_mapping(self, season):
         years = season.split("-")
@@ -41,8 +44,8 @@ class ClubElo(RequestsScraper):
         return df
 
     def _convert_date(self, df):
-        df["From"] = pd.to_datetime(df["From"])
-        df["To"] = pd.to_datetime(df["To"])
+        df["From"] = parse_iso_dates(df["From"])
+        df["To"] = parse_iso_dates(df["To"])
         return df
 
     def get_elo_by_date(self, date=None) -> pd.DataFrame:
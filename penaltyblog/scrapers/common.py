@@ -1,4 +1,3 @@
-import calendar
 import re
 from typing import Any, Dict
 
@@ -423,19 +422,38 @@ def to_snake_case(name: str):
     return name.lower()
 
 
+def parse_iso_dates(values, errors: str = "raise") -> pd.Series:
+    """
+    Parses ISO-8601 date / datetime strings using pandas' dedicated ISO
+    parser rather than per-element format inference
+    """
+    return pd.to_datetime(values, format="ISO8601", errors=errors)
+
+
 def create_game_id(df: pd.DataFrame):
     """
     Creates a unique id for each fixture based on datetime and team names
     """
+    dates = pd.to_datetime(df["date"])
+    if dates.isna().any():
+        raise ValueError("Cannot create game ids for fixtures without a date")
+    if dates.dt.tz is not None:
+        # timetuple() of an aware timestamp gives its wall-clock time
+        dates = dates.dt.tz_localize(None)
+    # Whole seconds since the epoch, as calendar.timegm(date.timetuple())
+    epoch_seconds = ((dates - pd.Timestamp(0)) // pd.Timedelta(seconds=1)).astype(
+        "int64"
+    )
 
-    def _create_game_id(row: pd.Series):
-        tmpl = "{}---{}---{}".format(
-            int(calendar.timegm(row["date"].timetuple())),
-            row["team_home"],
-            row["team_away"],
+    df["id"] = (
+        (
+            epoch_seconds.astype(str)
+            + "---"
+            + df["team_home"].astype(str)
+            + "---"
+            + df["team_away"].astype(str)
         )
-        tmpl = tmpl.replace(" ", "_").lower()
-        return tmpl
-
-    df["id"] = df.apply(_create_game_id, axis=1)
+        .str.replace(" ", "_", regex=False)
+        .str.lower()
+    )
     return df
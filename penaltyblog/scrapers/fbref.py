@@ -3,11 +3,13 @@ import logging
 
 import pandas as pd
 
+from ._cache import cached_dataframe
 from .base_scrapers import RequestsScraper
 from .common import (
     COMPETITION_MAPPINGS,
     create_game_id,
     move_column_inplace,
+    parse_iso_dates,
     sanitize_columns,
 )
 
@@ -32,11 +34,14 @@ class FBRef(RequestsScraper):
         `{
             "Manchester United: ["Man Utd", "Man United],
         }`
+
+    session : requests.Session or None
+        Session to reuse for requests, defaults to the shared pooled session
     """
 
     source = "fbref"
 
-    def __init__(self, competition, season, team_mappings=None):
+    def __init__(self, competition, season, team_mappings=None, session=None):
         self._check_competition(competition)
 
         self.base_url = "https://fbref.com/en/comps/"
@@ -47,7 +52,7 @@ class FBRef(RequestsScraper):
             "slug"
         ]
 
-        super().__init__(team_mappings=team_mappings)
+        super().__init__(team_mappings=team_mappings, session=session)
 
     def _map_season(self, season) -> str:
         """
@@ -70,11 +75,11 @@ class FBRef(RequestsScraper):
             # Basic validation of years
             start_year, end_year = map(int, years)
             if end_year != start_year + 1:
-                logger.warning(f"Unusual season span: {season}")
+                logger.warning("Unusual season span: %s", season)
 
             return season
         except Exception as e:
-            logger.error(f"Error mapping season {season}: {e}")
+            logger.error("Error mapping season %s: %s", season, e)
             raise ValueError(f"Invalid season format: {season}") from e
 
     def _convert_date(self, df):
@@ -87,28 +92,28 @@ class FBRef(RequestsScraper):
             if "date" in df.columns and "time" in df.columns:
                 # Combine date and time columns
                 datetime_strs = df["date"].astype(str) + " " + df["time"].astype(str)
-                df["datetime"] = pd.to_datetime(datetime_strs, errors="coerce")
+                df["datetime"] = parse_iso_dates(datetime_strs, errors="coerce")
 
                 # Count conversion failures
                 failed_conversions = df["datetime"].isna() & df["date"].notna()
                 if failed_conversions.any():
                     logger.warning(
-                        f"Failed to convert {failed_conversions.sum()} datetime values"
+                        "Failed to convert %s datetime values", failed_conversions.sum()
                     )
 
             if "date" in df.columns:
-                df["date"] = pd.to_datetime(df["date"], errors="coerce")
+                df["date"] = parse_iso_dates(df["date"], errors="coerce")
 
                 # Remove rows with invalid dates
                 invalid_dates = df["date"].isna()
                 if invalid_dates.any():
                     logger.warning(
-                        f"Removing {invalid_dates.sum()} rows with invalid dates"
+                        "Removing %s rows with invalid dates", invalid_dates.sum()
                     )
                     df = df[~invalid_dates]
 
         except Exception as e:
-            logger.error(f"Error in date conversion: {e}")
+            logger.error("Error in date conversion: %s", e)
             # Continue without date conversion if it fails
 
         return df
@@ -146,7 +151,7 @@ class FBRef(RequestsScraper):
         removed_count = initial_count - len(df)
 
         if removed_count > 0:
-            logger.info(f"Removed {removed_count} spacer rows")
+            logger.info("Removed %s spacer rows", removed_count)
 
         return df
 
@@ -163,7 +168,7 @@ class FBRef(RequestsScraper):
         removed_count = initial_count - len(df)
 
         if removed_count > 0:
-            logger.info(f"Removed {removed_count} unplayed fixtures")
+            logger.info("Removed %s unplayed fixtures", removed_count)
 
         return df
 
@@ -193,13 +198,13 @@ class FBRef(RequestsScraper):
                 ) & df["score"].notna()
                 if invalid_goals.any():
                     logger.warning(
-                        f"Failed to parse {invalid_goals.sum()} score values"
+                        "Failed to parse %s score values", invalid_goals.sum()
                     )
             else:
                 logger.warning("Could not split score column - unexpected format")
 
         except Exception as e:
-            logger.error(f"Error splitting score column: {e}")
+            logger.error("Error splitting score column: %s", e)
 
         return df
 
@@ -218,12 +223,13 @@ class FBRef(RequestsScraper):
 
         if found_indicators == 0:
             logger.warning(
-                f"Response from {url} doesn't appear to contain fixtures data"
+                "Response from %s doesn't appear to contain fixtures data", url
             )
             return False
 
         return True
 
+    @cached_dataframe(ttl_hours=24)
     def get_fixtures(self) -> pd.DataFrame:
         """Get fixtures data with comprehensive error handling."""
         url = (
@@ -235,7 +241,7 @@ class FBRef(RequestsScraper):
         )
 
         try:
-            logger.info(f"Fetching fixtures for {self.competition} {self.season}")
+            logger.info("Fetching fixtures for %s %s", self.competition, self.season)
             content = self.get(url)
 
             if not self._validate_fixtures_response(content, url):
@@ -244,11 +250,11 @@ class FBRef(RequestsScraper):
             # Remove HTML comments that interfere with parsing
             content = content.replace("<!--", "").replace("-->", "")
 
-            # Parse HTML tables
+            # Parse HTML tables with lxml only, never the slow bs4 fallback
             try:
-                dfs = pd.read_html(io.StringIO(content))
+                dfs = pd.read_html(io.StringIO(content), flavor="lxml")
             except ValueError as e:
-                logger.error(f"No tables found in response from {url}")
+                logger.error("No tables found in response from %s", url)
                 raise ValueError(
                     f"No fixtures data found for {self.competition} {self.season}"
                 ) from e
@@ -260,11 +266,11 @@ class FBRef(RequestsScraper):
 
             # Use the first table (fixtures table)
             raw_df = dfs[0]
-            logger.info(f"Raw fixtures data shape: {raw_df.shape}")
+            logger.info("Raw fixtures data shape: %s", raw_df.shape)
 
             if raw_df.empty:
                 logger.warning(
-                    f"Empty fixtures table for {self.competition} {self.season}"
+                    "Empty fixtures table for %s %s", self.competition, self.season
                 )
                 return pd.DataFrame()
 
@@ -291,12 +297,15 @@ class FBRef(RequestsScraper):
                 if col in df.columns:
                     move_column_inplace(df, col, i)
 
-            logger.info(f"Successfully processed {len(df)} fixtures")
+            logger.info("Successfully processed %s fixtures", len(df))
             return df
 
         except Exception as e:
             logger.error(
-                f"Error fetching fixtures for {self.competition} {self.season}: {e}"
+                "Error fetching fixtures for %s %s: %s",
+                self.competition,
+                self.season,
+                e,
             )
             raise
 
@@ -332,7 +341,7 @@ class FBRef(RequestsScraper):
                     df[col] = pd.to_numeric(df[col], errors="coerce")
 
         except Exception as e:
-            logger.warning(f"Error setting column types: {e}")
+            logger.warning("Error setting column types: %s", e)
 
         return df
 
@@ -344,7 +353,7 @@ class FBRef(RequestsScraper):
                 df["age_years"] = df["age"].str.split("-").str[0]
                 df["age_years"] = pd.to_numeric(df["age_years"], errors="coerce")
             except Exception as e:
-                logger.warning(f"Error processing player ages: {e}")
+                logger.warning("Error processing player ages: %s", e)
 
         return df
 
@@ -358,7 +367,7 @@ class FBRef(RequestsScraper):
         stats = competition_info.get("stats", [])
 
         if not stats:
-            logger.warning(f"No stat types found for {self.competition}")
+            logger.warning("No stat types found for %s", self.competition)
 
         return stats
 
@@ -398,7 +407,7 @@ class FBRef(RequestsScraper):
 
         try:
             logger.info(
-                f"Fetching {stat_type} stats for {self.competition} {self.season}"
+                "Fetching %s stats for %s %s", stat_type, self.competition, self.season
             )
             content = self.get(url)
 
@@ -409,9 +418,9 @@ class FBRef(RequestsScraper):
             content = content.replace("<!--", "").replace("-->", "")
 
             try:
-                dfs = pd.read_html(io.StringIO(content))
+                dfs = pd.read_html(io.StringIO(content), flavor="lxml")
             except ValueError as e:
-                logger.error(f"No tables found in stats response from {url}")
+                logger.error("No tables found in stats response from %s", url)
                 raise ValueError(
                     f"No {stat_type} stats found for {self.competition} {self.season}"
                 ) from e
@@ -474,14 +483,18 @@ class FBRef(RequestsScraper):
             # Validate output
             for key, df in output.items():
                 if df.empty:
-                    logger.warning(f"Empty {key} dataframe for {stat_type} stats")
+                    logger.warning("Empty %s dataframe for %s stats", key, stat_type)
                 else:
-                    logger.info(f"Successfully processed {len(df)} {key} records")
+                    logger.info("Successfully processed %s %s records", len(df), key)
 
             return output
 
         except Exception as e:
             logger.error(
-                f"Error fetching {stat_type} stats for {self.competition} {self.season}: {e}"
+                "Error fetching %s stats for %s %s: %s",
+                stat_type,
+                self.competition,
+                self.season,
+                e,
             )
             raise
@@ -3,6 +3,7 @@ import logging
 
 import pandas as pd
 
+from ._cache import cached_dataframe
 from .base_scrapers import RequestsScraper
 from .common import (
     COMPETITION_MAPPINGS,
@@ -34,11 +35,14 @@ class FootballData(RequestsScraper):
             "Manchester United: ["Man Utd", "Man United],
         }`
 
+    session : requests.Session or None
+        Session to reuse for requests, defaults to the shared pooled session
+
     """
 
     source = "footballdata"
 
-    def __init__(self, competition, season, team_mappings=None):
+    def __init__(self, competition, season, team_mappings=None, session=None):
 
         self._check_competition(competition)
 
@@ -52,7 +56,7 @@ class FootballData(RequestsScraper):
             "footballdata"
         ]["slug"]
 
-        super().__init__(team_mappings=team_mappings)
+        super().__init__(team_mappings=team_mappings, session=session)
 
     def _season_mapping(self, season):
         """
@@ -68,7 +72,7 @@ class FootballData(RequestsScraper):
             mapped = part1 + part2
             return mapped
         except Exception as e:
-            logger.error(f"Error mapping season {season}: {e}")
+            logger.error("Error mapping season %s: %s", season, e)
             raise ValueError(f"Invalid season format: {season}") from e
 
     def _convert_date(self, df):
@@ -105,7 +109,7 @@ class FootballData(RequestsScraper):
             # Determine date format based on sample
             date_format = "%d/%m/%y" if len(sample_date) <= 8 else "%d/%m/%Y"
             logger.info(
-                f"Using date format: {date_format} for sample date: {sample_date}"
+                "Using date format: %s for sample date: %s", date_format, sample_date
             )
 
             # Convert datetime column if Time exists
@@ -141,10 +145,10 @@ class FootballData(RequestsScraper):
             if df.empty:
                 logger.warning("No valid dates remain after conversion")
             else:
-                logger.info(f"Successfully converted {len(df)} rows with valid dates")
+                logger.info("Successfully converted %s rows with valid dates", len(df))
 
         except Exception as e:
-            logger.error(f"Error in date conversion: {e}")
+            logger.error("Error in date conversion: %s", e)
             # Return dataframe with original date column if conversion fails
             logger.warning(
                 "Falling back to original date column due to conversion error"
@@ -164,7 +168,7 @@ class FootballData(RequestsScraper):
         missing_columns = [col for col in required_columns if col not in df.columns]
 
         if missing_columns:
-            logger.error(f"Missing required columns: {missing_columns}")
+            logger.error("Missing required columns: %s", missing_columns)
             raise ValueError(
                 f"Missing required columns in fixtures data: {missing_columns}"
             )
@@ -174,7 +178,7 @@ class FootballData(RequestsScraper):
             df[col] = pd.to_numeric(df[col], errors="coerce")
             invalid_scores = df[col].isna() | (df[col] < 0)
             if invalid_scores.any():
-                logger.warning(f"Found {invalid_scores.sum()} invalid scores in {col}")
+                logger.warning("Found %s invalid scores in %s", invalid_scores.sum(), col)
                 df = df[~invalid_scores]
 
         # Check for missing team names
@@ -182,12 +186,13 @@ class FootballData(RequestsScraper):
         for col in team_cols:
             empty_teams = df[col].isna() | (df[col] == "")
             if empty_teams.any():
-                logger.warning(f"Found {empty_teams.sum()} empty team names in {col}")
+                logger.warning("Found %s empty team names in %s", empty_teams.sum(), col)
                 df = df[~empty_teams]
 
-        logger.info(f"Validated fixtures data: {len(df)} valid rows remaining")
+        logger.info("Validated fixtures data: %s valid rows remaining", len(df))
         return df
 
+    @cached_dataframe(ttl_hours=24)
     def get_fixtures(self) -> pd.DataFrame:
         """
         Downloads the fixtures and returns them as a pandas data frame with robust error handling
@@ -204,7 +209,7 @@ class FootballData(RequestsScraper):
         }
 
         try:
-            logger.info(f"Fetching fixtures for {self.competition} {self.season}")
+            logger.info("Fetching fixtures for %s %s", self.competition, self.season)
             content = self.get(url)
 
             if not self.validate_response_data(content, url):
@@ -214,19 +219,19 @@ class FootballData(RequestsScraper):
             try:
                 raw_df = pd.read_csv(io.StringIO(content))
             except pd.errors.EmptyDataError:
-                logger.error(f"Empty CSV data from {url}")
+                logger.error("Empty CSV data from %s", url)
                 raise ValueError(
                     f"No data available for {self.competition} {self.season}"
                 )
             except pd.errors.ParserError as e:
-                logger.error(f"CSV parsing error from {url}: {e}")
+                logger.error("CSV parsing error from %s: %s", url, e)
                 raise ValueError(f"Malformed CSV data from {url}") from e
 
             if raw_df.empty:
-                logger.warning(f"Empty dataframe from {url}")
+                logger.warning("Empty dataframe from %s", url)
                 return pd.DataFrame()
 
-            logger.info(f"Raw data shape: {raw_df.shape}")
+            logger.info("Raw data shape: %s", raw_df.shape)
 
             # Process data with validation at each step
             df = (
@@ -253,11 +258,14 @@ class FootballData(RequestsScraper):
                     move_column_inplace(df, c, i)
                     i += 1  # Fixed increment bug
 
-            logger.info(f"Successfully processed {len(df)} fixtures")
+            logger.info("Successfully processed %s fixtures", len(df))
             return df
 
         except Exception as e:
             logger.error(
-                f"Error fetching fixtures for {self.competition} {self.season}: {e}"
+                "Error fetching fixtures for %s %s: %s",
+                self.competition,
+                self.season,
+                e,
             )
             raise
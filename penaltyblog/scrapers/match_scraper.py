@@ -65,20 +65,20 @@ class MatchScraper:
         """
         league = get_league_by_code(league_code)
         if not league:
-            logger.error(f"League not found: {league_code}")
+            logger.error("League not found: %s", league_code)
             return pd.DataFrame()
         
-        logger.info(f"🔄 Scraping {league.display_name} ({league_code})")
+        logger.info("🔄 Scraping %s (%s)", league.display_name, league_code)
         
         try:
             url = league.get_url()
-            logger.debug(f"Fetching data from: {url}")
+            logger.debug("Fetching data from: %s", url)
             
             # Use the enhanced parser with automatic format detection and error handling
             df = parse_league_data(url, league_code, 'auto')
             
             if df.empty:
-                logger.warning(f"No match data found for {league.display_name}")
+                logger.warning("No match data found for %s", league.display_name)
                 return df
             
             # Add league metadata
@@ -86,11 +86,11 @@ class MatchScraper:
             df['league_name'] = league.name
             df['country'] = league.country
             
-            logger.info(f"✅ Successfully scraped {len(df)} matches from {league.display_name}")
+            logger.info("✅ Successfully scraped %s matches from %s", len(df), league.display_name)
             return df
             
         except Exception as e:
-            logger.error(f"❌ Failed to scrape data for {league.display_name}: {e}")
+            logger.error("❌ Failed to scrape data for %s: %s", league.display_name, e)
             return pd.DataFrame()
     
     def scrape_multiple_leagues(self, league_codes: List[str]) -> Dict[str, pd.DataFrame]:
@@ -123,7 +123,7 @@ class MatchScraper:
                     df = future.result()
                     results[league_code] = df
                 except Exception as e:
-                    logger.error(f"❌ Error scraping {league_code}: {e}")
+                    logger.error("❌ Error scraping %s: %s", league_code, e)
                     results[league_code] = pd.DataFrame()
         
         return results
@@ -140,7 +140,7 @@ class MatchScraper:
         leagues = load_leagues()
         league_codes = list(leagues.keys())
         
-        logger.info(f"🚀 Starting to scrape {len(league_codes)} leagues")
+        logger.info("🚀 Starting to scrape %s leagues", len(league_codes))
         return self.scrape_multiple_leagues(league_codes)
     
     def save_league_data(self, league_code: str, df: pd.DataFrame, output_dir: Path) -> Optional[Path]:
@@ -162,13 +162,13 @@ class MatchScraper:
             Path to saved file or None if save failed
         """
         if df.empty:
-            logger.warning(f"No data to save for {league_code}")
+            logger.warning("No data to save for %s", league_code)
             return None
         
         try:
             league = get_league_by_code(league_code)
             if not league:
-                logger.error(f"League not found: {league_code}")
+                logger.error("League not found: %s", league_code)
                 return None
             
             # Create filename: country_league.csv
@@ -179,11 +179,11 @@ class MatchScraper:
             filepath = output_dir / filename
             df.to_csv(filepath, index=False)
             
-            logger.info(f"💾 Saved {len(df)} matches to {filepath}")
+            logger.info("💾 Saved %s matches to %s", len(df), filepath)
             return filepath
             
         except Exception as e:
-            logger.error(f"❌ Failed to save data for {league_code}: {e}")
+            logger.error("❌ Failed to save data for %s: %s", league_code, e)
             return None
 
 def parse_league_list(league_str: str) -> List[str]:
@@ -313,7 +313,7 @@ Examples:
     available_leagues = load_leagues()
     invalid_leagues = [code for code in leagues_to_scrape if code not in available_leagues]
     if invalid_leagues:
-        logger.error(f"Invalid league codes: {', '.join(invalid_leagues)}")
+        logger.error("Invalid league codes: %s", ', '.join(invalid_leagues))
         logger.info("Use --list-leagues to see available leagues")
         return 1
     
@@ -321,7 +321,7 @@ Examples:
     output_dir = args.output_dir or create_output_directory()
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    logger.info(f"📁 Output directory: {output_dir}")
+    logger.info("📁 Output directory: %s", output_dir)
     
     # Initialize scraper and start scraping
     scraper = MatchScraper(timeout=args.timeout, max_workers=args.max_workers)
@@ -350,7 +350,7 @@ Examples:
                 combined_df = merge_fixture_dataframes(all_dfs)
                 combined_path = output_dir / "combined_leagues.csv"
                 combined_df.to_csv(combined_path, index=False)
-                logger.info(f"💾 Saved combined data ({len(combined_df)} matches) to {combined_path}")
+                logger.info("💾 Saved combined data (%s matches) to %s", len(combined_df), combined_path)
     
     logger.info("🏁 Scraping completed")
     return 0
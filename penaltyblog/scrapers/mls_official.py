@@ -2,15 +2,42 @@ import logging
 import pandas as pd
 import json
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Sequence
 
+from lxml import etree, html
+
+from ._cache import cached_dataframe
 from .base_scrapers import RequestsScraper
-from .common import sanitize_columns, move_column_inplace, create_game_id
-from .team_mappings import get_mls_team_mappings
+from .common import sanitize_columns, move_column_inplace, create_game_id, parse_iso_dates
+from .team_mappings import get_mls_alias_index, get_mls_team_mappings
 
 logger = logging.getLogger(__name__)
 
 
+def _class_xpath(tags: Sequence[str], classes: Sequence[str], first: bool = False) -> str:
+    """XPath matching any of `tags` that carries any of the `classes` tokens"""
+    tag_test = " or ".join(f"self::{tag}" for tag in tags)
+    class_test = " or ".join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+        for cls in classes
+    )
+    path = f".//*[({tag_test}) and ({class_test})]"
+    return f"({path})[1]" if first else path
+
+
+# Compiled once; the fixture parser runs these for every match on the page
+_FIXTURE_XPATH = etree.XPath(_class_xpath(["div", "article"], ["match", "fixture", "game"]))
+_TEAM_XPATH = etree.XPath(_class_xpath(["span", "div"], ["team", "club"]))
+_DATE_XPATH = etree.XPath(_class_xpath(["time", "span"], ["date", "datetime"], first=True))
+_SCORE_XPATH = etree.XPath(_class_xpath(["span", "div"], ["score", "result"], first=True))
+_STATUS_XPATH = etree.XPath(_class_xpath(["span", "div"], ["status", "state"], first=True))
+
+
+def _text(element) -> str:
+    """Concatenated, stripped text of an element and its descendants"""
+    return "".join(part.strip() for part in element.itertext())
+
+
 class MLSOfficial(RequestsScraper):
     """
     Scraper for official MLS data sources and APIs.
@@ -21,24 +48,28 @@ class MLSOfficial(RequestsScraper):
         Season in format "2024" or "2024-25" 
     team_mappings : dict or None
         Dictionary of team name mappings
+    session : requests.Session or None
+        Session to reuse for requests, defaults to the shared pooled session
     """
 
     source = "mls_official"
 
-    def __init__(self, season: str, team_mappings=None):
+    def __init__(self, season: str, team_mappings=None, session=None):
         self.season = season
         self.base_url = "https://www.mlssoccer.com"
         
-        # Use MLS-specific team mappings if none provided
+        super().__init__(team_mappings=team_mappings, session=session)
+        
+        # Use MLS-specific team mappings if none provided; the alias index is
+        # inverted once per process, so each scraper gets its own copy
         if team_mappings is None:
-            team_mappings = get_mls_team_mappings()
-            
-        super().__init__(team_mappings=team_mappings)
+            self.team_mappings = dict(get_mls_alias_index())
 
     @classmethod
     def list_competitions(cls) -> list:
         return ["USA Major League Soccer"]
 
+    @cached_dataframe(ttl_hours=24)
     def get_fixtures(self) -> pd.DataFrame:
         """
         Get MLS fixtures/results data.
@@ -52,7 +83,7 @@ class MLSOfficial(RequestsScraper):
             # MLS API endpoint for schedule data
             url = f"{self.base_url}/schedule"
             
-            logger.info(f"Fetching MLS fixtures for {self.season}")
+            logger.info("Fetching MLS fixtures for %s", self.season)
             html_content = self.get(url)
             
             # Parse the HTML to extract fixtures data
@@ -68,7 +99,7 @@ class MLSOfficial(RequestsScraper):
             return fixtures_df
             
         except Exception as e:
-            logger.error(f"Error fetching MLS fixtures: {e}")
+            logger.error("Error fetching MLS fixtures: %s", e)
             return pd.DataFrame()
 
     def _parse_fixtures_html(self, html_content: str) -> pd.DataFrame:
@@ -86,9 +117,7 @@ class MLSOfficial(RequestsScraper):
             Parsed fixtures data
         """
         try:
-            from bs4 import BeautifulSoup
-            
-            soup = BeautifulSoup(html_content, 'html.parser')
+            tree = html.fromstring(html_content)
             
             # Look for schedule/fixture data in the HTML
             # This is a simplified parser - the actual implementation would need
@@ -97,7 +126,7 @@ class MLSOfficial(RequestsScraper):
             fixtures = []
             
             # Find fixture containers (this would need to be adjusted based on actual HTML structure)
-            fixture_elements = soup.find_all(['div', 'article'], class_=['match', 'fixture', 'game'])
+            fixture_elements = _FIXTURE_XPATH(tree)
             
             for element in fixture_elements:
                 try:
@@ -105,7 +134,7 @@ class MLSOfficial(RequestsScraper):
                     if fixture_data:
                         fixtures.append(fixture_data)
                 except Exception as e:
-                    logger.debug(f"Error parsing fixture element: {e}")
+                    logger.debug("Error parsing fixture element: %s", e)
                     continue
             
             if not fixtures:
@@ -114,11 +143,8 @@ class MLSOfficial(RequestsScraper):
             
             return pd.DataFrame(fixtures)
             
-        except ImportError:
-            logger.error("BeautifulSoup4 not available for HTML parsing")
-            return pd.DataFrame()
         except Exception as e:
-            logger.error(f"Error parsing fixtures HTML: {e}")
+            logger.error("Error parsing fixtures HTML: %s", e)
             return pd.DataFrame()
 
     def _extract_fixture_data(self, element) -> Optional[Dict[str, Any]]:
@@ -127,8 +153,8 @@ class MLSOfficial(RequestsScraper):
         
         Parameters
         ----------
-        element
-            BeautifulSoup element containing fixture information
+        element : lxml.html.HtmlElement
+            Element containing fixture information
             
         Returns
         -------
@@ -140,35 +166,35 @@ class MLSOfficial(RequestsScraper):
             fixture = {}
             
             # Extract teams (look for team names)
-            team_elements = element.find_all(['span', 'div'], class_=['team', 'club'])
+            team_elements = _TEAM_XPATH(element)
             if len(team_elements) >= 2:
-                fixture['team_home'] = team_elements[0].get_text(strip=True)
-                fixture['team_away'] = team_elements[1].get_text(strip=True)
+                fixture['team_home'] = _text(team_elements[0])
+                fixture['team_away'] = _text(team_elements[1])
             
             # Extract date/time
-            date_element = element.find(['time', 'span'], class_=['date', 'datetime'])
-            if date_element:
-                date_str = date_element.get('datetime') or date_element.get_text(strip=True)
+            date_elements = _DATE_XPATH(element)
+            if date_elements:
+                date_str = date_elements[0].get('datetime') or _text(date_elements[0])
                 fixture['date'] = self._parse_date(date_str)
             
             # Extract score if available
-            score_element = element.find(['span', 'div'], class_=['score', 'result'])
-            if score_element:
-                score_text = score_element.get_text(strip=True)
+            score_elements = _SCORE_XPATH(element)
+            if score_elements:
+                score_text = _text(score_elements[0])
                 goals = self._parse_score(score_text)
                 if goals:
                     fixture['goals_home'] = goals[0]
                     fixture['goals_away'] = goals[1]
             
             # Extract match status
-            status_element = element.find(['span', 'div'], class_=['status', 'state'])
-            if status_element:
-                fixture['status'] = status_element.get_text(strip=True)
+            status_elements = _STATUS_XPATH(element)
+            if status_elements:
+                fixture['status'] = _text(status_elements[0])
             
             return fixture if len(fixture) > 2 else None
             
         except Exception as e:
-            logger.debug(f"Error extracting fixture data: {e}")
+            logger.debug("Error extracting fixture data: %s", e)
             return None
 
     def _parse_date(self, date_str: str) -> Optional[str]:
@@ -182,11 +208,11 @@ class MLSOfficial(RequestsScraper):
                 except ValueError:
                     continue
             
-            logger.debug(f"Could not parse date: {date_str}")
+            logger.debug("Could not parse date: %s", date_str)
             return None
             
         except Exception as e:
-            logger.debug(f"Error parsing date {date_str}: {e}")
+            logger.debug("Error parsing date %s: %s", date_str, e)
             return None
 
     def _parse_score(self, score_str: str) -> Optional[tuple]:
@@ -204,7 +230,7 @@ class MLSOfficial(RequestsScraper):
             return None
             
         except (ValueError, IndexError) as e:
-            logger.debug(f"Error parsing score {score_str}: {e}")
+            logger.debug("Error parsing score %s: %s", score_str, e)
             return None
 
     def _clean_fixtures_data(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -233,13 +259,13 @@ class MLSOfficial(RequestsScraper):
             missing_cols = [col for col in required_cols if col not in df.columns]
             
             if missing_cols:
-                logger.warning(f"Missing required columns: {missing_cols}")
+                logger.warning("Missing required columns: %s", missing_cols)
                 for col in missing_cols:
                     df[col] = None
             
             # Convert date column
             if 'date' in df.columns:
-                df['date'] = pd.to_datetime(df['date'], errors='coerce')
+                df['date'] = parse_iso_dates(df['date'], errors='coerce')
             
             # Create game IDs
             if all(col in df.columns for col in ['team_home', 'team_away', 'date']):
@@ -252,12 +278,12 @@ class MLSOfficial(RequestsScraper):
             # Reset index
             df = df.reset_index(drop=True)
             
-            logger.info(f"Cleaned fixtures data: {len(df)} matches")
+            logger.info("Cleaned fixtures data: %s matches", len(df))
             
             return df
             
         except Exception as e:
-            logger.error(f"Error cleaning fixtures data: {e}")
+            logger.error("Error cleaning fixtures data: %s", e)
             return df
 
     def get_teams(self) -> pd.DataFrame:
@@ -286,12 +312,12 @@ class MLSOfficial(RequestsScraper):
             df = pd.DataFrame(teams_data)
             df = sanitize_columns(df)
             
-            logger.info(f"Retrieved {len(df)} MLS teams")
+            logger.info("Retrieved %s MLS teams", len(df))
             
             return df
             
         except Exception as e:
-            logger.error(f"Error getting teams data: {e}")
+            logger.error("Error getting teams data: %s", e)
             return pd.DataFrame()
 
     def _get_team_conference(self, team_name: str) -> str:
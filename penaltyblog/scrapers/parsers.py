@@ -73,7 +73,7 @@ class DataFormatParser:
                 return self._parse_html_data(data, league_code)
                 
         except Exception as e:
-            logger.error(f"Failed to parse data for {league_code}: {str(e)}")
+            logger.error("Failed to parse data for %s: %s", league_code, str(e))
             return create_empty_fixture_dataframe()
     
     def _fetch_data_with_error_handling(self, url: str) -> Optional[str]:
@@ -96,7 +96,7 @@ class DataFormatParser:
             
             # Check if response is empty or invalid
             if not response.content:
-                logger.warning(f"Empty response from {url}")
+                logger.warning("Empty response from %s", url)
                 return None
                 
             # Check content type for JSON APIs
@@ -107,21 +107,21 @@ class DataFormatParser:
                     json.loads(response.text)
                     return response.text
                 except json.JSONDecodeError as e:
-                    logger.error(f"Invalid JSON response from {url}: {e}")
+                    logger.error("Invalid JSON response from %s: %s", url, e)
                     return None
             
             return response.text
             
         except requests.exceptions.Timeout:
-            logger.error(f"Timeout while fetching data from {url}")
+            logger.error("Timeout while fetching data from %s", url)
         except requests.exceptions.ConnectionError:
-            logger.error(f"Connection error while fetching data from {url}")
+            logger.error("Connection error while fetching data from %s", url)
         except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP error {e.response.status_code} while fetching data from {url}")
+            logger.error("HTTP error %s while fetching data from %s", e.response.status_code, url)
         except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed for {url}: {str(e)}")
+            logger.error("Request failed for %s: %s", url, str(e))
         except Exception as e:
-            logger.error(f"Unexpected error while fetching data from {url}: {str(e)}")
+            logger.error("Unexpected error while fetching data from %s: %s", url, str(e))
         
         return None
     
@@ -182,10 +182,10 @@ class DataFormatParser:
                 return self._parse_generic_json_data(json_data, league_code)
                 
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON data for {league_code}: {e}")
+            logger.error("Failed to parse JSON data for %s: %s", league_code, e)
             return create_empty_fixture_dataframe()
         except Exception as e:
-            logger.error(f"Error processing JSON data for {league_code}: {e}")
+            logger.error("Error processing JSON data for %s: %s", league_code, e)
             return create_empty_fixture_dataframe()
     
     def _parse_fpl_api_data(self, json_data: Union[Dict, List]) -> pd.DataFrame:
@@ -232,7 +232,7 @@ class DataFormatParser:
                     matches.append(match_data)
             
         except Exception as e:
-            logger.error(f"Error parsing FPL API data: {e}")
+            logger.error("Error parsing FPL API data: %s", e)
             return create_empty_fixture_dataframe()
         
         if matches:
@@ -284,7 +284,7 @@ class DataFormatParser:
                     matches.append(match_data)
             
         except Exception as e:
-            logger.error(f"Error parsing generic JSON data for {league_code}: {e}")
+            logger.error("Error parsing generic JSON data for %s: %s", league_code, e)
             return create_empty_fixture_dataframe()
         
         if matches:
@@ -320,7 +320,7 @@ class DataFormatParser:
             return match_data
             
         except Exception as e:
-            logger.debug(f"Failed to extract match from JSON item: {e}")
+            logger.debug("Failed to extract match from JSON item: %s", e)
             return None
     
     def _parse_html_data(self, data: str, league_code: str = None) -> pd.DataFrame:
@@ -342,7 +342,7 @@ class DataFormatParser:
         try:
             return parse_html_to_dataframe(data, league_code)
         except Exception as e:
-            logger.error(f"Failed to parse HTML data for {league_code}: {e}")
+            logger.error("Failed to parse HTML data for %s: %s", league_code, e)
             return create_empty_fixture_dataframe()
     
     def _get_team_name(self, team_id: Union[int, str, None]) -> Optional[str]:
@@ -407,7 +407,7 @@ def parse_html_to_dataframe(html: str, league_code: str = None) -> pd.DataFrame:
                 if is_fixture_table(df):
                     return normalize_fixture_dataframe(df, league_code)
         except Exception as e:
-            logger.debug(f"Failed to parse table with pandas: {e}")
+            logger.debug("Failed to parse table with pandas: %s", e)
             continue
     
     # If no tables found, try to extract fixture data from HTML structure
@@ -514,7 +514,7 @@ def extract_single_match(container) -> Optional[Dict]:
                     'date': extract_date_from_text(text)
                 }
     except Exception as e:
-        logger.debug(f"Failed to extract match from container: {e}")
+        logger.debug("Failed to extract match from container: %s", e)
     
     return None
 
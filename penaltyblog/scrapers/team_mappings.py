@@ -1,3 +1,6 @@
+from functools import lru_cache
+
+
 def get_example_team_name_mappings():
     return example_mapped_team_names
 
@@ -5,6 +8,19 @@ def get_mls_team_mappings():
     return mls_team_mappings
 
 
+@lru_cache(maxsize=1)
+def get_mls_alias_index():
+    """
+    MLS aliases inverted to `{alias: team}`, built once per process.
+
+    This is the lookup scrapers apply to team name columns; treat it as
+    read-only since it is shared.
+    """
+    return {
+        alias: team for team, aliases in mls_team_mappings.items() for alias in aliases
+    }
+
+
 example_mapped_team_names = {
     "Bayern Munich": ["Bayern", "Fußball-Club Bayern München e. V."],
     "Brighton": ["Brighton & Hove Albion"],
@@ -5,11 +5,13 @@ from typing import Any
 import pandas as pd
 from lxml import html
 
+from ._cache import cached_dataframe
 from .base_scrapers import RequestsScraper
 from .common import (
     COMPETITION_MAPPINGS,
     create_game_id,
     move_column_inplace,
+    parse_iso_dates,
     sanitize_columns,
 )
 
@@ -32,11 +34,14 @@ class Understat(RequestsScraper):
         `{
             "Manchester United: ["Man Utd", "Man United],
         }`
+
+    session : requests.Session or None
+        Session to reuse for requests, defaults to the shared pooled session
     """
 
     source = "understat"
 
-    def __init__(self, competition, season, team_mappings=None):
+    def __init__(self, competition, season, team_mappings=None, session=None):
 
         self._check_competition(competition)
 
@@ -48,7 +53,7 @@ class Understat(RequestsScraper):
             "slug"
         ]
 
-        super().__init__(team_mappings=team_mappings)
+        super().__init__(team_mappings=team_mappings, session=session)
 
         self.cookies = {"beget": "begetok"}
 
@@ -66,10 +71,11 @@ class Understat(RequestsScraper):
         return part1
 
     def _convert_date(self, df):
-        df["datetime"] = pd.to_datetime(df["datetime"])
+        df["datetime"] = parse_iso_dates(df["datetime"])
         df["date"] = df["datetime"].dt.date
         return df
 
+    @cached_dataframe(ttl_hours=24)
     def get_fixtures(self) -> pd.DataFrame:
         """
         Gets the fixtures / results for the selected competition / season
@@ -182,7 +188,7 @@ class Understat(RequestsScraper):
             .rename(columns=col_renames)
             .assign(season=self.season)
             .assign(competition=self.competition)
-            .assign(datetime=lambda x: pd.to_datetime(x.date))
+            .assign(datetime=lambda x: parse_iso_dates(x.date))
             .assign(date=lambda x: x.datetime.dt.date)
             .pipe(create_game_id)
             .set_index("id")
@@ -253,7 +259,7 @@ class Understat(RequestsScraper):
             .pipe(sanitize_columns)
             .assign(season=self.season)
             .assign(competition=self.competition)
-            .assign(datetime=lambda x: pd.to_datetime(x.date))
+            .assign(datetime=lambda x: parse_iso_dates(x.date))
             .assign(date=lambda x: x.datetime.dt.date)
             .pipe(create_game_id)
             .set_index("id")
@@ -355,7 +361,7 @@ class Understat(RequestsScraper):
             pd.DataFrame(events)
             .rename(columns=col_renames)
             .pipe(sanitize_columns)
-            .assign(datetime=lambda x: pd.to_datetime(x.date))
+            .assign(datetime=lambda x: parse_iso_dates(x.date))
             .assign(date=lambda x: x.datetime.dt.date)
             .pipe(create_game_id)
             .set_index("understat_shot_id")
@@ -15,6 +15,13 @@ import pandas as pd
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+# pyarrow is optional; with it, outputs also get a parquet copy
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 # Add the project root to Python path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
@@ -117,10 +124,13 @@ LEAGUE_TO_COMPETITION = {
     "SCO_D3": "SCO Division 3",
 }
 
+# Order in which sources are tried: FBRef > Football-Data > Understat
+SOURCE_PRIORITY = ("fbref", "footballdata", "understat")
+
 class UnifiedScraper:
     """Main scraper class that coordinates data collection from multiple sources."""
     
-    def __init__(self, season: str = "2024-25", timeout: int = 30, max_workers: int = 3):
+    def __init__(self, season: str = "2024-25", timeout: int = 30, max_workers: int = 5):
         """
         Initialize the unified scraper.
         
@@ -170,7 +180,7 @@ class UnifiedScraper:
         """Get available data sources for a specific league."""
         competition = LEAGUE_TO_COMPETITION.get(league_code)
         if not competition:
-            logger.warning(f"No competition mapping found for league {league_code}")
+            logger.warning("No competition mapping found for league %s", league_code)
             return []
         
         available_sources = []
@@ -205,15 +215,15 @@ class UnifiedScraper:
         """
         competition = LEAGUE_TO_COMPETITION.get(league_code)
         if not competition:
-            logger.error(f"No competition mapping found for league {league_code}")
+            logger.error("No competition mapping found for league %s", league_code)
             return None
         
         league = get_league_by_code(league_code)
         if not league:
-            logger.error(f"League not found: {league_code}")
+            logger.error("League not found: %s", league_code)
             return None
         
-        logger.info(f"🔄 Scraping {league.display_name} from {source.upper()}")
+        logger.info("🔄 Scraping %s from %s", league.display_name, source.upper())
         
         try:
             if source == "fbref":
@@ -226,26 +236,26 @@ class UnifiedScraper:
                 scraper = FootballData(competition, self.footballdata_season)
                 df = scraper.get_fixtures()
             else:
-                logger.error(f"Unknown source: {source}")
+                logger.error("Unknown source: %s", source)
                 return None
             
             if df.empty:
-                logger.warning(f"No data returned from {source} for {league.display_name}")
+                logger.warning("No data returned from %s for %s", source, league.display_name)
                 return None
             
             # CRITICAL: Validate that this is real data, not demo data
             if not self._validate_real_data(df, league_code, source):
-                logger.error(f"Data validation failed - rejecting data from {source} for {league.display_name}")
+                logger.error("Data validation failed - rejecting data from %s for %s", source, league.display_name)
                 return None
             
             # Standardize the DataFrame
             df = self._standardize_dataframe(df, league_code, source)
             
-            logger.info(f"✅ Successfully scraped {len(df)} matches from {source.upper()} for {league.display_name}")
+            logger.info("✅ Successfully scraped %s matches from %s for %s", len(df), source.upper(), league.display_name)
             return df
             
         except Exception as e:
-            logger.error(f"❌ Failed to scrape {league.display_name} from {source}: {e}")
+            logger.error("❌ Failed to scrape %s from %s: %s", league.display_name, source, e)
             return None
     
     def _validate_real_data(self, df: pd.DataFrame, league_code: str, source: str) -> bool:
@@ -269,7 +279,7 @@ class UnifiedScraper:
             True if data appears to be real, False otherwise
         """
         if df.empty:
-            logger.warning(f"Empty dataframe from {source} for {league_code}")
+            logger.warning("Empty dataframe from %s for %s", source, league_code)
             return False
         
         # Check for temporal validation issues (completed results for future dates)
@@ -285,7 +295,7 @@ class UnifiedScraper:
             
             if invalid_future.any():
                 invalid_count = invalid_future.sum()
-                logger.error(f"CRITICAL: {source} for {league_code} has {invalid_count} completed results for future dates")
+                logger.error("CRITICAL: %s for %s has %s completed results for future dates", source, league_code, invalid_count)
                 logger.error("This indicates demo/fake data generation - REJECTING")
                 return False
         
@@ -301,15 +311,15 @@ class UnifiedScraper:
                 team_lower = str(team).lower()
                 for pattern in fake_patterns:
                     if pattern in team_lower:
-                        logger.error(f"Fake team name detected: '{team}' from {source} for {league_code}")
+                        logger.error("Fake team name detected: '%s' from %s for %s", team, source, league_code)
                         return False
         
         # Check data size - real data should have reasonable amount
         if len(df) < 5:  # Too few rows might indicate fake/test data
-            logger.warning(f"Very small dataset from {source} for {league_code}: {len(df)} rows")
+            logger.warning("Very small dataset from %s for %s: %s rows", source, league_code, len(df))
             return False
         
-        logger.debug(f"Data validation passed for {source} {league_code}: {len(df)} rows")
+        logger.debug("Data validation passed for %s %s: %s rows", source, league_code, len(df))
         return True
     
     def _standardize_dataframe(self, df: pd.DataFrame, league_code: str, source: str) -> pd.DataFrame:
@@ -347,7 +357,7 @@ class UnifiedScraper:
         required_columns = ['date', 'home', 'away']
         for col in required_columns:
             if col not in df.columns:
-                logger.warning(f"Missing required column '{col}' for {league_code} from {source}")
+                logger.warning("Missing required column '%s' for %s from %s", col, league_code, source)
         
         # Add optional columns if they don't exist
         optional_columns = ['home_score', 'away_score', 'xg_home', 'xg_away']
@@ -387,14 +397,13 @@ class UnifiedScraper:
             logger.error(error_msg)
             raise RuntimeError(error_msg)
         
-        # Prioritize sources: FBRef > Football-Data > Understat
-        source_priority = ["fbref", "footballdata", "understat"]
+        available = frozenset(available_sources)
         
         # If a preferred source is specified and available, try it first
-        if preferred_source and preferred_source in available_sources:
-            sources_to_try = [preferred_source] + [s for s in source_priority if s in available_sources and s != preferred_source]
+        if preferred_source and preferred_source in available:
+            sources_to_try = [preferred_source] + [s for s in SOURCE_PRIORITY if s in available and s != preferred_source]
         else:
-            sources_to_try = [s for s in source_priority if s in available_sources]
+            sources_to_try = [s for s in SOURCE_PRIORITY if s in available]
         
         last_error = None
         attempted_sources = []
@@ -404,13 +413,13 @@ class UnifiedScraper:
             try:
                 df = self.scrape_league_from_source(league_code, source)
                 if df is not None and not df.empty:
-                    logger.info(f"✅ Successfully obtained real data from {source} for {league_code}")
+                    logger.info("✅ Successfully obtained real data from %s for %s", source, league_code)
                     return df
                 else:
-                    logger.warning(f"Source {source} returned no data for {league_code}")
+                    logger.warning("Source %s returned no data for %s", source, league_code)
             except Exception as e:
                 last_error = e
-                logger.error(f"Source {source} failed for {league_code}: {e}")
+                logger.error("Source %s failed for %s: %s", source, league_code, e)
         
         # If we get here, all sources failed
         error_msg = (
@@ -429,6 +438,10 @@ class UnifiedScraper:
         """
         Scrape multiple leagues concurrently.
         
+        Each league runs in its own worker (bounded by ``max_workers``) so the
+        network latency of independent leagues overlaps; a failing league is
+        logged and returned as an empty DataFrame without aborting the batch.
+        
         Parameters
         ----------
         league_codes : List[str]
@@ -439,11 +452,13 @@ class UnifiedScraper:
         Returns
         -------
         Dict[str, pd.DataFrame]
-            Dictionary mapping league codes to DataFrames
+            Dictionary mapping league codes to DataFrames, in input order
         """
-        results = {}
+        results = {league_code: pd.DataFrame() for league_code in league_codes}
+        if not results:
+            return results
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(results))) as executor:
             # Submit all scraping tasks
             future_to_league = {
                 executor.submit(self.scrape_league, league_code, preferred_source): league_code
@@ -457,8 +472,7 @@ class UnifiedScraper:
                     df = future.result()
                     results[league_code] = df
                 except Exception as e:
-                    logger.error(f"❌ Error scraping {league_code}: {e}")
-                    results[league_code] = pd.DataFrame()
+                    logger.error("❌ Error scraping %s: %s", league_code, e)
         
         return results
     
@@ -478,7 +492,7 @@ class UnifiedScraper:
         """
         supported_leagues = list(LEAGUE_TO_COMPETITION.keys())
         
-        logger.info(f"🚀 Starting to scrape {len(supported_leagues)} supported leagues")
+        logger.info("🚀 Starting to scrape %s supported leagues", len(supported_leagues))
         return self.scrape_multiple_leagues(supported_leagues, preferred_source)
     
     def get_supported_leagues(self) -> List[Dict[str, Any]]:
@@ -507,16 +521,31 @@ def create_output_directory() -> Path:
     output_dir.mkdir(parents=True, exist_ok=True)
     return output_dir
 
+def write_fixture_files(df: pd.DataFrame, filepath: Path):
+    """
+    Write fixtures to CSV, plus a typed parquet copy next to it when
+    pyarrow is installed. Parquet reloads much faster than re-parsing the
+    CSV and keeps dtypes; the CSV stays the canonical output.
+    """
+    df.to_csv(filepath, index=False)
+    
+    if HAS_PYARROW:
+        parquet_path = filepath.with_suffix('.parquet')
+        try:
+            df.to_parquet(parquet_path, index=False, compression='zstd')
+        except Exception as e:
+            logger.warning("Could not write parquet copy %s: %s", parquet_path, e)
+
 def save_league_data(league_code: str, df: pd.DataFrame, output_dir: Path) -> Optional[Path]:
     """Save league data to CSV file."""
     if df.empty:
-        logger.warning(f"No data to save for {league_code}")
+        logger.warning("No data to save for %s", league_code)
         return None
     
     try:
         league = get_league_by_code(league_code)
         if not league:
-            logger.error(f"League not found: {league_code}")
+            logger.error("League not found: %s", league_code)
             return None
         
         # Create filename: country_league.csv
@@ -525,15 +554,19 @@ def save_league_data(league_code: str, df: pd.DataFrame, output_dir: Path) -> Op
         filename = "".join(c for c in filename if c.isalnum() or c in "._-")
         
         filepath = output_dir / filename
-        df.to_csv(filepath, index=False)
+        write_fixture_files(df, filepath)
         
-        logger.info(f"💾 Saved {len(df)} matches to {filepath}")
+        logger.info("💾 Saved %s matches to %s", len(df), filepath)
         return filepath
         
     except Exception as e:
-        logger.error(f"❌ Failed to save data for {league_code}: {e}")
+        logger.error("❌ Failed to save data for %s: %s", league_code, e)
         return None
 
+# Per-league metadata columns repeat one value per league, so they are
+# stored as categoricals in the combined frame
+CATEGORICAL_COLUMNS = ('league_code', 'league_name', 'country', 'data_source')
+
 def merge_fixture_dataframes(dataframes: List[pd.DataFrame]) -> pd.DataFrame:
     """Merge multiple fixture DataFrames into a single DataFrame."""
     if not dataframes:
@@ -545,8 +578,13 @@ def merge_fixture_dataframes(dataframes: List[pd.DataFrame]) -> pd.DataFrame:
     if not valid_dfs:
         return pd.DataFrame()
     
-    # Concatenate all DataFrames
+    # Concatenate all DataFrames in one pass, then shrink the repeated
+    # metadata columns; per-league categoricals would have differing
+    # categories and concat would fall back to object dtype anyway
     combined_df = pd.concat(valid_dfs, ignore_index=True)
+    categorical_cols = [col for col in CATEGORICAL_COLUMNS if col in combined_df.columns]
+    if categorical_cols:
+        combined_df = combined_df.astype({col: 'category' for col in categorical_cols})
     
     # Remove duplicates based on date, home, and away teams
     duplicate_cols = ['date', 'home', 'away']
@@ -631,8 +669,8 @@ Examples:
     parser.add_argument(
         '--max-workers', '-w',
         type=int,
-        default=3,
-        help='Maximum concurrent workers (default: 3)'
+        default=5,
+        help='Maximum concurrent workers (default: 5)'
     )
     
     parser.add_argument(
@@ -695,7 +733,7 @@ Examples:
     # Validate league codes
     invalid_leagues = [code for code in leagues_to_scrape if code not in LEAGUE_TO_COMPETITION]
     if invalid_leagues:
-        logger.error(f"Unsupported league codes: {', '.join(invalid_leagues)}")
+        logger.error("Unsupported league codes: %s", ', '.join(invalid_leagues))
         logger.info("Use --list-supported to see available leagues")
         return 1
     
@@ -703,10 +741,10 @@ Examples:
     output_dir = args.output_dir or create_output_directory()
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    logger.info(f"📁 Output directory: {output_dir}")
-    logger.info(f"🗓️  Season: {args.season}")
+    logger.info("📁 Output directory: %s", output_dir)
+    logger.info("🗓️  Season: %s", args.season)
     if args.source:
-        logger.info(f"📊 Preferred source: {args.source.upper()}")
+        logger.info("📊 Preferred source: %s", args.source.upper())
     
     # Start scraping
     if len(leagues_to_scrape) == 1:
@@ -732,8 +770,8 @@ Examples:
             if all_dfs:
                 combined_df = merge_fixture_dataframes(all_dfs)
                 combined_path = output_dir / "combined_leagues.csv"
-                combined_df.to_csv(combined_path, index=False)
-                logger.info(f"💾 Saved combined data ({len(combined_df)} matches) to {combined_path}")
+                write_fixture_files(combined_df, combined_path)
+                logger.info("💾 Saved combined data (%s matches) to %s", len(combined_df), combined_path)
     
     logger.info("🏁 Scraping completed")
     return 0
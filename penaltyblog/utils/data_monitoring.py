@@ -7,6 +7,7 @@ changes in external data sources over time.
 
 import json
 import logging
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -15,6 +16,14 @@ import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Results of the `check_data_freshness` convenience function, keyed by
+# (cache_dir, source, competition, season, max_age_hours) plus the scraper
+# cache dir and the mtimes of the metadata and cached fixtures files, so
+# writes from other monitors, processes or the scraper cache start afresh
+FRESHNESS_TTL_SECONDS = 60
+FRESHNESS_CACHE_SIZE = 256
+_freshness_cache: Dict[tuple, tuple] = {}
+
 
 class DataFreshnessMonitor:
     """
@@ -116,9 +125,16 @@ class DataFreshnessMonitor:
         Dict[str, Any]
             Freshness status and metadata
         """
+        # Imported here so that loading the utils doesn't import every scraper
+        from ..scrapers._cache import cache_mtime
+
         key = f"{source}_{competition}_{season}".replace(" ", "_").lower()
 
-        if key not in self.metadata:
+        # Fixtures cached on disk by the scrapers count as a fetch too, so the
+        # freshness check and the scraper cache agree on the data's age
+        cached_at = cache_mtime(source, competition, season)
+
+        if key not in self.metadata and cached_at is None:
             return {
                 "is_fresh": False,
                 "status": "never_fetched",
@@ -127,8 +143,13 @@ class DataFreshnessMonitor:
                 "recommendation": "fetch_data",
             }
 
-        meta = self.metadata[key]
-        last_fetched = datetime.fromisoformat(meta["last_fetched"])
+        meta = self.metadata.get(key, {})
+        fetch_times = (
+            [datetime.fromtimestamp(cached_at)] if cached_at is not None else []
+        )
+        if "last_fetched" in meta:
+            fetch_times.append(datetime.fromisoformat(meta["last_fetched"]))
+        last_fetched = max(fetch_times)
         age = datetime.now() - last_fetched
         age_hours = age.total_seconds() / 3600
 
@@ -624,9 +645,50 @@ def check_data_freshness(
     -------
     Dict[str, Any]
         Freshness status
+
+    Notes
+    -----
+    Results are memoized for `FRESHNESS_TTL_SECONDS` so repeated status checks
+    skip parsing the metadata file. The memo key includes the modification
+    times of the metadata file and the scraper cache, so a recorded fetch or
+    a new scraper cache file is picked up straight away.
     """
+    from ..scrapers._cache import cache_mtime, get_cache_dir
+
+    metadata_file = Path(cache_dir) / "data_metadata.json"
+    try:
+        metadata_mtime = metadata_file.stat().st_mtime_ns
+    except OSError:
+        metadata_mtime = None
+    key = (
+        str(Path(cache_dir)),
+        source,
+        competition,
+        season,
+        max_age_hours,
+        str(get_cache_dir()),
+        metadata_mtime,
+        cache_mtime(source, competition, season),
+    )
+    now = time.monotonic()
+
+    cached = _freshness_cache.get(key)
+    if cached is not None and now - cached[0] < FRESHNESS_TTL_SECONDS:
+        return dict(cached[1])
+
     monitor = DataFreshnessMonitor(cache_dir=cache_dir)
-    return monitor.check_data_freshness(source, competition, season, max_age_hours)
+    result = monitor.check_data_freshness(source, competition, season, max_age_hours)
+
+    if len(_freshness_cache) >= FRESHNESS_CACHE_SIZE:
+        _freshness_cache.clear()
+    _freshness_cache[key] = (now, result)
+
+    return dict(result)
+
+
+def clear_freshness_cache():
+    """Forget all memoized `check_data_freshness` results"""
+    _freshness_cache.clear()
 
 
 def record_data_fetch(
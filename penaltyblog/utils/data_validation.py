@@ -11,6 +11,7 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 import pandas as pd
+from pandas.api.types import union_categoricals
 
 logger = logging.getLogger(__name__)
 
@@ -133,16 +134,17 @@ class DataQualityValidator:
             if col not in df.columns:
                 continue
 
-            # Check for empty team names
-            empty_teams = df[col].isna() | (df[col] == "") | (df[col].str.strip() == "")
+            # Check for empty team names (strip() also catches "")
+            empty_teams = df[col].isna() | df[col].str.strip().eq("")
             if empty_teams.any():
                 count = empty_teams.sum()
                 self._add_error(f"Found {count} empty team names in {col}")
 
-            # Check for suspicious team names
+            # Check for suspicious team names, lower-casing the column once
             suspicious_patterns = ["test", "unknown", "tbd", "null", "nan"]
+            lowered = df[col].str.lower()
             for pattern in suspicious_patterns:
-                suspicious = df[col].str.lower().str.contains(pattern, na=False)
+                suspicious = lowered.str.contains(pattern, regex=False, na=False)
                 if suspicious.any():
                     teams = df.loc[suspicious, col].unique()
                     self._add_warning(f"Suspicious team names in {col}: {teams}")
@@ -169,7 +171,6 @@ class DataQualityValidator:
                 continue
 
             # Convert to numeric and check for conversion issues
-            len(df)
             numeric_goals = pd.to_numeric(df[col], errors="coerce")
             conversion_failures = numeric_goals.isna() & df[col].notna()
 
@@ -213,6 +214,8 @@ class DataQualityValidator:
             self._add_warning(f"Found {count} missing dates")
 
         valid_dates = df[date_col].dropna()
+        if not pd.api.types.is_datetime64_any_dtype(valid_dates):
+            valid_dates = pd.to_datetime(valid_dates, errors="coerce").dropna()
         if valid_dates.empty:
             return
 
@@ -226,13 +229,13 @@ class DataQualityValidator:
         )
 
         # CRITICAL: Check for completed results in future dates
-        current_date = datetime.now().date()
-        future_dates = valid_dates > datetime.now()
+        now = datetime.now()
+        future_dates = valid_dates > now
         
         if future_dates.any():
             # Check if these future dates have completed results
             if 'goals_home' in df.columns and 'goals_away' in df.columns:
-                future_rows = df[future_dates]
+                future_rows = df.loc[valid_dates.index[future_dates]]
                 completed_future = (future_rows['goals_home'].notna()) & (future_rows['goals_away'].notna())
                 
                 if completed_future.any():
@@ -240,9 +243,11 @@ class DataQualityValidator:
                     self._add_error(f"CRITICAL: Found {count} completed results for future dates - indicates FAKE/DEMO data")
                     
                     # Log examples for debugging
-                    examples = future_rows[completed_future][['date', 'goals_home', 'goals_away']].head(3)
-                    for _, row in examples.iterrows():
-                        self._add_error(f"  Future completed result: {row['date']} - {row['goals_home']}-{row['goals_away']}")
+                    examples = future_rows.loc[completed_future].head(3)
+                    for date, goals_home, goals_away in zip(
+                        examples['date'], examples['goals_home'], examples['goals_away']
+                    ):
+                        self._add_error(f"  Future completed result: {date} - {goals_home}-{goals_away}")
                 else:
                     # Future dates without results are OK (upcoming fixtures)
                     count = future_dates.sum()
@@ -252,7 +257,7 @@ class DataQualityValidator:
                 self._add_warning(f"Found {count} future dates")
 
         # Check for very old dates
-        old_threshold = datetime.now() - timedelta(days=365 * 20)  # 20 years
+        old_threshold = now - timedelta(days=365 * 20)  # 20 years
         old_dates = valid_dates < old_threshold
         if old_dates.any():
             count = old_dates.sum()
@@ -302,15 +307,15 @@ class DataQualityValidator:
 
         # Check for reverse fixtures on same date
         if "date" in df.columns:
-            df_reversed = df.copy()
-            df_reversed["team_home"], df_reversed["team_away"] = (
-                df["team_away"],
-                df["team_home"],
+            # Only the key columns are needed, so don't copy the whole frame
+            keys = df[["team_home", "team_away", "date"]]
+            keys_reversed = keys.rename(
+                columns={"team_home": "team_away", "team_away": "team_home"}
             )
 
             # Find matches where teams play each other twice on same date
-            merged = df.merge(
-                df_reversed, on=["team_home", "team_away", "date"], how="inner"
+            merged = keys.merge(
+                keys_reversed, on=["team_home", "team_away", "date"], how="inner"
             )
             if not merged.empty:
                 count = len(merged)
@@ -514,8 +519,21 @@ class DataQualityValidator:
             merge_cols.append("date")
 
         try:
-            merged = source1.merge(
-                source2, on=merge_cols, how="inner", suffixes=("_s1", "_s2")
+            # Only the keys and goals take part in the comparison; team names
+            # share one set of categories so the join runs on integer codes
+            goal_cols = ["goals_home", "goals_away"]
+            left = source1[merge_cols + goal_cols].copy()
+            right = source2[merge_cols + goal_cols].copy()
+            for col in ["team_home", "team_away"]:
+                categories = union_categoricals(
+                    [left[col].astype("category"), right[col].astype("category")],
+                    ignore_order=True,
+                ).categories
+                left[col] = pd.Categorical(left[col], categories=categories)
+                right[col] = pd.Categorical(right[col], categories=categories)
+
+            merged = left.merge(
+                right, on=merge_cols, how="inner", suffixes=("_s1", "_s2")
             )
 
             if merged.empty:
@@ -531,9 +549,10 @@ class DataQualityValidator:
                 merged["goals_away_s1"] != merged["goals_away_s2"]
             )
 
-            if goal_mismatches.any():
-                count = goal_mismatches.sum()
-                mismatch_rate = count / len(merged)
+            count = int(goal_mismatches.sum())
+            mismatch_rate = count / len(merged)
+
+            if count:
                 self._add_warning(
                     f"Goal mismatches between sources: {count}/{len(merged)} "
                     f"({mismatch_rate:.1%})"
@@ -541,10 +560,8 @@ class DataQualityValidator:
 
             self.validation_report["cross_validation"] = {
                 "common_matches": len(merged),
-                "goal_mismatches": goal_mismatches.sum(),
-                "mismatch_rate": (
-                    goal_mismatches.sum() / len(merged) if len(merged) > 0 else 0
-                ),
+                "goal_mismatches": count,
+                "mismatch_rate": mismatch_rate,
             }
 
         except Exception as e:
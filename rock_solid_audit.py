@@ -8,18 +8,22 @@ This should always pass 100%.
 """
 
 import sys
-import yaml
 import requests
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from requests.adapters import HTTPAdapter
 from urllib3.exceptions import InsecureRequestWarning
 import warnings
 
+from audit_utils import load_leagues_yaml
+
 warnings.filterwarnings('ignore', category=InsecureRequestWarning)
 
 TIMEOUT = 10
 MAX_RETRIES = 2
+MAX_WORKERS = 16
 
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
@@ -27,11 +31,24 @@ HEADERS = {
     'Connection': 'keep-alive'
 }
 
+def _create_session():
+    """Create a pooled session shared by all probe threads."""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+SESSION = _create_session()
+
 def test_endpoint(url):
     """Test a single endpoint."""
+    if not url:
+        return False, "No URL"
     for attempt in range(MAX_RETRIES):
         try:
-            response = requests.get(url, headers=HEADERS, timeout=TIMEOUT, verify=False)
+            response = SESSION.get(url, timeout=TIMEOUT, verify=False)
             if response.status_code == 200:
                 return True, f"OK ({response.status_code})"
             else:
@@ -53,8 +70,7 @@ def main():
     
     # Load configuration
     config_path = Path('penaltyblog/config/leagues.yaml')
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_leagues_yaml(config_path)
     
     leagues = config.get('leagues', config)
     enabled_leagues = {k: v for k, v in leagues.items() 
@@ -62,25 +78,24 @@ def main():
     
     print(f"📋 Testing {len(enabled_leagues)} enabled leagues")
     
+    # Probe every league concurrently, then report in config order
+    urls = [conf.get('url') or conf.get('url_template') for conf in enabled_leagues.values()]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(test_endpoint, urls))
+    
     passed = 0
     failed = 0
     
-    for i, (code, conf) in enumerate(enabled_leagues.items(), 1):
-        url = conf.get('url') or conf.get('url_template')
+    for i, ((code, conf), (success, message)) in enumerate(zip(enabled_leagues.items(), results), 1):
         name = conf.get('name', 'Unknown')
         
         print(f"[{i:2d}/{len(enabled_leagues)}] {code} ({name})...", end=' ')
         
-        if url:
-            success, message = test_endpoint(url)
-            if success:
-                print(f"✅ {message}")
-                passed += 1
-            else:
-                print(f"❌ {message}")
-                failed += 1
+        if success:
+            print(f"✅ {message}")
+            passed += 1
         else:
-            print("❌ No URL")
+            print(f"❌ {message}")
             failed += 1
     
     print("\n" + "=" * 40)
@@ -42,6 +42,19 @@ for pyx_path in rps_pyx:
         )
     )
 
+# Process .pyx files in penaltyblog/ratings
+ratings_pyx = find_pyx_files("penaltyblog", "ratings")
+for pyx_path in ratings_pyx:
+    module_name = os.path.splitext(pyx_path.replace(os.sep, "."))[0]
+    extensions.append(
+        Extension(
+            module_name,
+            [pyx_path],
+            include_dirs=[np.get_include()],
+            extra_compile_args=["-O3"],
+        )
+    )
+
 setup(
     name="penaltyblog",
     version="1.1.0",
@@ -1,6 +1,13 @@
 import pytest
 
 import penaltyblog as pb
+from penaltyblog.utils.data_monitoring import clear_freshness_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_scraper_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("PENALTYBLOG_CACHE_DIR", str(tmp_path / "scraper_cache"))
+    clear_freshness_cache()
 
 
 @pytest.fixture()
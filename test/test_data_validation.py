@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 import penaltyblog as pb
 from penaltyblog.utils.data_validation import DataQualityValidator, DataValidationError
 from penaltyblog.utils.data_monitoring import DataFreshnessMonitor, hash_dataframe
+from penaltyblog.scrapers._cache import cache_path, cached_dataframe
 
 
 class TestDataQualityValidator:
@@ -129,6 +130,25 @@ class TestDataQualityValidator:
         assert len(report["warnings"]) > 0
         assert any("future dates" in warning for warning in report["warnings"])
 
+    def test_future_completed_results_with_string_dates(self):
+        """Test that unparsed date strings are still checked for future results."""
+        future_date = (datetime.now() + timedelta(days=365)).strftime("%Y-%m-%d")
+        df = pd.DataFrame(
+            {
+                "team_home": ["Arsenal", "Chelsea"],
+                "team_away": ["Man City", "Tottenham"],
+                "goals_home": [2, 1],
+                "goals_away": [1, 1],
+                "date": ["2023-01-01", future_date],
+            }
+        )
+
+        validator = DataQualityValidator(strict_mode=False)
+        report = validator.validate_fixtures_data(df)
+
+        assert any("completed results for future dates" in e for e in report["errors"])
+        assert any(future_date in e for e in report["errors"])
+
     def test_cross_validate_sources(self):
         """Test cross-validation between two data sources."""
         source1 = pd.DataFrame(
@@ -160,6 +180,32 @@ class TestDataQualityValidator:
         assert report["cross_validation"]["goal_mismatches"] == 1
         assert report["cross_validation"]["mismatch_rate"] == 0.5
 
+    def test_cross_validate_sources_differing_team_sets(self):
+        """Test cross-validation when each source has teams the other lacks."""
+        source1 = pd.DataFrame(
+            {
+                "team_home": ["Arsenal", "Chelsea", "Everton"],
+                "team_away": ["Man City", "Tottenham", "Fulham"],
+                "goals_home": [2, 1, 0],
+                "goals_away": [1, 1, 0],
+            }
+        )
+        source2 = pd.DataFrame(
+            {
+                "team_home": pd.Categorical(["Chelsea", "Arsenal", "Brentford"]),
+                "team_away": ["Tottenham", "Man City", "Wolves"],
+                "goals_home": [1, 2, 3],
+                "goals_away": [2, 1, 0],
+            }
+        )
+
+        validator = DataQualityValidator(strict_mode=False)
+        report = validator.cross_validate_sources(source1, source2)
+
+        assert report["cross_validation"]["common_matches"] == 2
+        assert report["cross_validation"]["goal_mismatches"] == 1
+        assert not isinstance(source1["team_home"].dtype, pd.CategoricalDtype)
+
     def test_strict_mode(self):
         """Test that strict mode raises exceptions for warnings."""
         df = pd.DataFrame(
@@ -235,6 +281,18 @@ class TestDataFreshnessMonitor:
         assert freshness["status"] == "never_fetched"
         assert freshness["recommendation"] == "fetch_data"
 
+    def test_freshness_uses_scraper_cache(self, tmp_path):
+        """Test that fixtures cached by the scrapers count as fresh data."""
+        monitor = DataFreshnessMonitor(cache_dir=str(tmp_path))
+        path = cache_path("fbref", "Premier League", "2022-2023")
+        path.parent.mkdir(parents=True)
+        pd.DataFrame({"team_home": ["Arsenal"]}).to_pickle(path)
+
+        freshness = monitor.check_data_freshness("fbref", "Premier League", "2022-2023")
+
+        assert freshness["is_fresh"] is True
+        assert freshness["status"] == "fresh"
+
     def test_data_change_detection(self, tmp_path):
         """Test detection of data changes."""
         monitor = DataFreshnessMonitor(cache_dir=str(tmp_path))
@@ -381,6 +439,54 @@ class TestConvenienceFunctions:
         assert result["is_fresh"] is True
         mock_instance.check_data_freshness.assert_called_once()
 
+    def test_check_data_freshness_is_memoized(self, tmp_path):
+        """Test that repeated freshness checks reuse the result until a fetch."""
+        cache_dir = str(tmp_path)
+        args = ("fbref", "Premier League", "2022-2023")
+
+        with patch(
+            "penaltyblog.utils.data_monitoring.DataFreshnessMonitor",
+            wraps=DataFreshnessMonitor,
+        ) as monitor_cls:
+            first = pb.check_data_freshness(*args, cache_dir=cache_dir)
+            second = pb.check_data_freshness(*args, cache_dir=cache_dir)
+
+            assert first["status"] == second["status"] == "never_fetched"
+            assert monitor_cls.call_count == 1
+
+            pb.record_data_fetch(*args, cache_dir=cache_dir)
+            third = pb.check_data_freshness(*args, cache_dir=cache_dir)
+
+        assert third["status"] == "fresh"
+
+    def test_monitor_fetch_invalidates_memoized_freshness(self, tmp_path):
+        """Test that fetches recorded through a monitor are seen immediately."""
+        cache_dir = str(tmp_path)
+        args = ("fbref", "Premier League", "2022-2023")
+
+        assert (
+            pb.check_data_freshness(*args, cache_dir=cache_dir)["status"]
+            == "never_fetched"
+        )
+        DataFreshnessMonitor(cache_dir=cache_dir).record_data_fetch(*args)
+
+        assert pb.check_data_freshness(*args, cache_dir=cache_dir)["status"] == "fresh"
+
+    def test_scraper_cache_write_invalidates_memoized_freshness(self, tmp_path):
+        """Test that fixtures newly cached by a scraper are seen immediately."""
+        cache_dir = str(tmp_path)
+        args = ("fbref", "Premier League", "2022-2023")
+
+        assert (
+            pb.check_data_freshness(*args, cache_dir=cache_dir)["status"]
+            == "never_fetched"
+        )
+        path = cache_path(*args)
+        path.parent.mkdir(parents=True)
+        pd.DataFrame({"team_home": ["Arsenal"]}).to_pickle(path)
+
+        assert pb.check_data_freshness(*args, cache_dir=cache_dir)["status"] == "fresh"
+
     @patch("penaltyblog.utils.data_monitoring.DataFreshnessMonitor")
     def test_record_data_fetch_convenience(self, mock_monitor):
         """Test the record_data_fetch convenience function."""
@@ -396,3 +502,59 @@ class TestConvenienceFunctions:
         assert args[0] == "fbref"
         assert args[1] == "Premier League"
         assert args[2] == "2022-2023"
+
+
+class TestCachedDataframe:
+    """Test the on-disk scraper cache."""
+
+    class DummyScraper:
+        source = "dummy"
+        competition = "Premier League"
+        season = "2022-2023"
+
+        def __init__(self, team_mappings=None):
+            self.team_mappings = team_mappings
+            self.calls = 0
+
+        @cached_dataframe(ttl_hours=24)
+        def get_fixtures(self):
+            self.calls += 1
+            team = (self.team_mappings or {}).get("Arsenal", "Arsenal")
+            return pd.DataFrame({"team_home": [team], "goals_home": [2]})
+
+    def test_cache_hit_skips_fetch(self):
+        """Test that a warm cache is returned without calling the scraper."""
+        scraper = self.DummyScraper()
+        first = scraper.get_fixtures()
+        second = scraper.get_fixtures()
+
+        assert scraper.calls == 1
+        pd.testing.assert_frame_equal(first, second)
+        assert cache_path("dummy", "Premier League", "2022-2023").exists()
+
+    def test_force_refresh_bypasses_cache(self):
+        """Test that force_refresh refetches and rewrites the cache."""
+        scraper = self.DummyScraper()
+        scraper.get_fixtures()
+        scraper.get_fixtures(force_refresh=True)
+
+        assert scraper.calls == 2
+
+    def test_team_mappings_are_cached_separately(self):
+        """Test that scrapers with different team mappings don't share entries."""
+        mapped = self.DummyScraper(team_mappings={"Arsenal": "Arsenal FC"})
+        unmapped = self.DummyScraper()
+
+        assert mapped.get_fixtures()["team_home"].iloc[0] == "Arsenal FC"
+        assert unmapped.get_fixtures()["team_home"].iloc[0] == "Arsenal"
+        assert unmapped.calls == 1
+
+    def test_cache_disabled_without_cache_dir(self, monkeypatch):
+        """Test that nothing is cached unless PENALTYBLOG_CACHE_DIR is set."""
+        monkeypatch.delenv("PENALTYBLOG_CACHE_DIR")
+        scraper = self.DummyScraper()
+        scraper.get_fixtures()
+        scraper.get_fixtures()
+
+        assert scraper.calls == 2
+        assert cache_path("dummy", "Premier League", "2022-2023") is None
@@ -59,6 +59,37 @@ def test_update_ratings_away_win():
     assert elo.get_team_rating("Team B") > 1500.0
 
 
+def test_update_ratings_returns_new_ratings():
+    elo = Elo()
+    new_home, new_away = elo.update_ratings("Team A", "Team B", 0)
+    assert new_home == elo.get_team_rating("Team A")
+    assert new_away == elo.get_team_rating("Team B")
+
+
+def test_update_ratings_batch_matches_sequential_updates():
+    home = ["Team A", "Team B", "Team C", "Team A"]
+    away = ["Team B", "Team C", "Team A", "Team C"]
+    results = [0, 1, 2, 0]
+
+    sequential = Elo()
+    expected = [
+        sequential.update_ratings(h, a, r) for h, a, r in zip(home, away, results)
+    ]
+
+    batch = Elo()
+    history = batch.update_ratings_batch(home, away, results)
+
+    assert history.shape == (4, 2)
+    assert history.tolist() == [list(pair) for pair in expected]
+    assert batch.ratings == sequential.ratings
+
+
+def test_update_ratings_batch_invalid_result():
+    elo = Elo()
+    with pytest.raises(ValueError, match="Invalid result: must be 0, 1, or 2"):
+        elo.update_ratings_batch(["Team A"], ["Team B"], [3])
+
+
 def test_invalid_result():
     elo = Elo()
     with pytest.raises(ValueError, match="Invalid result: must be 0, 1, or 2"):
@@ -10,6 +10,8 @@ This test file verifies:
 """
 
 import unittest
+import pandas as pd
+import requests
 import sys
 from pathlib import Path
 
@@ -20,7 +22,7 @@ sys.path.insert(0, str(project_root))
 from penaltyblog.scrapers.team_mappings import get_mls_team_mappings
 from penaltyblog.scrapers.mls_official import MLSOfficial
 from penaltyblog.scrapers.common import COMPETITION_MAPPINGS
-from penaltyblog.config.leagues import get_league_by_code
+from penaltyblog.config.leagues import get_league_by_code, load_leagues
 
 
 class TestMLSIntegration(unittest.TestCase):
@@ -82,6 +84,16 @@ class TestMLSIntegration(unittest.TestCase):
         self.assertIn("mlssoccer.com", mls_league.url_template, 
                       "URL template should reference official MLS site")
     
+    def test_league_registry_is_cached(self):
+        """Test that league lookups reuse the parsed registry."""
+        self.assertIs(get_league_by_code("USA_ML"), get_league_by_code("USA_ML"),
+                      "Repeated lookups should not re-parse leagues.yaml")
+
+        leagues = load_leagues()
+        leagues.pop("USA_ML")
+        self.assertIsNotNone(get_league_by_code("USA_ML"),
+                             "Mutating load_leagues() output should not affect the registry")
+    
     def test_mls_scraper_initialization(self):
         """Test that MLS scraper initializes correctly."""
         # Test initialization with default team mappings
@@ -96,9 +108,57 @@ class TestMLSIntegration(unittest.TestCase):
         scraper_custom = MLSOfficial(season="2024", team_mappings=custom_mappings)
         
         # Should create reverse mapping
-        self.assertIn("Test", scraper_custom.team_mappings, 
+        self.assertIn("Test", scraper_custom.team_mappings,
                       "Custom mappings should be processed")
-    
+
+    def test_mls_scraper_shares_connection_pool(self):
+        """Test that scrapers share the pooled adapter but not a session."""
+        first = MLSOfficial(season="2024")
+        second = MLSOfficial(season="2024")
+        self.assertIsNot(first.session, second.session,
+                         "Each scraper should have its own session and cookies")
+        self.assertIs(first.session.get_adapter("https://www.mlssoccer.com"),
+                      second.session.get_adapter("https://www.mlssoccer.com"),
+                      "Scrapers should share one pooled adapter by default")
+
+        session = requests.Session()
+        explicit = MLSOfficial(season="2024", session=session)
+        self.assertIs(explicit.session, session, "Explicit session should be used")
+
+    def test_parse_fixtures_html(self):
+        """Test that fixture elements are extracted from schedule HTML."""
+        html_content = """
+        <html><body>
+          <article class="match card">
+            <span class="team">LA Galaxy</span><span class="team">Inter Miami CF</span>
+            <time class="date" datetime="2024-03-02">Mar 2</time>
+            <div class="score">2 - 1</div>
+          </article>
+          <div class="matchday">Not a fixture</div>
+        </body></html>
+        """
+        fixtures = MLSOfficial(season="2024")._parse_fixtures_html(html_content)
+
+        self.assertEqual(len(fixtures), 1, "Only the match element should be parsed")
+        fixture = fixtures.iloc[0]
+        self.assertEqual(fixture["team_home"], "LA Galaxy")
+        self.assertEqual(fixture["team_away"], "Inter Miami CF")
+        self.assertEqual(fixture["date"], "2024-03-02")
+        self.assertEqual((fixture["goals_home"], fixture["goals_away"]), (2, 1))
+
+    def test_mls_scraper_maps_team_aliases(self):
+        """Test that default MLS aliases map to canonical team names."""
+        scraper = MLSOfficial(season="2024")
+        df = pd.DataFrame({
+            "team_home": ["LA Galaxy", "ATL"],
+            "team_away": ["Inter Miami", "Unknown FC"],
+        })
+        mapped = scraper._map_teams(df, ["team_home", "team_away"])
+
+        self.assertEqual(list(mapped["team_home"]), ["LA Galaxy", "Atlanta United FC"])
+        self.assertEqual(list(mapped["team_away"]), ["Inter Miami CF", "Unknown FC"],
+                         "Unmapped names should be left unchanged")
+
     def test_mls_scraper_competitions(self):
         """Test that MLS scraper reports correct competitions."""
         competitions = MLSOfficial.list_competitions()
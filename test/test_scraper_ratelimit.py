@@ -0,0 +1,55 @@
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from penaltyblog.scrapers import _ratelimit
+from penaltyblog.scrapers.base_scrapers import RequestsScraper
+
+
+def _response(status_code, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+def test_parse_retry_after_seconds_and_date():
+    assert _ratelimit.parse_retry_after("7") == 7.0
+    assert _ratelimit.parse_retry_after(None) is None
+    assert _ratelimit.parse_retry_after("soon") is None
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    delay = _ratelimit.parse_retry_after(format_datetime(retry_at, usegmt=True))
+    assert 25 < delay <= 30
+
+
+def test_server_delay_from_ratelimit_headers():
+    headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "12"}
+    assert _ratelimit.server_delay(headers) == 12.0
+    assert _ratelimit.server_delay({"X-RateLimit-Remaining": "5"}) is None
+
+
+def test_default_host_rates():
+    assert _ratelimit.get_bucket("https://fbref.com/en/comps/").rate == 3.0
+    assert _ratelimit.get_bucket("https://understat.com/league/EPL").rate == 5.0
+    assert (
+        _ratelimit.get_bucket("https://www.football-data.co.uk/mmz4281/").rate == 2.0
+    )
+
+
+def test_429_waits_exactly_retry_after():
+    session = MagicMock()
+    session.get.side_effect = [
+        _response(429, {"Retry-After": "4"}),
+        _response(200),
+    ]
+    scraper = RequestsScraper(session=session)
+
+    with patch(
+        "penaltyblog.scrapers.base_scrapers.pause_host"
+    ) as pause_host, patch.object(_ratelimit.HostBucket, "acquire"):
+        response = scraper._send("https://ratelimit.test/fixtures")
+
+    assert response.status_code == 200
+    assert session.get.call_count == 2
+    pause_host.assert_called_once_with("https://ratelimit.test/fixtures", 4.0)